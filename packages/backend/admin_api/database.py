@@ -1,14 +1,44 @@
 import os
+import logging
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
-from admin_api.models.documents import Admin, User, Job, Applicant, ApplicantJobSeeker, JobSeeker, ReportValidation, FinalReport, Achievement
+from admin_api.utils.metrics import mongo_metrics_listener
+from admin_api.models.documents import Admin, User, Job, Applicant, ApplicantJobSeeker, JobSeeker, ReportValidation, FinalReport, Achievement, NotifierState, LeaderLease, EmailOutbox, StatsDaily
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 MONGO_URI = os.getenv("MONGO_URI")
 MONGO_DB_NAME = os.getenv("MONGO_DB_NAME")
 
-async def init_db():
-    client = AsyncIOMotorClient(MONGO_URI)
-    await init_beanie(database=client[MONGO_DB_NAME], document_models=[Admin, User, Job, Applicant, ApplicantJobSeeker, JobSeeker, ReportValidation, FinalReport, Achievement])
+# Set by init_db; used for sessions/transactions and server introspection
+client: AsyncIOMotorClient | None = None
+_is_replica_set: bool | None = None
+
+DOCUMENT_MODELS = [Admin, User, Job, Applicant, ApplicantJobSeeker, JobSeeker, ReportValidation, FinalReport, Achievement, NotifierState, LeaderLease, EmailOutbox, StatsDaily]
+
+async def init_db(skip_indexes: bool = False):
+    global client
+    # The listener feeds per-collection query latency into /metrics and the slow-query log
+    client = AsyncIOMotorClient(MONGO_URI, event_listeners=[mongo_metrics_listener])
+    # Unless skipped, init_beanie creates every index declared in the models' Settings.indexes.
+    # Existing indexes that are no longer declared are left in place.
+    await init_beanie(
+        database=client[MONGO_DB_NAME],
+        document_models=DOCUMENT_MODELS,
+        allow_index_dropping=False,
+        skip_indexes=skip_indexes
+    )
+    if not skip_indexes:
+        logger.info(f"Database initialised and indexes synced for {len(DOCUMENT_MODELS)} collections.")
+
+
+async def is_replica_set() -> bool:
+    """Change streams and multi-document transactions need a replica set or a sharded cluster."""
+    global _is_replica_set
+    if _is_replica_set is None:
+        hello = await client.admin.command("hello")
+        _is_replica_set = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+    return _is_replica_set
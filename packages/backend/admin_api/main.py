@@ -1,20 +1,53 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 from contextlib import asynccontextmanager
 import asyncio
+import logging
 from admin_api.database import init_db
 from admin_api.routers import crud
 from admin_api.utils.polling_service import start_polling
-from admin_api.routers.crud import broadcast_notification
+from admin_api.utils.change_stream_service import start_change_stream_notifier, supports_change_streams, NOTIFIER_MODE
+from admin_api.services.notification_service import broadcast_notification, broker
+from admin_api.services.email_outbox import run_email_worker
+from admin_api.services.search_service import run_search_indexer
+from admin_api.services.rollup_service import run_rollup_worker
+from admin_api.utils.leader_election import run_as_leader
+from admin_api.utils.pagination import NEXT_CURSOR_HEADER
+from admin_api.utils.metrics import MetricsMiddleware, render_metrics, METRICS_TOKEN
+from admin_api.utils.logging_config import configure_logging
 from fastapi.middleware.cors import CORSMiddleware
 
+configure_logging()
+logger = logging.getLogger(__name__)
+
 
 polling_task = None
+email_worker_task = None
+search_indexer_task = None
+rollup_task = None
+
+async def start_notifier():
+    """Runs the change-stream notifier, or the poller when configured or when Mongo has no replica set."""
+    use_change_streams = NOTIFIER_MODE == "change_stream"
+    if NOTIFIER_MODE == "auto":
+        use_change_streams = await supports_change_streams()
+    if use_change_streams:
+        await start_change_stream_notifier(broadcast_notification)
+    else:
+        await start_polling(broadcast_notification, interval_seconds=10)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global polling_task
+    global polling_task, email_worker_task, search_indexer_task, rollup_task
     await init_db()
-    polling_task = asyncio.create_task(start_polling(broadcast_notification, interval_seconds=10))
+    # Every worker delivers broker frames to its own sockets, but only the lease holder
+    # runs the notifier, so multi-worker deployments do not produce duplicate events.
+    await broker.start()
+    polling_task = asyncio.create_task(run_as_leader("notifier", start_notifier))
+    # Outbox claims are atomic, so every worker can help drain the email queue
+    email_worker_task = asyncio.create_task(run_email_worker())
+    search_indexer_task = asyncio.create_task(run_as_leader("search_indexer", run_search_indexer))
+    rollup_task = asyncio.create_task(run_as_leader("stats_rollup", run_rollup_worker))
     try:
         yield
     finally:
@@ -23,7 +56,15 @@ async def lifespan(app: FastAPI):
             try:
                 await polling_task
             except asyncio.CancelledError:
-                print("Polling task cancelled successfully.")
+                logger.info("Polling task cancelled successfully.")
+        for task in (email_worker_task, search_indexer_task, rollup_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        await broker.stop()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -41,7 +82,19 @@ app.add_middleware(
     allow_credentials=True,  # Important for sending auth token
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # Be specific
     allow_headers=["Authorization", "Content-Type"],  # Allow necessary headers
+    expose_headers=[NEXT_CURSOR_HEADER],  # Lets the browser read the pagination cursor
 )
 
 
+app.add_middleware(MetricsMiddleware)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus scrape endpoint: request and MongoDB command latency histograms."""
+    if METRICS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 app.include_router(crud.router, prefix="/admin", tags=["admin"])
@@ -1,9 +1,24 @@
 from pydantic import BaseModel, EmailStr, Field, validator
-from beanie import Document, Link, PydanticObjectId
+from beanie import Document, Link, PydanticObjectId, before_event, Insert, Replace, Save, SaveChanges
 from beanie.odm.fields import PydanticObjectId
 from datetime import datetime
 import enum
-from typing import List, Optional, Any
+from typing import ClassVar, List, Optional, Any, Tuple
+import pymongo
+from pymongo import IndexModel
+
+from admin_api.utils.search_tokens import build_search_tokens
+
+
+class SearchTokensMixin:
+    """Recomputes searchTokens from `search_token_fields` (stored names) whenever the document is written whole."""
+    search_token_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @before_event(Insert, Replace, Save, SaveChanges)
+    def refresh_search_tokens(self):
+        values = {field.alias or name: getattr(self, name) for name, field in self.__fields__.items()}
+        self.search_tokens = build_search_tokens(values, self.search_token_fields)
+
 
 class Admin(Document):
    full_name: str
@@ -14,6 +29,9 @@ class Admin(Document):
    
    class Settings:
        name = "admins" 
+       indexes = [
+           IndexModel([("email", pymongo.ASCENDING)], unique=True),  # login and token lookups
+       ]
 
 
 class AdminCreate(BaseModel):
@@ -37,12 +55,17 @@ class Achievement(Document):
 
     class Settings:
         name = "achievements"
+        indexes = [
+            IndexModel([("userId", pymongo.ASCENDING)]),
+        ]
 
     class Config:
         populate_by_name = True
 
 
-class User(Document):
+class User(SearchTokensMixin, Document):
+    search_token_fields: ClassVar[Tuple[str, ...]] = ("firstName", "middleName", "lastName", "emailAddress", "barangay")
+    # Never fetched implicitly; use services.user_service.load_achievements or get_user_detail
     achievements: List[Link["Achievement"]] = Field(default_factory=list)
     first_name: str = Field(alias="firstName")
     middle_name: str | None = Field(default=None, alias="middleName")
@@ -65,9 +88,91 @@ class User(Document):
     joined_at: datetime = Field(alias="joinedAt")
     verification_status: str = Field(alias="verificationStatus")
     verified_at: datetime | None = Field(default=None, alias="verifiedAt") # Set when verified
+    search_tokens: List[str] = Field(default_factory=list, alias="searchTokens") # Normalized prefixes, see services.search_service
 
     class Settings:
         name = "users"
+        indexes = [
+            IndexModel([("verifiedAt", pymongo.ASCENDING)]),  # monthly verified-users chart
+            IndexModel([("emailAddress", pymongo.ASCENDING)]),  # applicant -> user lookup on approval
+            IndexModel([("firstName", pymongo.TEXT), ("lastName", pymongo.TEXT), ("emailAddress", pymongo.TEXT), ("barangay", pymongo.TEXT)],
+                       weights={"lastName": 10, "firstName": 10, "emailAddress": 5, "barangay": 1}, name="search_text"),
+            IndexModel([("searchTokens", pymongo.ASCENDING)]),  # type-ahead prefix search
+        ]
+
+
+class UserNameView(BaseModel):
+    """Projection of the name fields of a User, used for batched display-name lookups."""
+    id: PydanticObjectId = Field(alias="_id")
+    first_name: str | None = Field(default=None, alias="firstName")
+    middle_name: str | None = Field(default=None, alias="middleName")
+    last_name: str | None = Field(default=None, alias="lastName")
+    suffix_name: str | None = Field(default=None, alias="suffixName")
+
+    class Config:
+        populate_by_name = True
+
+
+class UserContactView(UserNameView):
+    """Projection of a User's name and email address, used for batched notification emails."""
+    email: str | None = Field(default=None, alias="emailAddress")
+
+
+class UserListView(BaseModel):
+    """Projection of a user for lists and search results: no password or ID images."""
+    id: PydanticObjectId = Field(alias="_id")
+    first_name: str | None = Field(default=None, alias="firstName")
+    middle_name: str | None = Field(default=None, alias="middleName")
+    last_name: str | None = Field(default=None, alias="lastName")
+    suffix_name: str | None = Field(default=None, alias="suffixName")
+    email: str | None = Field(default=None, alias="emailAddress")
+    barangay: str | None = None
+    user_type: str | None = Field(default=None, alias="userType")
+    joined_at: datetime | None = Field(default=None, alias="joinedAt")
+    verification_status: str | None = Field(default=None, alias="verificationStatus")
+
+    class Config:
+        populate_by_name = True
+
+
+class AchievementView(BaseModel):
+    """An Achievement as shown on a user's profile."""
+    id: PydanticObjectId = Field(alias="_id")
+    achievement_name: str = Field(alias="achievementName")
+    description: str | None = None
+    date_achieved: datetime | None = Field(default=None, alias="dateAchieved")
+    job_required: str | None = Field(default=None, alias="jobRequired")
+    required_job_count: int | None = Field(default=None, alias="requiredJobCount")
+
+    class Config:
+        populate_by_name = True
+
+
+class JobSeekerProfileView(BaseModel):
+    """The job seeker profile attached to a user detail."""
+    id: PydanticObjectId = Field(alias="_id")
+    joined_at: datetime | None = Field(default=None, alias="joinedAt")
+    availability: bool = True
+    hourly_rate: str | None = Field(default=None, alias="hourlyRate")
+    credentials: str | None = None
+    rate: float | None = None
+    job_tags: List[str] = Field(default_factory=list, alias="jobTags")
+
+    class Config:
+        populate_by_name = True
+
+
+class UserDetail(UserListView):
+    """A user's profile with their achievements and job seeker profile; no password or ID images."""
+    gender: str | None = None
+    age: int | None = None
+    profile_picture: str | None = Field(default=None, alias="profileImage")
+    street: str | None = None
+    house_number: str | None = Field(default=None, alias="houseNumber")
+    jobs_done: int = Field(default=0, alias="jobsDone")
+    verified_at: datetime | None = Field(default=None, alias="verifiedAt")
+    achievements: List[AchievementView] = Field(default_factory=list)
+    job_seeker: JobSeekerProfileView | None = Field(default=None, alias="jobSeeker")
 
 
 class TotalUsers(BaseModel):
@@ -79,7 +184,8 @@ class JobStatusEnum(str, enum.Enum):
     COMPLETED = "completed"
     REVIEWED = "reviewed" # e.g., after completion, client has reviewed
 
-class Job(Document):
+class Job(SearchTokensMixin, Document):
+    search_token_fields: ClassVar[Tuple[str, ...]] = ("jobTitle", "category", "jobLocation")
     client_id: PydanticObjectId = Field(alias="clientId")
     applicant_count: int = Field(default=0, alias="applicantCount")
 
@@ -101,16 +207,56 @@ class Job(Document):
     job_review: Optional[str] = Field(default=None, alias="jobReview")
     job_seeker_id: Optional[PydanticObjectId] = Field(default=None, alias="jobSeekerId") 
     offer: Optional[str] = Field(default=None) 
+    search_tokens: List[str] = Field(default_factory=list, alias="searchTokens") # Normalized prefixes, see services.search_service
 
     class Settings:
         name = "jobrequest"
+        indexes = [
+            IndexModel([("datePosted", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)]),  # job request list keyset sort, analytics window
+            IndexModel([("completedAt", pymongo.ASCENDING)], sparse=True),  # stats_daily jobs completed, time-to-complete
+            IndexModel([("acceptedAt", pymongo.ASCENDING)], sparse=True),  # time-to-accept analytics
+            IndexModel([("jobSeekerId", pymongo.ASCENDING), ("jobRating", pymongo.ASCENDING)],
+                       partialFilterExpression={"jobRating": {"$type": "number"}}),  # average rating per job seeker
+            IndexModel([("jobTitle", pymongo.TEXT), ("category", pymongo.TEXT), ("jobLocation", pymongo.TEXT), ("jobDescription", pymongo.TEXT)],
+                       weights={"jobTitle": 10, "category": 5, "jobLocation": 3, "jobDescription": 1}, name="search_text"),
+            IndexModel([("searchTokens", pymongo.ASCENDING)]),  # type-ahead prefix search
+        ]
+
+
+# The job request table truncates the description to one line; longer text is cut in the projection
+JOB_DESCRIPTION_PREVIEW_CHARS = 160
+
+
+class JobListView(BaseModel):
+    """Projection of a Job with only the columns shown in the job request table."""
+    id: PydanticObjectId = Field(alias="_id")
+    client_id: PydanticObjectId = Field(alias="clientId")
+    applicant_count: int = Field(default=0, alias="applicantCount")
+    job_title: str = Field(alias="jobTitle")
+    job_description: str = Field(alias="jobDescription")
+    category: str
+    job_location: str = Field(alias="jobLocation")
+    job_status: JobStatusEnum = Field(alias="jobStatus")
+    budget: str
+    date_posted: datetime = Field(alias="datePosted")
+
+    class Settings:
+        projection = {
+            "_id": 1, "clientId": 1, "applicantCount": 1, "jobTitle": 1, "category": 1, "jobLocation": 1,
+            "jobStatus": 1, "budget": 1, "datePosted": 1,
+            "jobDescription": {"$substrCP": ["$jobDescription", 0, JOB_DESCRIPTION_PREVIEW_CHARS]},
+        }
+
+    class Config:
+        populate_by_name = True
 
 
 class TotalJobs(BaseModel):
     total_jobs: int
 
 
-class Applicant(Document):
+class Applicant(SearchTokensMixin, Document):
+    search_token_fields: ClassVar[Tuple[str, ...]] = ("firstName", "middleName", "lastName", "emailAddress", "barangay")
     first_name: str = Field(alias="firstName")
     middle_name: str | None = Field(default=None, alias="middleName")
     last_name: str = Field(alias="lastName")
@@ -133,10 +279,51 @@ class Applicant(Document):
     jobs_done: int = Field(default=0, alias="jobsDone")
     joined_at: datetime = Field(alias="joinedAt")
     verification_status: str = Field(alias="verificationStatus")
+    decision_id: PydanticObjectId | None = Field(default=None, alias="decisionId") # Set with the status by the verification decision that won
+    search_tokens: List[str] = Field(default_factory=list, alias="searchTokens") # Normalized prefixes, see services.search_service
     
 
     class Settings:
         name = "applicants"
+        indexes = [
+            IndexModel([("joinedAt", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)]),  # applicant list keyset sort, monthly applications chart
+            IndexModel([("verificationStatus", pymongo.ASCENDING), ("joinedAt", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)]),  # new-applicant poller keyset
+            IndexModel([("firstName", pymongo.TEXT), ("lastName", pymongo.TEXT), ("emailAddress", pymongo.TEXT), ("barangay", pymongo.TEXT)],
+                       weights={"lastName": 10, "firstName": 10, "emailAddress": 5, "barangay": 1}, name="search_text"),
+            IndexModel([("searchTokens", pymongo.ASCENDING)]),  # type-ahead prefix search
+        ]
+
+
+class ApplicantListView(BaseModel):
+    """Projection of an Applicant for the verification table. Excludes the password hash and ID images."""
+    id: PydanticObjectId = Field(alias="_id")
+    first_name: str = Field(alias="firstName")
+    middle_name: str | None = Field(default=None, alias="middleName")
+    last_name: str = Field(alias="lastName")
+    suffix_name: str | None = Field(default=None, alias="suffixName")
+    gender: str
+    age: int
+    email: EmailStr = Field(alias="emailAddress")
+    barangay: str
+    street: str
+    house_number: str | None = Field(default=None, alias="houseNumber")
+    user_type: str = Field(alias="userType")
+    joined_at: datetime = Field(alias="joinedAt")
+    verification_status: str = Field(alias="verificationStatus")
+
+    class Config:
+        populate_by_name = True
+
+
+class ApplicantNotificationView(BaseModel):
+    """Projection of an Applicant with the fields the new-applicant notification carries."""
+    id: PydanticObjectId = Field(alias="_id")
+    email: str = Field(alias="emailAddress")
+    user_type: str = Field(alias="userType")
+    joined_at: datetime = Field(alias="joinedAt")
+
+    class Config:
+        populate_by_name = True
 
 
 class TotalApplicants(BaseModel):
@@ -147,6 +334,16 @@ class MonthlyData(BaseModel):
     monthly_data: list[int]
 
 
+class DashboardSummary(BaseModel):
+    total_users: int
+    total_jobs: int
+    total_applicants: int
+    pending_applicants: int
+    pending_reports: int
+    monthly_applications: list[int]
+    monthly_users: list[int]
+
+
 class JobTag(str, enum.Enum):
     PLUMBING = "plumbing"
     ELECTRICAL_REPAIRS = "electricalRepairs"
@@ -183,6 +380,9 @@ class ApplicantJobSeeker(Document):
     
     class Settings:
         name = "applicant_jobseeker"
+        indexes = [
+            IndexModel([("applicantId", pymongo.ASCENDING)]),
+        ]
 
 
 class JobSeeker(Document):
@@ -196,6 +396,9 @@ class JobSeeker(Document):
     
     class Settings:
         name = "jobseekers"
+        indexes = [
+            IndexModel([("userId", pymongo.ASCENDING)]),
+        ]
 
 
 class ReportValidation(Document):
@@ -205,9 +408,15 @@ class ReportValidation(Document):
     status: str = Field(default="pending")  # e.g., pending, approved, rejected
     date_reported: datetime = Field(default_factory=datetime.utcnow, alias="dateReported")
     date_approved: Optional[datetime] = Field(default=None, alias="dateApproved")
+    decision_id: Optional[PydanticObjectId] = Field(default=None, alias="decisionId") # Set with the status by the approve/reject that won
 
     class Settings:
         name = "report_validation"
+        indexes = [
+            IndexModel([("status", pymongo.ASCENDING), ("dateReported", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)]),  # pending list and new-report poller keyset
+            IndexModel([("dateReported", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)]),  # all-reports list keyset sort
+            IndexModel([("dateApproved", pymongo.ASCENDING)], sparse=True),  # stats_daily reports approved
+        ]
 
 
 class FinalReport(Document):
@@ -247,4 +456,150 @@ class ReportResponse(BaseModel):
         populate_by_name = True
         json_encoders = {
             datetime: lambda dt: dt.isoformat() if dt else None,
-        }
\ No newline at end of file
+        }
+
+
+class DimensionCount(BaseModel):
+    key: str
+    count: int
+
+
+class DailyMetric(BaseModel):
+    """One day's count of a metric, in total and broken down by the dimensions that apply to it."""
+    total: int = 0
+    # Lists of {key, count} rather than maps, since barangay and category names may contain "." or "$"
+    by_category: List[DimensionCount] = Field(default_factory=list, alias="byCategory")
+    by_barangay: List[DimensionCount] = Field(default_factory=list, alias="byBarangay")
+    by_user_type: List[DimensionCount] = Field(default_factory=list, alias="byUserType")
+
+    class Config:
+        populate_by_name = True
+
+
+class StatsDaily(Document):
+    """Materialized per-day analytics, maintained by services.rollup_service (UTC days)."""
+    day: datetime
+    applicants_joined: DailyMetric = Field(default_factory=DailyMetric, alias="applicantsJoined")
+    users_verified: DailyMetric = Field(default_factory=DailyMetric, alias="usersVerified")
+    jobs_posted: DailyMetric = Field(default_factory=DailyMetric, alias="jobsPosted")
+    jobs_completed: DailyMetric = Field(default_factory=DailyMetric, alias="jobsCompleted")
+    reports_filed: DailyMetric = Field(default_factory=DailyMetric, alias="reportsFiled")
+    reports_approved: DailyMetric = Field(default_factory=DailyMetric, alias="reportsApproved")
+    updated_at: datetime = Field(default_factory=datetime.utcnow, alias="updatedAt")
+
+    class Settings:
+        name = "stats_daily"
+        indexes = [
+            IndexModel([("day", pymongo.ASCENDING)], unique=True),
+        ]
+
+    class Config:
+        populate_by_name = True
+
+
+class JobCounts(BaseModel):
+    total: int
+    by_status: List[DimensionCount]
+    by_category: List[DimensionCount]
+    by_location: List[DimensionCount]
+
+
+class DurationStats(BaseModel):
+    """Hours between two job timestamps over the jobs that have both."""
+    count: int
+    avg_hours: Optional[float] = None
+    p50_hours: Optional[float] = None
+    p90_hours: Optional[float] = None
+    p99_hours: Optional[float] = None
+
+
+class JobDurations(BaseModel):
+    time_to_accept: DurationStats
+    time_to_complete: DurationStats
+
+
+class SeekerRating(BaseModel):
+    job_seeker_id: str
+    name: Optional[str] = None
+    average_rating: float
+    rated_jobs: int
+
+
+class NotifierState(Document):
+    """Persisted position of a notifier, e.g. the last change-stream resume token per watched collection."""
+    name: str
+    resume_token: dict | None = Field(default=None, alias="resumeToken")
+    updated_at: datetime = Field(default_factory=datetime.utcnow, alias="updatedAt")
+
+    class Settings:
+        name = "notifier_state"
+        indexes = [
+            IndexModel([("name", pymongo.ASCENDING)], unique=True),
+        ]
+
+    class Config:
+        populate_by_name = True
+
+
+class LeaderLease(Document):
+    """Time-limited lease naming the worker that runs a singleton background task."""
+    name: str
+    holder: str
+    expires_at: datetime = Field(alias="expiresAt")
+
+    class Settings:
+        name = "leader_leases"
+        indexes = [
+            IndexModel([("name", pymongo.ASCENDING)], unique=True),
+        ]
+
+    class Config:
+        populate_by_name = True
+
+
+class EmailOutbox(Document):
+    """An outbound email waiting for (or done with) delivery by the email worker."""
+    idempotency_key: str = Field(alias="idempotencyKey")
+    subject: str
+    recipients: List[str]
+    body: str
+    status: str = Field(default="pending")  # pending, sending, sent, failed
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow, alias="nextAttemptAt")
+    locked_until: Optional[datetime] = Field(default=None, alias="lockedUntil")
+    last_error: Optional[str] = Field(default=None, alias="lastError")
+    created_at: datetime = Field(default_factory=datetime.utcnow, alias="createdAt")
+    sent_at: Optional[datetime] = Field(default=None, alias="sentAt")
+    expire_at: Optional[datetime] = Field(default=None, alias="expireAt") # Set once sent or failed; the TTL index removes the row then
+
+    class Settings:
+        name = "email_outbox"
+        indexes = [
+            IndexModel([("idempotencyKey", pymongo.ASCENDING)], unique=True),
+            IndexModel([("status", pymongo.ASCENDING), ("nextAttemptAt", pymongo.ASCENDING)]),  # worker claim query
+            IndexModel([("expireAt", pymongo.ASCENDING)], expireAfterSeconds=0),  # retention of finished messages
+        ]
+
+    class Config:
+        populate_by_name = True
+
+
+class BulkIdsRequest(BaseModel):
+    ids: List[str]
+
+
+class BulkVerificationRequest(BaseModel):
+    ids: List[str]
+    status: str  # "verified" or "rejected"
+
+
+class BulkItemResult(BaseModel):
+    id: str
+    success: bool
+    message: str
+
+
+class BulkActionResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
@@ -1,50 +1,33 @@
-from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect, Query, BackgroundTasks
-from ..models.documents import User, Applicant, Admin, AdminCreate, LoginRequest, TotalUsers, Job, TotalJobs, TotalApplicants, ApplicantJobSeeker, JobSeeker, MonthlyData, ReportValidation, FinalReport, Achievement, ReportResponse
-from admin_api.utils.security import get_password_hash, verify_password, create_access_token, create_refresh_token, get_current_active_admin
+from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect, Query, Request
+from fastapi.responses import StreamingResponse
+from ..models.documents import User, Applicant, Admin, AdminCreate, LoginRequest, TotalUsers, Job, TotalJobs, TotalApplicants, ApplicantJobSeeker, JobSeeker, MonthlyData, ReportValidation, FinalReport, Achievement, ReportResponse, ApplicantListView, JobListView, JobCounts, JobDurations, SeekerRating, UserDetail, AchievementView, DashboardSummary, BulkIdsRequest, BulkVerificationRequest, BulkItemResult, BulkActionResponse
+from admin_api.utils.security import get_password_hash_async, verify_password_async, create_access_token, create_refresh_token, get_current_active_admin, invalidate_admin_cache
+from admin_api.utils.pagination import paginate, page_response, DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
+from admin_api.utils.json_encoding import FastJSONResponse
+from admin_api.utils.rate_limit import check_login_allowed, record_login_failure, record_login_success
+from admin_api.utils.cache import dashboard_cache, invalidate_dashboard_cache, conditional_response
 from datetime import datetime, timedelta
 from beanie import PydanticObjectId
+from beanie.operators import In
 from typing import List, Dict, Any, Optional
 import logging
-import json
-from ..services.email_service import send_email_async, get_verification_email_body, get_report_email_body, get_notification_for_reported_user_body
+import os
+from ..services.email_outbox import enqueue_email, enqueue_emails, get_outbox_metrics
+from ..services.email_service import render_emails, VERIFICATION_TEMPLATE, get_verification_email_body, get_report_email_body, get_notification_for_reported_user_body
+from ..services.report_service import hydrate_reports, decide_reports, load_user_contacts
+from ..services.stats_service import get_monthly_metric, get_dashboard_summary
+from ..services.rollup_service import schedule_refresh_today, get_daily_stats, STATS_DAILY_MAX_DAYS
+from ..services.index_service import get_index_report, explain_hot_queries
+from ..services.notification_service import manager, broadcast_notification, batch_notification
+from ..services.approval_service import approve_applicant, approve_applicants, set_applicants_status
+from ..services.search_service import SEARCH_MODES, search
+from ..services.export_service import EXPORT_FORMATS, get_export_spec, select_fields, build_export_filter, stream_export
+from ..services.user_service import USER_DETAIL_INCLUDES, load_achievements, get_user_detail
+from ..services.job_analytics_service import JOB_ANALYTICS_TOP_N, JOB_ANALYTICS_DEFAULT_DAYS, get_job_counts, get_job_durations, get_seeker_ratings
+from admin_api.database import DOCUMENT_MODELS
 
-# Configure basic logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"New WebSocket connection: {websocket.client}. Total connections: {len(self.active_connections)}")
-
-    def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.info(f"WebSocket disconnected: {websocket.client}. Total connections: {len(self.active_connections)}")
-
-    async def broadcast(self, message: str):
-        disconnected_sockets = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to {connection.client}: {e}. Marking for disconnect.")
-                disconnected_sockets.append(connection)
-        
-        for ws in disconnected_sockets:
-            self.disconnect(ws)
-
-manager = ConnectionManager()
-
-async def broadcast_notification(type: str, message: str, details: Dict[str, Any] = None):
-    payload = {"type": type, "message": message, "details": details or {}}
-    logger.info(f"Broadcasting notification: {payload}")
-    await manager.broadcast(json.dumps(payload))
-
 async def get_admin_from_query_token(token: str = Query(None)):
     if not token:
         # Allow anonymous access for now if no token, or raise WebSocketDisconnect
@@ -69,22 +52,29 @@ router = APIRouter(
 
 @router.post("/create", response_model=Admin)
 async def create_admin(admin_data: AdminCreate):
-    hashed_password = get_password_hash(admin_data.password)
+    hashed_password = await get_password_hash_async(admin_data.password)
     admin_doc = Admin(
         full_name=admin_data.full_name,
         email=admin_data.email,
         password=hashed_password
     )
     await admin_doc.insert()
+    invalidate_admin_cache(admin_doc.email)
     return admin_doc
 
 @router.post("/login")
-async def login(login_data: LoginRequest):
+async def login(login_data: LoginRequest, request: Request):
+    client_ip = request.client.host if request.client else "unknown"
+    check_login_allowed(login_data.email, client_ip)
+
     admin = await Admin.find_one(Admin.email == login_data.email)
     if not admin:
+        record_login_failure(login_data.email)
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    if not verify_password(login_data.password, admin.password):
+    if not await verify_password_async(login_data.password, admin.password):
+        record_login_failure(login_data.email)
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    record_login_success(login_data.email)
     
     access_token_data = {"sub": admin.email} 
     access_token = create_access_token(data=access_token_data)
@@ -96,28 +86,40 @@ async def login(login_data: LoginRequest):
 
 
 @router.get("/get_total_users", response_model=TotalUsers)
-async def get_total_users():
-    total_users = await User.count()
-    return {"total_users": total_users}
+async def get_total_users(request: Request):
+    total_users = await dashboard_cache.get_or_set("users:total", User.count)
+    return conditional_response(request, {"total_users": total_users})
 
 
 @router.get("/get_total_jobs", response_model=TotalJobs)
-async def get_total_jobs():
-    total_jobs = await Job.count()
-    return {"total_jobs": total_jobs}
+async def get_total_jobs(request: Request):
+    total_jobs = await dashboard_cache.get_or_set("jobs:total", Job.count)
+    return conditional_response(request, {"total_jobs": total_jobs})
 
 
 @router.get("/get_total_applicants", response_model=TotalApplicants)
-async def get_total_applicants():
-    total_applicants = await Applicant.count()
-    return {"total_applicants": total_applicants}
+async def get_total_applicants(request: Request):
+    total_applicants = await dashboard_cache.get_or_set("applicants:total", Applicant.count)
+    return conditional_response(request, {"total_applicants": total_applicants})
 
 
-@router.get("/get_all_applicants")
-async def get_all_applicants():
-    all_applicants = await Applicant.find_all().to_list()
-    print(all_applicants)
-    return all_applicants
+# Sortable fields for the list endpoints: stored field name -> attribute on the projection model
+APPLICANT_SORT_FIELDS = {"_id": "id", "joinedAt": "joined_at", "lastName": "last_name", "verificationStatus": "verification_status"}
+REPORT_SORT_FIELDS = {"_id": "id", "dateReported": "date_reported"}
+JOB_SORT_FIELDS = {"_id": "id", "datePosted": "date_posted", "jobStatus": "job_status", "category": "category"}
+
+# Most ids a single bulk request may carry
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 100))
+
+
+@router.get("/get_all_applicants", response_model=List[ApplicantListView], response_class=FastJSONResponse)
+async def get_all_applicants(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None, description=f"Value of the {NEXT_CURSOR_HEADER} header from the previous page"),
+    sort: str = Query("-joinedAt", description=f"One of {', '.join(APPLICANT_SORT_FIELDS)}; prefix with '-' for descending")
+):
+    applicants, next_cursor = await paginate(Applicant, {}, APPLICANT_SORT_FIELDS, sort, cursor, limit, ApplicantListView)
+    return page_response(applicants, next_cursor)
 
 
 @router.get("/get_applicant/{applicant_id}")
@@ -128,12 +130,12 @@ async def get_applicant(applicant_id: str):
             raise HTTPException(status_code=404, detail="Applicant not found")
         return applicant
     except Exception as e:
-        print(f"Error fetching applicant {applicant_id}: {str(e)}")
+        logger.error(f"Error fetching applicant {applicant_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error fetching applicant: {str(e)}")
 
 
 @router.put("/update_verification_status/{applicant_id}")
-async def update_verification_status(applicant_id: str, status: str, background_tasks: BackgroundTasks):
+async def update_verification_status(applicant_id: str, status: str):
     applicant = await Applicant.get(applicant_id)
     if not applicant:
         raise HTTPException(status_code=404, detail="Applicant not found")
@@ -142,14 +144,31 @@ async def update_verification_status(applicant_id: str, status: str, background_
         raise HTTPException(status_code=400, detail="Invalid status value")
     
     previous_status = applicant.verification_status # Store previous status
-    applicant.verification_status = status
-    await applicant.save()
+    approval = None
+    changed = False
+    if status == "verified" and previous_status != "verified":
+        # Applicant, User, Achievement and JobSeeker writes happen together in one transaction
+        approval = await approve_applicant(applicant)
+        if approval is None:
+            raise HTTPException(status_code=400, detail="Applicant already verified")
+    elif status != "verified":
+        # Guarded on the stored status, so of two concurrent rejections only one notifies;
+        # each decision gets its own id, so its email is not mistaken for an earlier decision's
+        decision_id, won = await set_applicants_status([applicant.id], status)
+        changed = applicant.id in won
+        if changed:
+            applicant.verification_status = status
+            applicant.decision_id = decision_id
+    # Approval creates or re-verifies a user; either way the dashboard counters change
+    invalidate_dashboard_cache("applicants", "users")
+    if approval is not None:
+        schedule_refresh_today("usersVerified")
     
     applicant_name = f"{applicant.first_name} {applicant.last_name if applicant.last_name else ''}".strip()
     email_subject = ""
     email_body = ""
 
-    if status == "rejected" and previous_status != "rejected":
+    if status == "rejected" and changed:
         await broadcast_notification(
             type="verification_rejected", 
             message=f"Applicant {applicant.email} has been rejected.", 
@@ -157,101 +176,19 @@ async def update_verification_status(applicant_id: str, status: str, background_
         )
         email_subject = "Update on Your Trabahanap Application"
         email_body = get_verification_email_body(name=applicant_name, status="rejected")
-        background_tasks.add_task(send_email_async, email_subject, [applicant.email], email_body)
+        await enqueue_email(email_subject, [applicant.email], email_body, idempotency_key=f"verification:{applicant.id}:rejected:{applicant.decision_id}")
         return {"status": "success", "message": f"Applicant verification rejected"}
     
-    if status == "verified" and previous_status != "verified":
-        # Check if user already exists
-        user = await User.find_one(User.email == applicant.email)
-        if not user:
-            # Create the "Created First Account" achievement
-            # 1. Create the User document first
-            user = User(
-                first_name=applicant.first_name,
-                middle_name=applicant.middle_name,
-                last_name=applicant.last_name,
-                suffix_name=applicant.suffix_name,
-                gender=applicant.gender,
-                birth_date=applicant.birth_date,
-                age=applicant.age,
-                email=applicant.email,
-                password=applicant.password,
-                profile_picture=applicant.profile_picture,
-                barangay=applicant.barangay,
-                street=applicant.street,
-                house_number=applicant.house_number,
-                user_type=applicant.user_type,
-                id_validation_front_image=applicant.id_validation_front_image,
-                id_validation_back_image=applicant.id_validation_back_image,
-                id_type=applicant.id_type,
-                jobs_done=0,
-                joined_at=datetime.now(),
-                verification_status="verified",
-                verified_at=datetime.now(),
-                achievements=[] # Initialize with empty list
-            )
-            await user.insert()
-
-            # 2. Create the Achievement document, linking it to the new user
-            first_account_achievement = Achievement(
-                achievementName="Created First Account",
-                description="Successfully created your first account",
-                date_achieved=datetime.now(),
-                job_required="None",
-                required_job_count=0,
-                user_id=user.id  # Link to the user
-            )
-            await first_account_achievement.insert()
-
-            # 3. Update the User document with the Link to the new achievement
-            user.achievements.append(first_account_achievement) # Beanie handles Link conversion
-            await user.save()
-            
-            # NOTE: Further logic for specific user_types (e.g., job-seeker)
-            # from MEMORY[9249b8ce-6e7a-4441-be4c-d4404feecf53] should be preserved
-            # if it exists after this block. This change focuses on User creation.
-
-        else: # User already exists
-            user.verification_status = "verified"
-            user.verified_at = datetime.now() # Update verified_at if re-verified
-            # If user was created before this achievement system, they won't get this achievement retroactively
-            # unless specific logic is added. This adheres to "when successfully creating the user".
-            await user.save()
-        
+    if approval is not None:
         email_subject = "Congratulations! Your Trabahanap Application is Approved!"
         email_body = get_verification_email_body(name=applicant_name, status="verified")
-        background_tasks.add_task(send_email_async, email_subject, [applicant.email], email_body)
+        await enqueue_email(email_subject, [applicant.email], email_body, idempotency_key=f"verification:{applicant.id}:verified:{applicant.decision_id}")
 
         # Handle JobSeeker specific logic
         if applicant.user_type.lower() == "job-seeker":
-            db = ApplicantJobSeeker.get_motor_collection().database
-            applicant_job_seeker_data = await db.applicant_jobseeker.find_one({"applicantId": str(applicant.id)})
-            if not applicant_job_seeker_data: # Fallback for older records if applicantId was stored as ObjectId
-                 applicant_job_seeker_data = await db.applicant_jobseeker.find_one({"applicantId": PydanticObjectId(applicant.id)})
-
-            job_seeker_exists = await JobSeeker.find_one(JobSeeker.user_id == user.id)
-            if not job_seeker_exists:
-                job_seeker_payload = {
-                    "user_id": user.id,
-                    "joined_at": datetime.utcnow(),
-                    "availability": True,
-                    "hourly_rate": "0",
-                    "credentials": None,
-                    "job_tags": []
-                }
-                if applicant_job_seeker_data:
-                    job_seeker_payload.update({
-                        "joined_at": applicant_job_seeker_data.get('joinedAt', datetime.utcnow()),
-                        "availability": applicant_job_seeker_data.get('availability', True),
-                        "hourly_rate": applicant_job_seeker_data.get('hourlyRate', "0"),
-                        "credentials": applicant_job_seeker_data.get('credentials'),
-                        "job_tags": applicant_job_seeker_data.get('jobTags', [])
-                    })
-                
-                job_seeker = JobSeeker(**job_seeker_payload)
-                await job_seeker.insert()
+            if approval["job_seeker_created"]:
                 msg = "Job-seeker verification approved, user and job-seeker profiles created."
-                if not applicant_job_seeker_data:
+                if not approval["job_seeker_details_found"]:
                     msg += " (Note: specific job seeker details like tags were not found from applicant_jobseeker collection)."
             else:
                 msg = "Job-seeker verification approved. User profile updated. Job-seeker profile already exists."
@@ -274,182 +211,194 @@ async def update_verification_status(applicant_id: str, status: str, background_
     # Fallback for cases where status doesn't change or is just set to pending
     return {"status": "success", "message": f"Applicant status updated to {status}. No notification sent as status is '{status}' or unchanged."}
 
+def _parse_bulk_ids(ids: List[str]):
+    """Validates a bulk request's ids; returns the parsed ids and a failure result for each invalid one."""
+    if not ids:
+        raise HTTPException(status_code=400, detail="No ids given")
+    if len(ids) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {BULK_MAX_ITEMS} ids can be processed per request")
+    parsed: List[PydanticObjectId] = []
+    failures: List[BulkItemResult] = []
+    for raw_id in dict.fromkeys(ids):  # de-duplicated, order kept
+        try:
+            parsed.append(PydanticObjectId(raw_id))
+        except Exception:
+            failures.append(BulkItemResult(id=raw_id, success=False, message="Invalid id"))
+    return parsed, failures
+
+
+def _bulk_response(results: List[BulkItemResult]) -> BulkActionResponse:
+    succeeded = sum(1 for result in results if result.success)
+    return BulkActionResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+
+@router.post("/bulk/update_verification_status", response_model=BulkActionResponse, summary="Verify or reject many applicants")
+async def bulk_update_verification_status(
+    request_data: BulkVerificationRequest,
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    if request_data.status not in ["verified", "rejected"]:
+        raise HTTPException(status_code=400, detail="Invalid status value")
+    applicant_ids, results = _parse_bulk_ids(request_data.ids)
+
+    found = {applicant.id: applicant for applicant in await Applicant.find(In(Applicant.id, applicant_ids)).to_list()}
+    to_update: List[Applicant] = []
+    for applicant_id in applicant_ids:
+        applicant = found.get(applicant_id)
+        if applicant is None:
+            results.append(BulkItemResult(id=str(applicant_id), success=False, message="Applicant not found"))
+        elif applicant.verification_status == request_data.status:
+            results.append(BulkItemResult(id=str(applicant_id), success=False, message=f"Applicant already {request_data.status}"))
+        else:
+            to_update.append(applicant)
+    if not to_update:
+        return _bulk_response(results)
+
+    try:
+        if request_data.status == "verified":
+            approvals = await approve_applicants(to_update)
+        else:
+            decision_id, rejected = await set_applicants_status([applicant.id for applicant in to_update], "rejected")
+            for applicant in to_update:
+                if applicant.id in rejected:
+                    applicant.verification_status = "rejected"
+                    applicant.decision_id = decision_id
+    except Exception as e:
+        logger.error(f"Bulk verification update to {request_data.status} failed: {e}", exc_info=True)
+        results += [BulkItemResult(id=str(applicant.id), success=False, message=f"Update failed: {str(e)}") for applicant in to_update]
+        return _bulk_response(results)
+    # Applicants a concurrent request moved first were not processed by this one
+    won = approvals if request_data.status == "verified" else rejected
+    results += [BulkItemResult(id=str(applicant.id), success=False, message=f"Applicant already {request_data.status}")
+                for applicant in to_update if applicant.id not in won]
+    to_update = [applicant for applicant in to_update if applicant.id in won]
+    if not to_update:
+        return _bulk_response(results)
+    invalidate_dashboard_cache("applicants", "users")
+    if request_data.status == "verified":
+        schedule_refresh_today("usersVerified")
+
+    # One precompiled template renders every body in the batch
+    bodies = render_emails(VERIFICATION_TEMPLATE, [
+        {"name": f"{applicant.first_name} {applicant.last_name if applicant.last_name else ''}".strip(), "status": request_data.status}
+        for applicant in to_update
+    ])
+    if request_data.status == "verified":
+        subject = "Congratulations! Your Trabahanap Application is Approved!"
+    else:
+        subject = "Update on Your Trabahanap Application"
+    emails = [
+        (subject, [applicant.email], body, f"verification:{applicant.id}:{request_data.status}:{applicant.decision_id}")
+        for applicant, body in zip(to_update, bodies)
+    ]
+    notifications = []
+    for applicant in to_update:
+        if request_data.status == "verified":
+            notifications.append({
+                "type": "verification_approved",
+                "message": f"Applicant {applicant.email} ({applicant.user_type}) has been verified.",
+                "details": {"applicantId": str(applicant.id), "status": "verified", "userType": applicant.user_type}
+            })
+            message = "Verification approved, user profile created." if approvals[applicant.id]["user_created"] else "Verification approved, user profile updated."
+        else:
+            notifications.append({
+                "type": "verification_rejected",
+                "message": f"Applicant {applicant.email} has been rejected.",
+                "details": {"applicantId": str(applicant.id), "status": "rejected"}
+            })
+            message = "Applicant verification rejected"
+        results.append(BulkItemResult(id=str(applicant.id), success=True, message=message))
+
+    await enqueue_emails(emails)
+    await broadcast_notification(**batch_notification(notifications))
+    return _bulk_response(results)
+
+
 @router.get("/get_monthly_applications", response_model=MonthlyData)
-async def get_monthly_applications():
+async def get_monthly_applications(request: Request):
     try:
-        current_date = datetime.now()
-        
-        monthly_counts = [0] * 12
-        
-        all_applicants = await Applicant.find_all().to_list()
-        print(f"Total applicants found: {len(all_applicants)}")
-        
-        for i in range(12):
-            month = (current_date.month - i - 1) % 12 + 1
-            year = current_date.year if current_date.month > i else current_date.year - 1
-            
-            start_date = datetime(year, month, 1, 0, 0, 0)
-            
-            if month == 12:
-                end_date = datetime(year + 1, 1, 1, 0, 0, 0)
-            else:
-                end_date = datetime(year, month + 1, 1, 0, 0, 0)
-            
-            count = 0
-            for applicant in all_applicants:
-                if applicant.joined_at and start_date <= applicant.joined_at < end_date:
-                    count += 1
-            
-            monthly_counts[month - 1] = count
-        
-        return {"monthly_data": monthly_counts}
+        monthly_counts = await dashboard_cache.get_or_set("applicants:monthly", lambda: get_monthly_metric("applicantsJoined", Applicant, "joinedAt"))
+        return conditional_response(request, {"monthly_data": monthly_counts})
         
     except Exception as e:
-        print(f"Error getting monthly applications: {str(e)}")
+        logger.error(f"Error getting monthly applications: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error getting monthly applications: {str(e)}")
 
 
 @router.get("/get_monthly_users", response_model=MonthlyData)
-async def get_monthly_users():
+async def get_monthly_users(request: Request):
     try:
-        current_date = datetime.now()
-        
-        monthly_counts = [0] * 12
-        
-        all_users = await User.find_all().to_list()
-        print(f"Total users found: {len(all_users)}")
-        
-        for i in range(12):
-            month = (current_date.month - i - 1) % 12 + 1
-            year = current_date.year if current_date.month > i else current_date.year - 1
-            
-            start_date = datetime(year, month, 1, 0, 0, 0)
-            
-            if month == 12:
-                end_date = datetime(year + 1, 1, 1, 0, 0, 0)
-            else:
-                end_date = datetime(year, month + 1, 1, 0, 0, 0)
-            
-            count = 0
-            for user in all_users:
-                if hasattr(user, 'verified_at') and user.verified_at and start_date <= user.verified_at < end_date:
-                    count += 1
-                    
-            print(f"Month {month}/{year}: {count} verified users")
-            
-            monthly_counts[month - 1] = count
-        
-        return {"monthly_data": monthly_counts}
+        monthly_counts = await dashboard_cache.get_or_set("users:monthly", lambda: get_monthly_metric("usersVerified", User, "verifiedAt"))
+        return conditional_response(request, {"monthly_data": monthly_counts})
         
     except Exception as e:
-        print(f"Error getting monthly users: {str(e)}")
+        logger.error(f"Error getting monthly users: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error getting monthly users: {str(e)}")
 
 
+@router.get("/dashboard/summary", response_model=DashboardSummary, summary="All dashboard totals and charts in one response")
+async def get_dashboard_summary_endpoint(request: Request):
+    try:
+        summary = await get_dashboard_summary()
+        return conditional_response(request, summary)
+    except Exception as e:
+        logger.error(f"Error getting dashboard summary: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error getting dashboard summary: {str(e)}")
+
+
+@router.get("/stats/daily", summary="Daily rollup of joins, verifications, jobs and reports")
+async def get_stats_daily(
+    request: Request,
+    start: Optional[datetime] = Query(None, description="First day (default: 30 days ago)"),
+    end: Optional[datetime] = Query(None, description="Exclusive last day (default: tomorrow)"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    end = end or datetime.utcnow() + timedelta(days=1)
+    start = start or end - timedelta(days=31)
+    if start >= end or (end - start).days > STATS_DAILY_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"start must be before end and the range at most {STATS_DAILY_MAX_DAYS} days")
+    days = await dashboard_cache.get_or_set(f"stats:daily:{start.date()}:{end.date()}", lambda: get_daily_stats(start, end))
+    return conditional_response(request, days)
+
+
 @router.get("/me", response_model=Admin)
 async def read_admin_me(current_admin: Admin = Depends(get_current_active_admin)):
     return current_admin
 
 
+@router.get("/api/diagnostics/indexes", summary="Report missing indexes and hot query plans")
+async def get_index_diagnostics(current_admin: Admin = Depends(get_current_active_admin)):
+    return {
+        "indexes": await get_index_report(DOCUMENT_MODELS),
+        "hot_queries": await explain_hot_queries(),
+    }
+
+
 # --- Report Management Endpoints --- 
 
-@router.get("/api/reports/pending", response_model=List[ReportResponse], summary="Get Pending User Reports")
-async def get_pending_reports(current_admin: Admin = Depends(get_current_active_admin)):
-    pending_reports_docs = await ReportValidation.find(ReportValidation.status == "pending").to_list()
-    
-    response_reports = []
-    for report_doc in pending_reports_docs:
-        reporter_name_str = "N/A"  # Default value
-        reported_object_name_str = "N/A"  # Default value
-
-        # Fetch reporter's name
-        if report_doc.reporter: # This is a PydanticObjectId
-            reporter_user = await User.get(report_doc.reporter) # User.get() takes PydanticObjectId
-            if reporter_user:
-                name_parts = []
-                if reporter_user.first_name: name_parts.append(reporter_user.first_name)
-                if reporter_user.middle_name: name_parts.append(reporter_user.middle_name)
-                if reporter_user.last_name: name_parts.append(reporter_user.last_name)
-                if reporter_user.suffix_name: name_parts.append(reporter_user.suffix_name)
-                name = " ".join(name_parts).strip()
-                reporter_name_str = name if name else f"User ID: {str(reporter_user.id)}"
-
-        # Fetch reported object's name (assuming it's a User)
-        if report_doc.reported_object_id: # This is a PydanticObjectId
-            reported_user = await User.get(report_doc.reported_object_id)
-            if reported_user:
-                name_parts = []
-                if reported_user.first_name: name_parts.append(reported_user.first_name)
-                if reported_user.middle_name: name_parts.append(reported_user.middle_name)
-                if reported_user.last_name: name_parts.append(reported_user.last_name)
-                if reported_user.suffix_name: name_parts.append(reported_user.suffix_name)
-                name = " ".join(name_parts).strip()
-                reported_object_name_str = name if name else f"User ID: {str(reported_user.id)}"
-        
-        # Construct ReportResponse using aliased keys for fields that have them
-        report_response_entry = ReportResponse(
-            id=report_doc.id,  # 'id' has no alias in ReportResponse
-            reportedObjectId=report_doc.reported_object_id, # Alias is reportedObjectId
-            reporter=report_doc.reporter, # 'reporter' has no alias
-            reason=report_doc.reason,
-            status=report_doc.status,
-            dateReported=report_doc.date_reported, # Alias is dateReported
-            dateApproved=report_doc.date_approved, # Alias is dateApproved
-            reporterName=reporter_name_str, # Alias is reporterName
-            reportedObjectName=reported_object_name_str # Alias is reportedObjectName
-        )
-        response_reports.append(report_response_entry)
-            
-    return response_reports
-
-@router.get("/api/reports/all", response_model=List[ReportResponse], summary="Get All User Reports")
-async def get_all_reports(current_admin: Admin = Depends(get_current_active_admin)):
-    all_report_docs = await ReportValidation.find_all().to_list()
-    response_reports: List[ReportResponse] = []
-
-    for report_doc in all_report_docs:
-        reporter_name_str = "N/A"
-        reported_object_name_str = "N/A"
-
-        if report_doc.reporter:
-            reporter_user = await User.get(report_doc.reporter)
-            if reporter_user:
-                name_parts = []
-                if reporter_user.first_name: name_parts.append(reporter_user.first_name)
-                if reporter_user.middle_name: name_parts.append(reporter_user.middle_name)
-                if reporter_user.last_name: name_parts.append(reporter_user.last_name)
-                if reporter_user.suffix_name: name_parts.append(reporter_user.suffix_name)
-                name = " ".join(name_parts).strip()
-                reporter_name_str = name if name else f"User ID: {str(reporter_user.id)}"
-
-        if report_doc.reported_object_id:
-            reported_user = await User.get(report_doc.reported_object_id)
-            if reported_user:
-                name_parts = []
-                if reported_user.first_name: name_parts.append(reported_user.first_name)
-                if reported_user.middle_name: name_parts.append(reported_user.middle_name)
-                if reported_user.last_name: name_parts.append(reported_user.last_name)
-                if reported_user.suffix_name: name_parts.append(reported_user.suffix_name)
-                name = " ".join(name_parts).strip()
-                reported_object_name_str = name if name else f"User ID: {str(reported_user.id)}"
-        
-        report_response_entry = ReportResponse(
-            id=report_doc.id,
-            reportedObjectId=report_doc.reported_object_id,
-            reporter=report_doc.reporter,
-            reason=report_doc.reason,
-            status=report_doc.status,
-            dateReported=report_doc.date_reported,
-            dateApproved=report_doc.date_approved,
-            reporterName=reporter_name_str,
-            reportedObjectName=reported_object_name_str
-        )
-        response_reports.append(report_response_entry)
-            
-    return response_reports
+@router.get("/api/reports/pending", response_model=List[ReportResponse], response_class=FastJSONResponse, summary="Get Pending User Reports")
+async def get_pending_reports(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("-dateReported"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    pending_reports_docs, next_cursor = await paginate(ReportValidation, {"status": "pending"}, REPORT_SORT_FIELDS, sort, cursor, limit)
+    # Reporter and reported-user names are resolved for the whole page in one query
+    return page_response(await hydrate_reports(pending_reports_docs), next_cursor)
+
+@router.get("/api/reports/all", response_model=List[ReportResponse], response_class=FastJSONResponse, summary="Get All User Reports")
+async def get_all_reports(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("-dateReported"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    all_report_docs, next_cursor = await paginate(ReportValidation, {}, REPORT_SORT_FIELDS, sort, cursor, limit)
+    return page_response(await hydrate_reports(all_report_docs), next_cursor)
 
 @router.put("/api/reports/{report_id}/approve", response_model=ReportValidation, summary="Approve a User Report")
-async def approve_report(report_id: PydanticObjectId, background_tasks: BackgroundTasks, current_admin: Admin = Depends(get_current_active_admin)):
+async def approve_report(report_id: PydanticObjectId, current_admin: Admin = Depends(get_current_active_admin)):
     report_to_approve = await ReportValidation.get(report_id)
 
     if not report_to_approve:
@@ -460,21 +409,14 @@ async def approve_report(report_id: PydanticObjectId, background_tasks: Backgrou
         logger.warning(f"Approve_report: Report {report_id} already processed. Status: {report_to_approve.status}. Attempt by admin {current_admin.email}")
         raise HTTPException(status_code=400, detail=f"Report {report_id} already processed. Status: {report_to_approve.status}")
 
-    report_to_approve.status = "approved"
-    report_to_approve.date_approved = datetime.utcnow()
-    await report_to_approve.save()
-    logger.info(f"Report {report_id} approved by admin {current_admin.email}")
-
-    final_report_entry = FinalReport(
-        original_report_id=str(report_to_approve.id), 
-        reported_object_id=str(report_to_approve.reported_object_id), 
-        reporter=str(report_to_approve.reporter), 
-        reason=report_to_approve.reason,
-        date_reported=report_to_approve.date_reported,
-        date_approved=report_to_approve.date_approved 
-    )
-    await final_report_entry.insert()
-    logger.info(f"FinalReport entry created for approved report {report_id}")
+    # Guarded like the bulk path, so a concurrent decision cannot approve the report twice
+    decided, failures = await decide_reports([report_id], "approved")
+    if not decided:
+        raise HTTPException(status_code=400, detail=failures.get(report_id, f"Report {report_id} already processed"))
+    report_to_approve = decided[0]
+    invalidate_dashboard_cache("reports")
+    schedule_refresh_today("reportsApproved")
+    logger.info(f"Report {report_id} approved by admin {current_admin.email}; FinalReport entry created")
 
     # Send email to REPORTER
     reporter_user = await User.get(report_to_approve.reporter) 
@@ -487,7 +429,7 @@ async def approve_report(report_id: PydanticObjectId, background_tasks: Backgrou
                 report_status="approved",
                 reported_item_info=f"Report ID {str(report_to_approve.id)} concerning object ID {str(report_to_approve.reported_object_id)}" 
             )
-            background_tasks.add_task(send_email_async, email_subject_to_reporter, [reporter_user.email], email_body_to_reporter)
+            await enqueue_email(email_subject_to_reporter, [reporter_user.email], email_body_to_reporter, idempotency_key=f"report:{report_to_approve.id}:{report_to_approve.decision_id}:reporter")
         else:
             logger.warning(f"REPORTER user {reporter_user.id} found, but no email address is present. Cannot send approval notification for report {report_id}.")
     else:
@@ -504,7 +446,7 @@ async def approve_report(report_id: PydanticObjectId, background_tasks: Backgrou
                 reported_item_info=f"Content/behavior associated with your account (Ref: {report_to_approve.reported_object_id})",
                 report_reason=report_to_approve.reason
             )
-            background_tasks.add_task(send_email_async, email_subject_to_reported_user, [reported_user.email], email_body_to_reported_user)
+            await enqueue_email(email_subject_to_reported_user, [reported_user.email], email_body_to_reported_user, idempotency_key=f"report:{report_to_approve.id}:{report_to_approve.decision_id}:reported")
         else:
             logger.warning(f"REPORTED USER {reported_user.id} (object ID {report_to_approve.reported_object_id}) found, but no email address is present. Cannot send notification for approved report {report_id}.")
     else:
@@ -519,7 +461,7 @@ async def approve_report(report_id: PydanticObjectId, background_tasks: Backgrou
     return report_to_approve
 
 @router.put("/api/reports/{report_id}/reject", response_model=ReportValidation, summary="Reject a User Report")
-async def reject_report(report_id: PydanticObjectId, background_tasks: BackgroundTasks, current_admin: Admin = Depends(get_current_active_admin)):
+async def reject_report(report_id: PydanticObjectId, current_admin: Admin = Depends(get_current_active_admin)):
     report_to_reject = await ReportValidation.get(report_id)
 
     if not report_to_reject:
@@ -530,8 +472,11 @@ async def reject_report(report_id: PydanticObjectId, background_tasks: Backgroun
         logger.warning(f"Reject_report: Report {report_id} already processed. Status: {report_to_reject.status}. Attempt by admin {current_admin.email}")
         raise HTTPException(status_code=400, detail=f"Report {report_id} already processed. Status: {report_to_reject.status}")
 
-    report_to_reject.status = "rejected"
-    await report_to_reject.save()
+    decided, failures = await decide_reports([report_id], "rejected")
+    if not decided:
+        raise HTTPException(status_code=400, detail=failures.get(report_id, f"Report {report_id} already processed"))
+    report_to_reject = decided[0]
+    invalidate_dashboard_cache("reports")
     logger.info(f"Report {report_id} rejected by admin {current_admin.email}")
 
     # Send email to reporter
@@ -545,7 +490,7 @@ async def reject_report(report_id: PydanticObjectId, background_tasks: Backgroun
                 report_status="rejected",
                 reported_item_info=f"Report ID {str(report_to_reject.id)} concerning object ID {str(report_to_reject.reported_object_id)}"
             )
-            background_tasks.add_task(send_email_async, email_subject, [reporter_user.email], email_body)
+            await enqueue_email(email_subject, [reporter_user.email], email_body, idempotency_key=f"report:{report_to_reject.id}:{report_to_reject.decision_id}:reporter")
         else:
             logger.warning(f"Reporter user {reporter_user.id} found, but no email address is present. Cannot send rejection notification for report {report_id}.")
     else:
@@ -559,15 +504,150 @@ async def reject_report(report_id: PydanticObjectId, background_tasks: Backgroun
 
     return report_to_reject
 
+async def _bulk_decide_reports(ids: List[str], new_status: str, current_admin: Admin) -> BulkActionResponse:
+    report_ids, results = _parse_bulk_ids(ids)
+    processed, failures = await decide_reports(report_ids, new_status)
+    for report_id, reason in failures.items():
+        results.append(BulkItemResult(id=str(report_id), success=False, message=reason))
+    if not processed:
+        return _bulk_response(results)
+    invalidate_dashboard_cache("reports")
+    if new_status == "approved":
+        schedule_refresh_today("reportsApproved")
+    logger.info(f"{len(processed)} report(s) {new_status} by admin {current_admin.email}")
+
+    # Reporter (and, for approvals, reported user) contacts for the whole batch in one query
+    user_ids = [report.reporter for report in processed]
+    if new_status == "approved":
+        user_ids += [report.reported_object_id for report in processed]
+    contacts = await load_user_contacts(user_ids)
+
+    emails = []
+    notifications = []
+    for report in processed:
+        reporter_user = contacts.get(report.reporter)
+        if reporter_user and reporter_user.email:
+            reporter_name = f"{reporter_user.first_name} {reporter_user.last_name if reporter_user.last_name else ''}".strip()
+            emails.append((
+                "Update on Your Recent Report to Trabahanap",
+                [reporter_user.email],
+                get_report_email_body(
+                    reporter_name=reporter_name,
+                    report_status=new_status,
+                    reported_item_info=f"Report ID {str(report.id)} concerning object ID {str(report.reported_object_id)}"
+                ),
+                f"report:{report.id}:{report.decision_id}:reporter"
+            ))
+        reported_user = contacts.get(report.reported_object_id) if new_status == "approved" else None
+        if reported_user and reported_user.email:
+            reported_user_name = f"{reported_user.first_name} {reported_user.last_name if reported_user.last_name else ''}".strip()
+            emails.append((
+                "Notification Regarding Your Account/Content on Trabahanap",
+                [reported_user.email],
+                get_notification_for_reported_user_body(
+                    reported_user_name=reported_user_name,
+                    reported_item_info=f"Content/behavior associated with your account (Ref: {report.reported_object_id})",
+                    report_reason=report.reason
+                ),
+                f"report:{report.id}:{report.decision_id}:reported"
+            ))
+        notifications.append({
+            "type": f"report_{new_status}",
+            "message": f"Report ID {str(report.id)} has been {new_status}.",
+            "details": {"reportId": str(report.id), "status": new_status}
+        })
+        results.append(BulkItemResult(id=str(report.id), success=True, message=f"Report {new_status}"))
+
+    await enqueue_emails(emails)
+    await broadcast_notification(**batch_notification(notifications))
+    return _bulk_response(results)
+
+@router.post("/api/reports/bulk/approve", response_model=BulkActionResponse, summary="Approve many User Reports")
+async def bulk_approve_reports(request_data: BulkIdsRequest, current_admin: Admin = Depends(get_current_active_admin)):
+    return await _bulk_decide_reports(request_data.ids, "approved", current_admin)
+
+@router.post("/api/reports/bulk/reject", response_model=BulkActionResponse, summary="Reject many User Reports")
+async def bulk_reject_reports(request_data: BulkIdsRequest, current_admin: Admin = Depends(get_current_active_admin)):
+    return await _bulk_decide_reports(request_data.ids, "rejected", current_admin)
+
+# --- User Endpoints ---
+@router.post("/api/users/achievements", response_model=Dict[str, List[AchievementView]], summary="Achievements of many users")
+async def get_users_achievements(request_data: BulkIdsRequest, current_admin: Admin = Depends(get_current_active_admin)):
+    # Invalid ids and users without achievements are simply absent from the result
+    user_ids, _ = _parse_bulk_ids(request_data.ids)
+    achievements = await load_achievements(user_ids)
+    return {str(user_id): items for user_id, items in achievements.items()}
+
+@router.get("/api/users/{user_id}", response_model=UserDetail, summary="A user with their achievements and job seeker profile")
+async def get_user_by_id(
+    user_id: PydanticObjectId,
+    include: str = Query(",".join(USER_DETAIL_INCLUDES), description=f"Comma-separated relations to load: {', '.join(USER_DETAIL_INCLUDES)}; empty for none"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    relations = [relation.strip() for relation in include.split(",") if relation.strip()]
+    unknown = [relation for relation in relations if relation not in USER_DETAIL_INCLUDES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include '{unknown[0]}'. Allowed: {', '.join(USER_DETAIL_INCLUDES)}")
+    user = await get_user_detail(user_id, relations)
+    if not user:
+        raise HTTPException(status_code=404, detail=f"User with ID {user_id} not found")
+    return user
+# --- End User Endpoints ---
+
+
 # --- Job Request Endpoints ---
-@router.get("/api/job_requests/", response_model=List[Job])
+@router.get("/api/job_requests/", response_model=List[JobListView], response_class=FastJSONResponse)
 async def get_all_job_requests(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("-datePosted"),
     current_admin: Admin = Depends(get_current_active_admin) # Assuming admin auth is needed
 ):
-    jobs = await Job.find_all().to_list()
+    jobs, next_cursor = await paginate(Job, {}, JOB_SORT_FIELDS, sort, cursor, limit, JobListView)
     # if not jobs: # frontend might prefer an empty list over 404
     #     raise HTTPException(status_code=404, detail="No job requests found")
-    return jobs
+    return page_response(jobs, next_cursor)
+
+def _date_key(value: Optional[datetime]) -> str:
+    return value.isoformat() if value else "-"
+
+# Jobs are written by the mobile app, so these expire with the TTL or when the rollup worker invalidates "jobs"
+@router.get("/api/job_requests/analytics/counts", response_model=JobCounts, summary="Job counts by status, category and location")
+async def get_job_request_counts(
+    request: Request,
+    start: Optional[datetime] = Query(None, description=f"Only jobs posted at or after this time (default: {JOB_ANALYTICS_DEFAULT_DAYS} days before end)"),
+    end: Optional[datetime] = Query(None, description="Only jobs posted before this time"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    counts = await dashboard_cache.get_or_set(
+        f"jobs:analytics:counts:{_date_key(start)}:{_date_key(end)}", lambda: get_job_counts(start, end)
+    )
+    return conditional_response(request, counts)
+
+@router.get("/api/job_requests/analytics/durations", response_model=JobDurations, summary="Time-to-accept and time-to-complete percentiles")
+async def get_job_request_durations(
+    request: Request,
+    start: Optional[datetime] = Query(None, description=f"Only jobs posted at or after this time (default: {JOB_ANALYTICS_DEFAULT_DAYS} days before end)"),
+    end: Optional[datetime] = Query(None, description="Only jobs posted before this time"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    durations = await dashboard_cache.get_or_set(
+        f"jobs:analytics:durations:{_date_key(start)}:{_date_key(end)}", lambda: get_job_durations(start, end)
+    )
+    return conditional_response(request, durations)
+
+@router.get("/api/job_requests/analytics/seeker_ratings", response_model=List[SeekerRating], summary="Average job rating per job seeker")
+async def get_job_seeker_ratings(
+    request: Request,
+    limit: int = Query(20, ge=1, le=JOB_ANALYTICS_TOP_N),
+    min_jobs: int = Query(1, ge=1, description="Only job seekers with at least this many rated jobs"),
+    ascending: bool = Query(False, description="Lowest rated first"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    ratings = await dashboard_cache.get_or_set(
+        f"jobs:analytics:ratings:{limit}:{min_jobs}:{ascending}", lambda: get_seeker_ratings(limit, min_jobs, ascending)
+    )
+    return conditional_response(request, ratings)
 
 @router.get("/api/job_requests/{job_id}", response_model=Job)
 async def get_job_request_by_id(
@@ -581,6 +661,69 @@ async def get_job_request_by_id(
 # --- End Job Request Endpoints ---
 
 
+# --- Search Endpoints ---
+@router.get("/search/{collection}", summary="Search applicants, users or jobs")
+async def search_collection(
+    collection: str,
+    q: str = Query(..., min_length=1, max_length=200),
+    mode: str = Query("auto", description="text (ranked full-text), prefix (type-ahead) or auto"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=f"Value of the {NEXT_CURSOR_HEADER} header from the previous page"),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"Invalid mode '{mode}'. Allowed: {', '.join(SEARCH_MODES)}")
+    try:
+        offset = int(cursor) if cursor else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    items, next_offset = await search(collection, q, mode, limit, offset)
+    return page_response(items, str(next_offset) if next_offset is not None else None)
+# --- End Search Endpoints ---
+
+
+# --- Export Endpoints ---
+@router.get("/export/{collection}", summary="Stream a collection as NDJSON or CSV")
+async def export_collection(
+    collection: str,
+    export_format: str = Query("ndjson", alias="format"),
+    start: Optional[datetime] = Query(None, description="Inclusive lower bound on the collection's date field"),
+    end: Optional[datetime] = Query(None, description="Exclusive upper bound on the collection's date field"),
+    status: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description="Comma-separated field whitelist, e.g. _id,emailAddress,joinedAt"),
+    gzip: bool = Query(False),
+    current_admin: Admin = Depends(get_current_active_admin)
+):
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid format '{export_format}'. Allowed: {', '.join(EXPORT_FORMATS)}")
+    spec = get_export_spec(collection)
+    selected_fields = select_fields(spec, fields)
+    query = build_export_filter(spec, start, end, status)
+    logger.info(f"Admin {current_admin.email} exporting {collection} as {export_format} (filter: {query}, gzip: {gzip})")
+
+    filename = f"{collection}-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.{export_format}"
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        stream_export(spec, query, selected_fields, export_format, gzip=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+# --- End Export Endpoints ---
+
+
+@router.get("/ws/stats", summary="Notification WebSocket queue depth and drop counters")
+async def get_websocket_stats(current_admin: Admin = Depends(get_current_active_admin)):
+    return manager.stats()
+
+
+@router.get("/email/metrics", summary="Email outbox throughput, queue depth and lag")
+async def get_email_metrics(current_admin: Admin = Depends(get_current_active_admin)):
+    return await get_outbox_metrics()
+
+
 @router.websocket("/ws/notifications")
 async def websocket_endpoint(websocket: WebSocket, admin: dict = Depends(get_admin_from_query_token)):
     await manager.connect(websocket)
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from beanie import Link, PydanticObjectId
+from beanie.operators import In
+
+from admin_api import database
+from admin_api.models.documents import User, Applicant, ApplicantJobSeeker, JobSeeker, Achievement
+from admin_api.services.search_service import user_search_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def build_user_from_applicant(applicant: Applicant) -> Tuple[User, Achievement]:
+    """Builds the new User with its "Created First Account" achievement already linked, so each is written once."""
+    now = datetime.utcnow()
+    user_id = PydanticObjectId()
+    first_account_achievement = Achievement(
+        id=PydanticObjectId(),
+        achievementName="Created First Account",
+        description="Successfully created your first account",
+        date_achieved=now,
+        job_required="None",
+        required_job_count=0,
+        user_id=user_id
+    )
+    user = User(
+        id=user_id,
+        first_name=applicant.first_name,
+        middle_name=applicant.middle_name,
+        last_name=applicant.last_name,
+        suffix_name=applicant.suffix_name,
+        gender=applicant.gender,
+        birth_date=applicant.birth_date,
+        age=applicant.age,
+        email=applicant.email,
+        password=applicant.password,
+        profile_picture=applicant.profile_picture,
+        barangay=applicant.barangay,
+        street=applicant.street,
+        house_number=applicant.house_number,
+        user_type=applicant.user_type,
+        id_validation_front_image=applicant.id_validation_front_image,
+        id_validation_back_image=applicant.id_validation_back_image,
+        id_type=applicant.id_type,
+        jobs_done=0,
+        joined_at=now,
+        verification_status="verified",
+        verified_at=now,
+        achievements=[Link(first_account_achievement.to_ref(), Achievement)],
+        search_tokens=user_search_tokens(applicant.first_name, applicant.middle_name, applicant.last_name, applicant.email, applicant.barangay)
+    )
+    return user, first_account_achievement
+
+
+def build_job_seeker(user_id: PydanticObjectId, applicant_job_seeker_data: Optional[Dict[str, Any]]) -> JobSeeker:
+    job_seeker_payload = {
+        "user_id": user_id,
+        "joined_at": datetime.utcnow(),
+        "availability": True,
+        "hourly_rate": "0",
+        "credentials": None,
+        "job_tags": []
+    }
+    if applicant_job_seeker_data:
+        job_seeker_payload.update({
+            "joined_at": applicant_job_seeker_data.get('joinedAt', datetime.utcnow()),
+            "availability": applicant_job_seeker_data.get('availability', True),
+            "hourly_rate": applicant_job_seeker_data.get('hourlyRate', "0"),
+            "credentials": applicant_job_seeker_data.get('credentials'),
+            "job_tags": applicant_job_seeker_data.get('jobTags', [])
+        })
+    return JobSeeker(**job_seeker_payload)
+
+
+def _is_job_seeker(applicant: Applicant) -> bool:
+    return applicant.user_type.lower() == "job-seeker"
+
+
+async def _find_applicant_job_seeker_data(applicants: List[Applicant]) -> Dict[str, Dict[str, Any]]:
+    """Loads applicant_jobseeker records for many applicants, keyed by str(applicant id)."""
+    if not applicants:
+        return {}
+    # applicantId was stored as a string, and as an ObjectId on older records; one query covers both
+    keys = [str(applicant.id) for applicant in applicants] + [PydanticObjectId(applicant.id) for applicant in applicants]
+    cursor = ApplicantJobSeeker.get_motor_collection().find({"applicantId": {"$in": keys}})
+    records = {}
+    async for record in cursor:
+        records.setdefault(str(record["applicantId"]), record)
+    return records
+
+
+async def run_in_transaction(write):
+    """
+    Runs `write(session)` in a multi-document transaction when the server supports it
+    (replica set); on a standalone server the same writes run without one.
+    """
+    if await database.is_replica_set():
+        async with await database.client.start_session() as session:
+            # with_transaction retries the callback on transient errors and commits for us
+            await session.with_transaction(write)
+    else:
+        logger.warning("Transactions unavailable (standalone MongoDB); writing without one.")
+        await write(None)
+
+
+def _plan_approvals(
+    applicants: List[Applicant],
+    existing_users: Dict[str, User],
+    applicant_job_seeker_data: Dict[str, Dict[str, Any]],
+    existing_job_seeker_user_ids: set,
+) -> Dict[str, Any]:
+    """Decides, without any I/O, which users, achievements and job seeker profiles approving `applicants` writes."""
+    existing_users = dict(existing_users)
+    existing_job_seeker_user_ids = set(existing_job_seeker_user_ids)
+    plan: Dict[str, Any] = {"new_users": [], "new_achievements": [], "reverified_user_ids": [], "new_job_seekers": [], "results": {}}
+    new_user_ids = set()
+
+    for applicant in applicants:
+        user = existing_users.get(applicant.email)
+        user_created = user is None
+        if user_created:
+            user, achievement = build_user_from_applicant(applicant)
+            plan["new_users"].append(user)
+            new_user_ids.add(user.id)
+            plan["new_achievements"].append(achievement)
+            # A later applicant with the same email re-uses this user instead of duplicating it
+            existing_users[applicant.email] = user
+        elif user.id not in new_user_ids and user.id not in plan["reverified_user_ids"]:
+            # If user was created before the achievement system, they won't get it retroactively
+            plan["reverified_user_ids"].append(user.id)
+
+        job_seeker = None
+        details = applicant_job_seeker_data.get(str(applicant.id))
+        if _is_job_seeker(applicant) and user.id not in existing_job_seeker_user_ids:
+            job_seeker = build_job_seeker(user.id, details)
+            plan["new_job_seekers"].append(job_seeker)
+            existing_job_seeker_user_ids.add(user.id)
+
+        plan["results"][applicant.id] = {
+            "user": user,
+            "user_created": user_created,
+            "job_seeker_created": job_seeker is not None,
+            "job_seeker_details_found": details is not None,
+        }
+    return plan
+
+
+async def approve_applicants(applicants: List[Applicant]) -> Dict[PydanticObjectId, Dict[str, Any]]:
+    """
+    Verifies many applicants: marks them verified, creates (or re-verifies) their Users and,
+    for job seekers, their JobSeeker profiles.
+
+    Every read runs up front with one query per collection, concurrently where they are
+    independent. All writes then run as batched operations inside a single transaction,
+    so a failure never leaves half-created users behind.
+    Returns the outcome per applicant id. An applicant that a concurrent request verified
+    first is left out, so it never gets a second User.
+    """
+    if not applicants:
+        return {}
+
+    emails = [applicant.email for applicant in applicants]
+    job_seeker_applicants = [applicant for applicant in applicants if _is_job_seeker(applicant)]
+    users, applicant_job_seeker_data = await asyncio.gather(
+        User.find(In(User.email, emails)).to_list(),
+        _find_applicant_job_seeker_data(job_seeker_applicants)
+    )
+    existing_users = {user.email: user for user in users}
+
+    # Only users that already exist can already have a job seeker profile
+    existing_job_seeker_user_ids = set()
+    existing_job_seeker_candidates = [existing_users[a.email].id for a in job_seeker_applicants if a.email in existing_users]
+    if existing_job_seeker_candidates:
+        profiles = await JobSeeker.find(In(JobSeeker.user_id, existing_job_seeker_candidates)).to_list()
+        existing_job_seeker_user_ids = {profile.user_id for profile in profiles}
+
+    now = datetime.utcnow()
+    decision_id = PydanticObjectId()
+    applicant_ids = [applicant.id for applicant in applicants]
+    results: Dict[PydanticObjectId, Dict[str, Any]] = {}
+
+    async def write(session):
+        collection = Applicant.get_motor_collection()
+        # The status guard lets only one approval win per applicant; the decision id tells which ones this call won
+        await collection.update_many(
+            {"_id": {"$in": applicant_ids}, "verificationStatus": {"$ne": "verified"}},
+            {"$set": {"verificationStatus": "verified", "decisionId": decision_id}},
+            session=session
+        )
+        won = {doc["_id"] async for doc in collection.find({"_id": {"$in": applicant_ids}, "decisionId": decision_id}, {"_id": 1}, session=session)}
+        plan = _plan_approvals([a for a in applicants if a.id in won], existing_users, applicant_job_seeker_data, existing_job_seeker_user_ids)
+        # with_transaction may run this again after a transient error; only the last run's outcome counts
+        results.clear()
+        results.update(plan["results"])
+
+        if plan["new_achievements"]:
+            await Achievement.insert_many(plan["new_achievements"], session=session)
+        if plan["new_users"]:
+            await User.insert_many(plan["new_users"], session=session)
+        if plan["reverified_user_ids"]:
+            await User.get_motor_collection().update_many(
+                {"_id": {"$in": plan["reverified_user_ids"]}},
+                {"$set": {"verificationStatus": "verified", "verifiedAt": now}},  # Update verifiedAt if re-verified
+                session=session
+            )
+        if plan["new_job_seekers"]:
+            await JobSeeker.insert_many(plan["new_job_seekers"], session=session)
+
+    await run_in_transaction(write)
+
+    for applicant in applicants:
+        if applicant.id in results:
+            applicant.verification_status = "verified"
+            applicant.decision_id = decision_id
+    return results
+
+
+async def set_applicants_status(applicant_ids: List[PydanticObjectId], status: str) -> Tuple[PydanticObjectId, Set[PydanticObjectId]]:
+    """
+    Moves applicants to a status other than "verified" with one guarded `update_many`.
+    Returns the decision id and the ids this call changed; applicants already in that
+    status, or moved there first by a concurrent request, are left out.
+    """
+    decision_id = PydanticObjectId()
+    collection = Applicant.get_motor_collection()
+    await collection.update_many(
+        {"_id": {"$in": applicant_ids}, "verificationStatus": {"$ne": status}},
+        {"$set": {"verificationStatus": status, "decisionId": decision_id}}
+    )
+    won = {doc["_id"] async for doc in collection.find({"_id": {"$in": applicant_ids}, "decisionId": decision_id}, {"_id": 1})}
+    return decision_id, won
+
+
+async def approve_applicant(applicant: Applicant) -> Optional[Dict[str, Any]]:
+    """Verifies a single applicant; see approve_applicants. None if a concurrent request verified it first."""
+    results = await approve_applicants([applicant])
+    return results.get(applicant.id)
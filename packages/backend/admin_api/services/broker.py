@@ -0,0 +1,203 @@
+"""
+Pub/sub backends that carry notification frames between API workers.
+
+Every worker publishes the frames it produces and delivers every frame it receives to its
+own WebSocket connections, so an admin connected to any worker sees events from all of them.
+"""
+import abc
+import asyncio
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+from admin_api.models.documents import NotifierState
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# "memory" (single process only), "redis" or "mongo"
+NOTIFICATION_BROKER = os.getenv("NOTIFICATION_BROKER", "memory").lower()
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+BROKER_CHANNEL = os.getenv("NOTIFICATION_BROKER_CHANNEL", "admin_notifications")
+MONGO_BUS_SIZE_BYTES = int(os.getenv("NOTIFICATION_BUS_SIZE_BYTES", 16 * 1024 * 1024))
+
+# Frames are the UTF-8 JSON bytes encoded once by broadcast_notification
+DeliverFunc = Callable[[bytes], Awaitable[None]]
+
+
+def configured_worker_count() -> int:
+    """
+    Worker processes this deployment runs: WEB_CONCURRENCY (read by uvicorn and gunicorn), else
+    `--workers N` on the command line, which uvicorn's spawned workers inherit in sys.argv.
+    """
+    if os.getenv("WEB_CONCURRENCY"):
+        return int(os.environ["WEB_CONCURRENCY"])
+    for i, arg in enumerate(sys.argv):
+        if arg == "--workers" and i + 1 < len(sys.argv):
+            return int(sys.argv[i + 1])
+        if arg.startswith("--workers="):
+            return int(arg.split("=", 1)[1])
+    return 1
+
+
+class NotificationBroker(abc.ABC):
+    """Base broker: `publish` a frame from this worker, `deliver` frames from every worker."""
+
+    def __init__(self, deliver: DeliverFunc):
+        self.deliver = deliver
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    @abc.abstractmethod
+    async def publish(self, message: bytes):
+        ...
+
+
+class InMemoryBroker(NotificationBroker):
+    """Delivers straight to the local connections. Only correct with a single worker process."""
+
+    async def publish(self, message: bytes):
+        await self.deliver(message)
+
+
+class _SubscribingBroker(NotificationBroker):
+    """Shared start/stop handling for brokers that run a background subscriber."""
+
+    def __init__(self, deliver: DeliverFunc):
+        super().__init__(deliver)
+        self._subscriber_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        await self._setup()
+        self._subscriber_task = asyncio.create_task(self._subscribe())
+
+    async def stop(self):
+        if self._subscriber_task:
+            self._subscriber_task.cancel()
+            try:
+                await self._subscriber_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _setup(self):
+        pass
+
+    @abc.abstractmethod
+    async def _subscribe(self):
+        ...
+
+
+class RedisBroker(_SubscribingBroker):
+    """Redis PUBLISH/SUBSCRIBE on a single channel. Requires the `redis` package."""
+
+    def __init__(self, deliver: DeliverFunc, url: str = REDIS_URL, channel: str = BROKER_CHANNEL):
+        super().__init__(deliver)
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("NOTIFICATION_BROKER=redis requires the 'redis' package (pip install redis).")
+        self.redis = redis_asyncio.from_url(url)
+        self.channel = channel
+
+    async def publish(self, message: bytes):
+        await self.redis.publish(self.channel, message)
+
+    async def _subscribe(self):
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for item in pubsub.listen():
+                    if item.get("type") != "message":
+                        continue
+                    data = item["data"]
+                    await self.deliver(data if isinstance(data, bytes) else data.encode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[BROKER:redis] Subscription failed: {e}. Resubscribing in 1s.")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.close()
+
+    async def stop(self):
+        await super().stop()
+        await self.redis.close()
+
+
+class MongoCappedBroker(_SubscribingBroker):
+    """Uses a capped collection as a bus, read with a tailable cursor. Needs nothing beyond MongoDB."""
+
+    def __init__(self, deliver: DeliverFunc, collection_name: str = BROKER_CHANNEL, size_bytes: int = MONGO_BUS_SIZE_BYTES):
+        super().__init__(deliver)
+        self.collection_name = collection_name
+        self.size_bytes = size_bytes
+        self.collection = None
+
+    async def _setup(self):
+        database = NotifierState.get_motor_collection().database
+        try:
+            await database.create_collection(self.collection_name, capped=True, size=self.size_bytes)
+        except CollectionInvalid:
+            pass  # already exists
+        self.collection = database[self.collection_name]
+
+    async def publish(self, message: bytes):
+        await self.collection.insert_one({"message": message, "createdAt": datetime.utcnow()})
+
+    async def _subscribe(self):
+        # Frames are read in insertion ($natural) order and the last one delivered is found again by
+        # identity, never compared: ObjectIds minted by different processes are not ordered
+        latest = await self.collection.find_one(sort=[("$natural", -1)])
+        last_id = latest["_id"] if latest else None  # only frames published after this worker started
+        while True:
+            try:
+                # A reopened cursor starts at the oldest frame; skip up to the last one delivered,
+                # unless the capped collection has overwritten it, in which case every frame left is newer
+                skipping = last_id is not None and await self.collection.count_documents({"_id": last_id}, limit=1) > 0
+                cursor = self.collection.find({}, cursor_type=CursorType.TAILABLE_AWAIT)
+                while cursor.alive:
+                    async for doc in cursor:
+                        if skipping:
+                            skipping = doc["_id"] != last_id
+                            continue
+                        last_id = doc["_id"]
+                        await self.deliver(doc["message"])
+                    await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                raise
+            except PyMongoError as e:
+                logger.error(f"[BROKER:mongo] Tailing {self.collection_name} failed: {e}. Retrying in 1s.")
+            # A tailable cursor on an empty capped collection dies immediately; back off before reopening
+            await asyncio.sleep(1)
+
+
+def create_broker(deliver: DeliverFunc, backend: str = NOTIFICATION_BROKER, workers: Optional[int] = None) -> NotificationBroker:
+    """
+    Builds the configured broker. The notifier runs on one worker only, so the in-memory broker
+    would leave every other worker's admins without notifications; it refuses to start there.
+    """
+    if backend == "redis":
+        return RedisBroker(deliver)
+    if backend == "mongo":
+        return MongoCappedBroker(deliver)
+    if backend != "memory":
+        raise RuntimeError(f"Unknown NOTIFICATION_BROKER '{backend}'; use 'memory', 'redis' or 'mongo'.")
+    workers = configured_worker_count() if workers is None else workers
+    if workers > 1:
+        raise RuntimeError(
+            f"NOTIFICATION_BROKER=memory only reaches the sockets of one process, but {workers} workers are configured. "
+            "Set NOTIFICATION_BROKER to 'redis' or 'mongo'."
+        )
+    return InMemoryBroker(deliver)
@@ -0,0 +1,274 @@
+"""
+Durable outbound email queue.
+
+Request handlers write messages to the `email_outbox` collection; a worker on every API
+process claims them in batches and sends them over one long-lived SMTP connection,
+retrying failures with exponential backoff. Messages carry an idempotency key scoped to the
+event that caused them (e.g. one verification decision), so enqueueing the same notification
+twice sends it once. Sent and failed messages are removed EMAIL_OUTBOX_RETENTION_DAYS later.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import aiosmtplib
+from beanie.odm.utils.parsing import parse_obj
+from dotenv import load_dotenv
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from admin_api.models.documents import EmailOutbox
+from admin_api.services.email_service import conf
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", 20))
+EMAIL_POLL_INTERVAL_SECONDS = float(os.getenv("EMAIL_POLL_INTERVAL_SECONDS", 2))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", 6))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", 30))
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", 3600))
+# How long a claimed message stays reserved for a worker before another may retry it
+EMAIL_CLAIM_SECONDS = int(os.getenv("EMAIL_CLAIM_SECONDS", 300))
+# Close the SMTP connection after this long without traffic
+SMTP_IDLE_TIMEOUT_SECONDS = float(os.getenv("SMTP_IDLE_TIMEOUT_SECONDS", 60))
+# How long sent and permanently failed messages stay in the outbox
+EMAIL_OUTBOX_RETENTION_DAYS = float(os.getenv("EMAIL_OUTBOX_RETENTION_DAYS", 30))
+
+# (subject, recipients, body, idempotency_key)
+OutboxMessage = Tuple[str, Sequence[str], str, Optional[str]]
+
+
+def default_idempotency_key(subject: str, recipients: Sequence[str], body: str) -> str:
+    return hashlib.sha256("\x1f".join([subject, ",".join(sorted(recipients)), body]).encode()).hexdigest()
+
+
+def _outbox_document(subject: str, recipients: Sequence[str], body: str, idempotency_key: Optional[str]) -> EmailOutbox:
+    return EmailOutbox(
+        idempotency_key=idempotency_key or default_idempotency_key(subject, recipients, body),
+        subject=subject,
+        recipients=list(recipients),
+        body=body
+    )
+
+
+async def enqueue_email(subject: str, recipients: Sequence[str], body: str, idempotency_key: Optional[str] = None) -> bool:
+    """Persists one message for delivery. Returns False when a message with the same key was already queued."""
+    try:
+        await _outbox_document(subject, recipients, body, idempotency_key).insert()
+        return True
+    except DuplicateKeyError:
+        logger.info(f"Email with idempotency key {idempotency_key} already queued; skipping.")
+        return False
+
+
+async def enqueue_emails(messages: List[OutboxMessage]) -> int:
+    """Persists many messages with one insert; duplicates of already queued keys are skipped. Returns how many were queued."""
+    if not messages:
+        return 0
+    documents = [_outbox_document(*message) for message in messages]
+    try:
+        await EmailOutbox.insert_many(documents, ordered=False)
+        return len(documents)
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        if any(error.get("code") != 11000 for error in errors):
+            raise
+        return len(documents) - len(errors)
+
+
+class OutboxMetrics:
+    """Throughput and lag counters for the email worker."""
+
+    def __init__(self, window_seconds: float = 300):
+        self.window_seconds = window_seconds
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.batches = 0
+        self.smtp_connections = 0
+        self._sent_times: Deque[float] = deque()
+
+    def record_sent(self):
+        now = time.monotonic()
+        self.sent += 1
+        self._sent_times.append(now)
+        while self._sent_times and self._sent_times[0] < now - self.window_seconds:
+            self._sent_times.popleft()
+
+    def sent_per_minute(self) -> float:
+        now = time.monotonic()
+        recent = [t for t in self._sent_times if t >= now - self.window_seconds]
+        return round(len(recent) * 60 / self.window_seconds, 2)
+
+
+metrics = OutboxMetrics()
+
+
+async def get_outbox_metrics() -> Dict[str, Any]:
+    collection = EmailOutbox.get_motor_collection()
+    pending = await collection.count_documents({"status": {"$in": ["pending", "sending"]}})
+    failed_total = await collection.count_documents({"status": "failed"})
+    oldest = await collection.find_one({"status": "pending"}, sort=[("createdAt", 1)], projection={"createdAt": 1})
+    lag_seconds = (datetime.utcnow() - oldest["createdAt"]).total_seconds() if oldest else 0
+    return {
+        "pending": pending,
+        "failed_total": failed_total,
+        "queue_lag_seconds": round(lag_seconds, 3),
+        "sent_per_minute": metrics.sent_per_minute(),
+        "sent": metrics.sent,
+        "failed": metrics.failed,
+        "retried": metrics.retried,
+        "batches": metrics.batches,
+        "smtp_connections": metrics.smtp_connections,
+    }
+
+
+class SMTPConnection:
+    """One reusable SMTP session: opened on first use, re-opened after a disconnect, closed when idle."""
+
+    def __init__(self):
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._last_used = 0.0
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=conf.MAIL_SERVER,
+            port=conf.MAIL_PORT,
+            use_tls=conf.MAIL_SSL_TLS,
+            start_tls=conf.MAIL_STARTTLS,
+            validate_certs=conf.VALIDATE_CERTS,
+        )
+        await smtp.connect()
+        if conf.USE_CREDENTIALS:
+            await smtp.login(conf.MAIL_USERNAME, conf.MAIL_PASSWORD.get_secret_value())
+        metrics.smtp_connections += 1
+        return smtp
+
+    async def send(self, message: EmailMessage):
+        if self._smtp is None or not self._smtp.is_connected:
+            self._smtp = await self._connect()
+        try:
+            await self._smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # The server dropped an idle session; reconnect once and retry
+            self._smtp = await self._connect()
+            await self._smtp.send_message(message)
+        self._last_used = time.monotonic()
+
+    async def close_if_idle(self):
+        if self._smtp is not None and time.monotonic() - self._last_used > SMTP_IDLE_TIMEOUT_SECONDS:
+            await self.close()
+
+    async def close(self):
+        if self._smtp is not None:
+            try:
+                await self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+
+def _to_email_message(outbox: EmailOutbox) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = outbox.subject
+    message["From"] = conf.MAIL_FROM
+    message["To"] = ", ".join(outbox.recipients)
+    message.set_content(outbox.body, subtype="html")
+    return message
+
+
+async def _claim_batch(limit: int) -> List[EmailOutbox]:
+    """Atomically reserves up to `limit` due messages for this worker."""
+    collection = EmailOutbox.get_motor_collection()
+    now = datetime.utcnow()
+    claimed = []
+    for _ in range(limit):
+        raw = await collection.find_one_and_update(
+            {"$or": [
+                {"status": "pending", "nextAttemptAt": {"$lte": now}},
+                {"status": "sending", "lockedUntil": {"$lt": now}},  # a worker died mid-batch
+            ]},
+            {"$set": {"status": "sending", "lockedUntil": now + timedelta(seconds=EMAIL_CLAIM_SECONDS)}},
+            sort=[("nextAttemptAt", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+        if raw is None:
+            break
+        claimed.append(parse_obj(EmailOutbox, raw))
+    return claimed
+
+
+def _expire_at(now: datetime) -> datetime:
+    return now + timedelta(days=EMAIL_OUTBOX_RETENTION_DAYS)
+
+
+async def _mark_sent(outbox: EmailOutbox):
+    now = datetime.utcnow()
+    await EmailOutbox.get_motor_collection().update_one(
+        {"_id": outbox.id},
+        {"$set": {"status": "sent", "sentAt": now, "lockedUntil": None, "expireAt": _expire_at(now)}, "$inc": {"attempts": 1}}
+    )
+
+
+async def _mark_failed(outbox: EmailOutbox, error: Exception):
+    attempts = outbox.attempts + 1
+    if attempts >= EMAIL_MAX_ATTEMPTS:
+        update = {"status": "failed", "lastError": str(error), "lockedUntil": None, "attempts": attempts, "expireAt": _expire_at(datetime.utcnow())}
+        metrics.failed += 1
+        logger.error(f"Email {outbox.idempotency_key} to {outbox.recipients} failed permanently after {attempts} attempts: {error}")
+    else:
+        delay = min(EMAIL_RETRY_BASE_SECONDS * (2 ** (attempts - 1)), EMAIL_RETRY_MAX_SECONDS)
+        update = {
+            "status": "pending",
+            "lastError": str(error),
+            "lockedUntil": None,
+            "attempts": attempts,
+            "nextAttemptAt": datetime.utcnow() + timedelta(seconds=delay),
+        }
+        metrics.retried += 1
+        logger.warning(f"Email {outbox.idempotency_key} to {outbox.recipients} failed (attempt {attempts}); retrying in {delay:.0f}s: {error}")
+    await EmailOutbox.get_motor_collection().update_one({"_id": outbox.id}, {"$set": update})
+
+
+async def drain_once(connection: SMTPConnection, batch_size: int = EMAIL_BATCH_SIZE) -> int:
+    """Sends one batch of due messages. Returns how many were claimed."""
+    batch = await _claim_batch(batch_size)
+    if not batch:
+        return 0
+    metrics.batches += 1
+    for outbox in batch:
+        try:
+            await connection.send(_to_email_message(outbox))
+            await _mark_sent(outbox)
+            metrics.record_sent()
+        except Exception as e:
+            await _mark_failed(outbox, e)
+    return len(batch)
+
+
+async def run_email_worker():
+    """Drains the outbox forever; started from main.lifespan on every worker (claims are atomic)."""
+    logger.info(f"Email outbox worker started. Batch size: {EMAIL_BATCH_SIZE}.")
+    connection = SMTPConnection()
+    try:
+        while True:
+            try:
+                claimed = await drain_once(connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Email outbox worker error: {e}", exc_info=True)
+                claimed = 0
+            if claimed < EMAIL_BATCH_SIZE:
+                await connection.close_if_idle()
+                await asyncio.sleep(EMAIL_POLL_INTERVAL_SECONDS)
+    finally:
+        await connection.close()
@@ -1,12 +1,16 @@
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 from pydantic import EmailStr
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+import logging
 import os
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 conf = ConnectionConfig(
     MAIL_USERNAME=os.getenv("MAIL_USERNAME"),
     MAIL_PASSWORD=os.getenv("MAIL_PASSWORD"),
@@ -21,7 +25,27 @@ conf = ConnectionConfig(
 
 fm = FastMail(conf)
 
+EMAIL_TEMPLATE_DIR = os.getenv("EMAIL_TEMPLATE_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates", "email"))
+# Optional directory for compiled template bytecode, so restarts skip parsing
+EMAIL_TEMPLATE_CACHE_DIR = os.getenv("EMAIL_TEMPLATE_CACHE_DIR")
+
+VERIFICATION_TEMPLATE = "verification.html"
+REPORT_TEMPLATE = "report.html"
+REPORTED_USER_TEMPLATE = "reported_user.html"
+
+template_env = Environment(
+    loader=FileSystemLoader(EMAIL_TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),  # names and reasons are user-supplied
+    bytecode_cache=FileSystemBytecodeCache(EMAIL_TEMPLATE_CACHE_DIR) if EMAIL_TEMPLATE_CACHE_DIR else None,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+# Compiled once at import; rendering never touches the filesystem again
+templates = {name: template_env.get_template(name) for name in (VERIFICATION_TEMPLATE, REPORT_TEMPLATE, REPORTED_USER_TEMPLATE)}
+
 async def send_email_async(subject: str, recipients: List[EmailStr], body: str):
+    """Sends one message immediately. Request handlers queue mail through services.email_outbox instead."""
     message = MessageSchema(
         subject=subject,
         recipients=recipients,
@@ -30,98 +54,29 @@ async def send_email_async(subject: str, recipients: List[EmailStr], body: str):
     )
     try:
         await fm.send_message(message)
-        print(f"Email sent to {recipients} with subject: {subject}")
+        logger.info(f"Email sent to {recipients} with subject: {subject}")
     except Exception as e:
-        print(f"Failed to send email: {e}")
+        logger.error(f"Failed to send email: {e}")
+
+def render_email(template_name: str, **context: Any) -> str:
+    return templates[template_name].render(**context)
+
+def render_emails(template_name: str, contexts: Iterable[Dict[str, Any]]) -> List[str]:
+    """Renders one precompiled template for many recipients, e.g. the bodies of a bulk decision."""
+    template = templates[template_name]
+    return [template.render(**context) for context in contexts]
 
 def get_verification_email_body(name: str, status: str, reason: Optional[str] = None) -> str:
     """Generates HTML email body for application verification status."""
-    status_action = "approved" if status == "verified" else status
-    
-    html_body = f"""
-    <p>Dear {name},</p>
-    """
-    if status == "verified":
-        html_body += f"""
-        <p>Congratulations! Your application for Trabahanap has been <strong>{status_action}</strong>.</p>
-        <p>You can now log in and access all features available to verified users.</p>
-        """
-    elif status == "rejected":
-        html_body += f"""
-        <p>We regret to inform you that your application for Trabahanap has been <strong>{status_action}</strong>.</p>
-        """
-        if reason:
-            html_body += f"<p>Reason: {reason}</p>"
-        html_body += "<p>If you believe this was a mistake or have further questions, please contact our support team.</p>"
-    
-    html_body += """
-    <p>Thank you for your interest in Trabahanap.</p>
-    <p>Regards,<br>The Trabahanap Team</p>
-    """
-    return html_body
+    return render_email(VERIFICATION_TEMPLATE, name=name, status=status, reason=reason)
 
 def get_report_email_body(reporter_name: str, report_status: str, reported_item_info: str, reason: Optional[str] = None) -> str:
     """Generates HTML email body for user report status."""
-    action_taken_text = "taken appropriate action based on your report" if report_status == "approved" else "decided not to take action at this time"
-    
-    html_body = f"""
-    <p>Dear {reporter_name},</p>
-    <p>Thank you for your report regarding: <strong>{reported_item_info}</strong>.</p>
-    <p>We have reviewed your report. After careful consideration, we have <strong>{action_taken_text}</strong>.</p>
-    """
-    
-    if report_status == "rejected" and reason:
-        html_body += f"<p>Reason for this decision: {reason}</p>"
-    elif report_status == "approved" and reason: # Optional: provide reason for approval action
-        html_body += f"<p>Details regarding the action taken: {reason}</p>"
-
-    html_body += """
-    <p>Your efforts help us maintain a safe and respectful community on Trabahanap. If you have further concerns, please don't hesitate to reach out.</p>
-    <p>Regards,<br>The Trabahanap Team</p>
-    """
-    return html_body
+    return render_email(REPORT_TEMPLATE, reporter_name=reporter_name, report_status=report_status, reported_item_info=reported_item_info, reason=reason)
 
 def get_notification_for_reported_user_body(reported_user_name: str, reported_item_info: str, report_reason: str) -> str:
     """
     Generates the HTML email body for a user who was reported, after the report against them has been approved.
     Does not reveal the identity of the reporter.
     """
-    html_content = f"""
-    <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; color: #333; }}
-                .container {{ background-color: #f9f9f9; padding: 20px; border-radius: 5px; }}
-                .header {{ color: #2c3e50; }}
-                .content p {{ line-height: 1.6; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h2 class="header">Notification Regarding Your Account/Content on Trabahanap</h2>
-                <div class="content">
-                    <p>Dear {reported_user_name},</p>
-                    <p>This email is to inform you that action has been taken regarding a report concerning your account or content on Trabahanap. Specifically, a report related to: <strong>{reported_item_info}</strong> for the following reason: <em>{report_reason}</em>.</p>
-                    <p>Our team has reviewed the report and has taken appropriate action in accordance with our community guidelines and terms of service.</p>
-                    <p>We encourage you to review our policies to ensure a safe and respectful environment for all users. If you have questions or believe there has been a misunderstanding, please contact our support team through the app.</p>
-                    <p>Thank you for your understanding and cooperation.</p>
-                    <p>Sincerely,<br>The Trabahanap Team</p>
-                </div>
-            </div>
-        </body>
-    </html>
-    """
-    return html_content
-
-async def send_email_async(subject: str, recipients: List[EmailStr], body: str):
-    message = MessageSchema(
-        subject=subject,
-        recipients=recipients,
-        body=body,
-        subtype="html"  # Send emails as HTML
-    )
-    try:
-        await fm.send_message(message)
-        print(f"Email sent to {recipients} with subject: {subject}")
-    except Exception as e:
-        print(f"Failed to send email: {e}")
+    return render_email(REPORTED_USER_TEMPLATE, reported_user_name=reported_user_name, reported_item_info=reported_item_info, report_reason=report_reason)
@@ -0,0 +1,175 @@
+"""
+Streaming exports of whole collections for compliance and analytics pulls.
+
+Documents are read from a Motor cursor in `EXPORT_BATCH_SIZE` batches and written out one
+batch at a time as NDJSON or CSV, optionally gzipped, so memory stays flat however large
+the collection is. Only whitelisted fields are exported; passwords and ID images never are.
+CSV cells that a spreadsheet would run as a formula are prefixed with a quote.
+"""
+import csv
+import io
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from beanie import Document
+from bson import ObjectId
+from dotenv import load_dotenv
+from fastapi import HTTPException
+
+from admin_api.models.documents import Applicant, User, Job, ReportValidation
+from admin_api.utils.json_encoding import dumps_bytes
+
+load_dotenv()
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# Leading characters that make Excel, LibreOffice and Sheets evaluate a cell as a formula
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    model: Type[Document]
+    date_field: str
+    status_field: str
+    fields: Tuple[str, ...]
+
+
+EXPORT_SPECS: Dict[str, ExportSpec] = {
+    "applicants": ExportSpec(
+        model=Applicant,
+        date_field="joinedAt",
+        status_field="verificationStatus",
+        fields=("_id", "firstName", "middleName", "lastName", "suffixName", "gender", "age", "emailAddress", "phoneNumber",
+                "barangay", "street", "houseNumber", "userType", "idType", "jobsDone", "joinedAt", "verificationStatus"),
+    ),
+    "users": ExportSpec(
+        model=User,
+        date_field="joinedAt",
+        status_field="verificationStatus",
+        fields=("_id", "firstName", "middleName", "lastName", "suffixName", "gender", "age", "emailAddress", "barangay",
+                "street", "houseNumber", "userType", "idType", "jobsDone", "joinedAt", "verificationStatus", "verifiedAt"),
+    ),
+    "jobs": ExportSpec(
+        model=Job,
+        date_field="datePosted",
+        status_field="jobStatus",
+        fields=("_id", "clientId", "applicantCount", "jobTitle", "jobDescription", "category", "jobLocation", "jobStatus",
+                "budget", "jobDuration", "datePosted", "acceptedAt", "completedAt", "verifiedAt", "jobRating", "jobReview",
+                "jobSeekerId", "offer"),
+    ),
+    "reports": ExportSpec(
+        model=ReportValidation,
+        date_field="dateReported",
+        status_field="status",
+        fields=("_id", "reportedObjectId", "reporter", "reason", "status", "dateReported", "dateApproved"),
+    ),
+}
+
+
+def get_export_spec(collection: str) -> ExportSpec:
+    spec = EXPORT_SPECS.get(collection)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"Unknown export collection '{collection}'. Available: {', '.join(EXPORT_SPECS)}")
+    return spec
+
+
+def select_fields(spec: ExportSpec, fields: Optional[str]) -> List[str]:
+    """Parses a comma-separated field list against the collection's whitelist; all of it when omitted."""
+    if not fields:
+        return list(spec.fields)
+    selected = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in selected if field not in spec.fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Fields not exportable: {', '.join(unknown)}. Allowed: {', '.join(spec.fields)}")
+    return selected
+
+
+def build_export_filter(spec: ExportSpec, start: Optional[datetime], end: Optional[datetime], status: Optional[str]) -> Dict[str, Any]:
+    query: Dict[str, Any] = {}
+    if start or end:
+        date_range = {}
+        if start:
+            date_range["$gte"] = start
+        if end:
+            date_range["$lt"] = end
+        query[spec.date_field] = date_range
+    if status:
+        query[spec.status_field] = status
+    return query
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _ndjson_chunk(docs: List[Dict[str, Any]], fields: List[str]) -> bytes:
+    return b"".join(dumps_bytes({field: doc.get(field) for field in fields}) + b"\n" for doc in docs)
+
+
+def _csv_chunk(docs: List[Dict[str, Any]], fields: List[str], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(fields)
+    for doc in docs:
+        writer.writerow([_csv_value(doc.get(field)) for field in fields])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def stream_export(
+    spec: ExportSpec,
+    query: Dict[str, Any],
+    fields: List[str],
+    export_format: str,
+    gzip: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yields the export one encoded (and optionally gzipped) batch at a time."""
+    projection = {field: 1 for field in fields}
+    if "_id" not in fields:
+        projection["_id"] = 0
+    cursor = spec.model.get_motor_collection().find(query, projection).sort("_id", 1).batch_size(batch_size)
+    compressor = zlib.compressobj(wbits=31) if gzip else None  # wbits=31 writes a gzip header
+
+    def encode(docs: List[Dict[str, Any]], first: bool) -> bytes:
+        if export_format == "csv":
+            chunk = _csv_chunk(docs, fields, header=first)
+        else:
+            chunk = _ndjson_chunk(docs, fields)
+        return compressor.compress(chunk) if compressor else chunk
+
+    batch: List[Dict[str, Any]] = []
+    first = True
+    try:
+        async for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                chunk = encode(batch, first)
+                first, batch = False, []
+                if chunk:
+                    yield chunk
+        if batch or (first and export_format == "csv"):
+            chunk = encode(batch, first)  # a CSV export always has its header row
+            if chunk:
+                yield chunk
+        if compressor:
+            yield compressor.flush()
+    finally:
+        await cursor.close()
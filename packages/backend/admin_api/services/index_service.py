@@ -0,0 +1,142 @@
+"""
+Index diagnostics: compares the indexes declared on the Beanie documents with the ones
+that exist in MongoDB, and explains the hot queries to show whether they are index-backed.
+A query is index-backed only when its plan has neither a COLLSCAN nor a blocking SORT stage.
+
+Run from `packages/backend` as a CLI:
+
+    python -m admin_api.services.index_service
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple, Type
+
+import pymongo
+from beanie import Document, PydanticObjectId
+
+from admin_api.models.documents import Admin, User, Job, Applicant, ApplicantJobSeeker, JobSeeker, ReportValidation
+from admin_api.utils.pagination import keyset_after, keyset_sort
+
+
+def _declared_index_keys(document_model: Type[Document]) -> List[List[Tuple[str, Any]]]:
+    settings = getattr(document_model, "Settings", None)
+    keys = []
+    for index in getattr(settings, "indexes", []) or []:
+        if isinstance(index, pymongo.IndexModel):
+            keys.append(list(index.document["key"].items()))
+        elif isinstance(index, str):
+            keys.append([(index, pymongo.ASCENDING)])
+        else:
+            keys.append([tuple(part) if isinstance(part, (list, tuple)) else (part, pymongo.ASCENDING) for part in index])
+    return keys
+
+
+async def get_index_report(document_models: List[Type[Document]]) -> List[Dict[str, Any]]:
+    """Lists, per collection, the declared indexes and which of them are missing in the database."""
+    report = []
+    for document_model in document_models:
+        collection = document_model.get_motor_collection()
+        existing_info = await collection.index_information()
+        existing_keys = [[(field, direction) for field, direction in info["key"]] for info in existing_info.values()]
+        declared_keys = _declared_index_keys(document_model)
+        # Text indexes are stored under _fts/_ftsx keys, so those are matched by name
+        declared_names = [index.document.get("name") if isinstance(index, pymongo.IndexModel) else None
+                          for index in getattr(getattr(document_model, "Settings", None), "indexes", []) or []]
+        missing = [key for key, name in zip(declared_keys, declared_names) if key not in existing_keys and name not in existing_info]
+        report.append({
+            "collection": collection.name,
+            "declared": [dict(key) for key in declared_keys],
+            "existing": sorted(existing_info.keys()),
+            "missing": [dict(key) for key in missing],
+        })
+    return report
+
+
+def _keyset_page(filters: Dict[str, Any], field: str, direction: int, last_value: Any) -> Dict[str, Any]:
+    """A page after the first, as paginate() and the pollers query it: the filters plus the (field, _id) keyset."""
+    after = keyset_after(field, direction, last_value, PydanticObjectId())
+    return {"filter": {"$and": [filters, after]} if filters else after, "sort": keyset_sort(field, direction)}
+
+
+def _hot_queries() -> List[Dict[str, Any]]:
+    """The filters/sorts run on every request or poll cycle, shaped exactly as the code sends them."""
+    now = datetime.utcnow()
+    recent = now - timedelta(minutes=1)
+    year_ago = now - timedelta(days=365)
+    asc, desc = pymongo.ASCENDING, pymongo.DESCENDING
+    return [
+        {"name": "poll_new_applicants", "model": Applicant,
+         **_keyset_page({"verificationStatus": "pending"}, "joinedAt", asc, recent)},
+        {"name": "poll_new_reports", "model": ReportValidation,
+         **_keyset_page({"status": "pending"}, "dateReported", asc, recent)},
+        {"name": "get_all_applicants", "model": Applicant, **_keyset_page({}, "joinedAt", desc, now)},
+        {"name": "get_pending_reports", "model": ReportValidation, **_keyset_page({"status": "pending"}, "dateReported", desc, now)},
+        {"name": "get_all_reports", "model": ReportValidation, **_keyset_page({}, "dateReported", desc, now)},
+        {"name": "get_all_job_requests", "model": Job, **_keyset_page({}, "datePosted", desc, now)},
+        {"name": "get_monthly_applications", "model": Applicant,
+         "filter": {"joinedAt": {"$gte": year_ago}}, "sort": None},
+        {"name": "get_monthly_users", "model": User,
+         "filter": {"verifiedAt": {"$gte": year_ago}}, "sort": None},
+        {"name": "user_by_email", "model": User, "filter": {"emailAddress": "someone@example.com"}, "sort": None},
+        {"name": "admin_by_email", "model": Admin, "filter": {"email": "someone@example.com"}, "sort": None},
+        {"name": "jobseeker_by_user", "model": JobSeeker, "filter": {"userId": None}, "sort": None},
+        {"name": "applicant_jobseeker_by_applicant", "model": ApplicantJobSeeker, "filter": {"applicantId": ""}, "sort": None},
+    ]
+
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Flattens a winning plan into its stage names, outermost first (e.g. FETCH, IXSCAN)."""
+    stages = [plan.get("stage", "?")]
+    if "inputStage" in plan:
+        stages += _plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += _plan_stages(child)
+    return stages
+
+
+def is_index_backed(stages: List[str]) -> bool:
+    """SORT buffers and sorts every match in memory; SORT_MERGE only merges index-ordered streams."""
+    return "COLLSCAN" not in stages and "SORT" not in stages
+
+
+async def explain_hot_queries() -> List[Dict[str, Any]]:
+    """Runs explain() for each hot query and summarises whether it used an index."""
+    results = []
+    for query in _hot_queries():
+        cursor = query["model"].get_motor_collection().find(query["filter"])
+        if query["sort"]:
+            cursor = cursor.sort(query["sort"])
+        explain = await cursor.limit(100).explain()
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        # Sharded/SBE explain output nests the classic plan under queryPlan
+        winning_plan = winning_plan.get("queryPlan", winning_plan)
+        stages = _plan_stages(winning_plan)
+        stats = explain.get("executionStats", {})
+        results.append({
+            "query": query["name"],
+            "collection": query["model"].get_motor_collection().name,
+            "stages": stages,
+            "blocking_sort": "SORT" in stages,
+            "index_backed": is_index_backed(stages),
+            "docs_examined": stats.get("totalDocsExamined"),
+            "keys_examined": stats.get("totalKeysExamined"),
+            "returned": stats.get("nReturned"),
+            "execution_ms": stats.get("executionTimeMillis"),
+        })
+    return results
+
+
+async def _main():
+    from admin_api.database import init_db, DOCUMENT_MODELS
+    # Skip the startup index build so the report shows what is actually missing
+    await init_db(skip_indexes=True)
+    report = {
+        "indexes": await get_index_report(DOCUMENT_MODELS),
+        "hot_queries": await explain_hot_queries(),
+    }
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
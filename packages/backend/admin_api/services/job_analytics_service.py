@@ -0,0 +1,180 @@
+"""
+Job request analytics computed inside MongoDB, so the dashboard receives a few kilobytes of
+aggregates instead of every job. Every pipeline starts with a `$match` on an indexed field
+(datePosted, acceptedAt, completedAt or the partial jobSeekerId/jobRating index). Counts and
+durations always cover a datePosted window: the last JOB_ANALYTICS_DEFAULT_DAYS unless a start is given.
+"""
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from beanie import PydanticObjectId
+from beanie.operators import In
+from pymongo.errors import OperationFailure
+
+from admin_api.models.documents import Job, JobSeeker, JobCounts, DimensionCount, DurationStats, JobDurations, SeekerRating
+from admin_api.services.report_service import resolve_user_names
+
+logger = logging.getLogger(__name__)
+
+JOB_ANALYTICS_TOP_N = 50
+JOB_ANALYTICS_DEFAULT_DAYS = int(os.getenv("JOB_ANALYTICS_DEFAULT_DAYS", 365))
+PERCENTILES = (0.5, 0.9, 0.99)
+MS_PER_HOUR = 3_600_000
+
+# Set once the server rejects `$percentile` (MongoDB < 7.0), so the fallback is used from then on
+_percentile_supported: Optional[bool] = None
+
+
+def _posted_range(start: Optional[datetime], end: Optional[datetime]) -> Dict[str, Any]:
+    """The datePosted window; without a start it opens JOB_ANALYTICS_DEFAULT_DAYS before `end` (or now)."""
+    if start is None:
+        start = (end or datetime.utcnow()) - timedelta(days=JOB_ANALYTICS_DEFAULT_DAYS)
+    date_range: Dict[str, Any] = {"$gte": start}
+    if end:
+        date_range["$lt"] = end
+    return {"datePosted": date_range}
+
+
+def _top_counts(field: str, limit: int = JOB_ANALYTICS_TOP_N) -> List[Dict[str, Any]]:
+    return [
+        {"$group": {"_id": {"$ifNull": [f"${field}", "unknown"]}, "count": {"$sum": 1}}},
+        {"$sort": {"count": -1, "_id": 1}},
+        {"$limit": limit},
+    ]
+
+
+def _to_dimension_counts(groups: List[Dict[str, Any]]) -> List[DimensionCount]:
+    return [DimensionCount(key=str(group["_id"]), count=group["count"]) for group in groups]
+
+
+async def get_job_counts(start: Optional[datetime] = None, end: Optional[datetime] = None) -> JobCounts:
+    """Job counts by status, and the top categories and locations, in one `$facet` pass."""
+    pipeline = [
+        {"$match": _posted_range(start, end)},
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "by_status": _top_counts("jobStatus"),
+            "by_category": _top_counts("category"),
+            "by_location": _top_counts("jobLocation"),
+        }},
+    ]
+    result = await Job.aggregate(pipeline).to_list()
+    facets = result[0] if result else {}
+    total = facets.get("total") or []
+    return JobCounts(
+        total=total[0]["n"] if total else 0,
+        by_status=_to_dimension_counts(facets.get("by_status", [])),
+        by_category=_to_dimension_counts(facets.get("by_category", [])),
+        by_location=_to_dimension_counts(facets.get("by_location", [])),
+    )
+
+
+def _duration_match(to_field: str, start: Optional[datetime], end: Optional[datetime]) -> Dict[str, Any]:
+    # The type check on the sparse to_field index selects the jobs that reached that stage
+    posted: Dict[str, Any] = {"$type": "date"}
+    posted.update(_posted_range(start, end).get("datePosted", {}))
+    return {to_field: {"$type": "date"}, "datePosted": posted}
+
+
+def _hours_expression(to_field: str) -> Dict[str, Any]:
+    return {"$divide": [{"$subtract": [f"${to_field}", "$datePosted"]}, MS_PER_HOUR]}
+
+
+async def _duration_stats_native(to_field: str, match: Dict[str, Any]) -> DurationStats:
+    pipeline = [
+        {"$match": match},
+        {"$project": {"hours": _hours_expression(to_field)}},
+        {"$group": {
+            "_id": None,
+            "count": {"$sum": 1},
+            "avg": {"$avg": "$hours"},
+            "percentiles": {"$percentile": {"input": "$hours", "p": list(PERCENTILES), "method": "approximate"}},
+        }},
+    ]
+    result = await Job.aggregate(pipeline).to_list()
+    if not result:
+        return DurationStats(count=0)
+    group = result[0]
+    p50, p90, p99 = group["percentiles"]
+    return DurationStats(count=group["count"], avg_hours=group["avg"], p50_hours=p50, p90_hours=p90, p99_hours=p99)
+
+
+async def _duration_stats_sorted(to_field: str, match: Dict[str, Any]) -> DurationStats:
+    """Pre-7.0 fallback: count and average first, then every percentile rank from one sorted pass."""
+    summary = await Job.aggregate([
+        {"$match": match},
+        {"$group": {"_id": None, "count": {"$sum": 1}, "avg": {"$avg": _hours_expression(to_field)}}},
+    ]).to_list()
+    if not summary:
+        return DurationStats(count=0)
+    count, avg = summary[0]["count"], summary[0]["avg"]
+    # One sort feeds every rank: each $facet branch skips into the same sorted stream
+    ranks = [min(count - 1, int(round(p * (count - 1)))) for p in PERCENTILES]
+    ranked = await Job.aggregate([
+        {"$match": match},
+        {"$project": {"_id": 0, "hours": _hours_expression(to_field)}},
+        {"$sort": {"hours": 1}},
+        {"$facet": {f"p{i}": [{"$skip": rank}, {"$limit": 1}] for i, rank in enumerate(ranks)}},
+    ], allowDiskUse=True).to_list()
+    facets = ranked[0] if ranked else {}
+    values = [(facets.get(f"p{i}") or [{}])[0].get("hours") for i in range(len(ranks))]
+    return DurationStats(count=count, avg_hours=avg, p50_hours=values[0], p90_hours=values[1], p99_hours=values[2])
+
+
+async def _duration_stats(to_field: str, start: Optional[datetime], end: Optional[datetime]) -> DurationStats:
+    global _percentile_supported
+    match = _duration_match(to_field, start, end)
+    if _percentile_supported is not False:
+        try:
+            stats = await _duration_stats_native(to_field, match)
+            _percentile_supported = True
+            return stats
+        except OperationFailure as e:
+            logger.info(f"$percentile unavailable ({e.code}); using the sorted percentile fallback.")
+            _percentile_supported = False
+    return await _duration_stats_sorted(to_field, match)
+
+
+async def get_job_durations(start: Optional[datetime] = None, end: Optional[datetime] = None) -> JobDurations:
+    """Time-to-accept (datePosted -> acceptedAt) and time-to-complete (datePosted -> completedAt) in hours."""
+    return JobDurations(
+        time_to_accept=await _duration_stats("acceptedAt", start, end),
+        time_to_complete=await _duration_stats("completedAt", start, end),
+    )
+
+
+async def _resolve_seeker_names(seeker_ids: List[PydanticObjectId]) -> Dict[PydanticObjectId, str]:
+    """jobSeekerId may hold a user id or a jobseekers id; both are resolved with batched `$in` queries."""
+    names = await resolve_user_names(seeker_ids)
+    unresolved = [seeker_id for seeker_id in seeker_ids if seeker_id not in names]
+    if unresolved:
+        profiles = await JobSeeker.find(In(JobSeeker.id, unresolved)).to_list()
+        profile_names = await resolve_user_names(profile.user_id for profile in profiles)
+        for profile in profiles:
+            if profile.user_id in profile_names:
+                names[profile.id] = profile_names[profile.user_id]
+    return names
+
+
+async def get_seeker_ratings(limit: int = JOB_ANALYTICS_TOP_N, min_jobs: int = 1, ascending: bool = False) -> List[SeekerRating]:
+    """Average jobRating per job seeker, best (or worst) first, answered from the partial rating index."""
+    pipeline = [
+        {"$match": {"jobRating": {"$type": "number"}, "jobSeekerId": {"$ne": None}}},
+        {"$group": {"_id": "$jobSeekerId", "average": {"$avg": "$jobRating"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gte": min_jobs}}},
+        {"$sort": {"average": 1 if ascending else -1, "count": -1, "_id": 1}},
+        {"$limit": limit},
+    ]
+    groups = await Job.aggregate(pipeline).to_list()
+    names = await _resolve_seeker_names([group["_id"] for group in groups])
+    return [
+        SeekerRating(
+            job_seeker_id=str(group["_id"]),
+            name=names.get(group["_id"]),
+            average_rating=round(group["average"], 2),
+            rated_jobs=group["count"],
+        )
+        for group in groups
+    ]
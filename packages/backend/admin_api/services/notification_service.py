@@ -0,0 +1,193 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Set
+
+from dotenv import load_dotenv
+from fastapi import WebSocket
+
+from admin_api.services.broker import create_broker
+from admin_api.utils.json_encoding import dumps_bytes
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Outbound frames buffered per admin connection before the overflow policy applies
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", 100))
+# What to do when a client's queue is full:
+#   "drop"       - discard the oldest queued frame to make room for the new one
+#   "coalesce"   - fold everything queued plus the new frame into a single notification_batch frame
+#   "disconnect" - close the connection; the client reconnects and reloads its data
+WS_OVERFLOW_POLICY = os.getenv("WS_OVERFLOW_POLICY", "coalesce").lower()
+
+# Close code sent to clients disconnected for falling behind (1013: try again later)
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+# Plural labels used in the summary message of a batched notification
+BATCH_LABELS = {
+    "new_verification_request": "new verification requests",
+    "new_report_filed": "new reports filed",
+    "verification_approved": "applicants verified",
+    "verification_rejected": "applicants rejected",
+    "report_approved": "reports approved",
+    "report_rejected": "reports rejected",
+}
+
+
+class ClientConnection:
+    """One admin WebSocket with its own bounded outbound queue and writer task."""
+
+    def __init__(self, websocket: WebSocket, max_queue: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.writer_task: Optional[asyncio.Task] = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "client": str(self.websocket.client),
+            "queue_depth": self.queue.qsize(),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+
+class ConnectionManager:
+    def __init__(self, max_queue: int = WS_QUEUE_SIZE, overflow_policy: str = WS_OVERFLOW_POLICY):
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
+        self.max_queue = max_queue
+        self.overflow_policy = overflow_policy
+        self.disconnected_slow_clients = 0
+        # Close handshakes in flight; the loop only holds weak references to tasks
+        self._close_tasks: Set[asyncio.Task] = set()
+        # Counters of connections that have already gone away, so totals stay monotonic
+        self._closed_sent = 0
+        self._closed_dropped = 0
+        self._closed_coalesced = 0
+
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        connection = ClientConnection(websocket, self.max_queue)
+        connection.writer_task = asyncio.create_task(self._writer(connection))
+        self.active_connections[websocket] = connection
+        logger.info(f"New WebSocket connection: {websocket.client}. Total connections: {len(self.active_connections)}")
+
+    def disconnect(self, websocket: WebSocket):
+        connection = self.active_connections.pop(websocket, None)
+        if connection:
+            self._closed_sent += connection.sent
+            self._closed_dropped += connection.dropped
+            self._closed_coalesced += connection.coalesced
+            if connection.writer_task and connection.writer_task is not asyncio.current_task():
+                connection.writer_task.cancel()
+            logger.info(f"WebSocket disconnected: {websocket.client}. Total connections: {len(self.active_connections)}")
+
+    async def _writer(self, connection: ClientConnection):
+        """Drains one connection's queue; a slow or broken socket only ever blocks this task."""
+        try:
+            while True:
+                message = await connection.queue.get()
+                # Binary frame of the shared bytes: nothing is re-encoded per socket
+                await connection.websocket.send_bytes(message)
+                connection.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending to {connection.websocket.client}: {e}. Disconnecting.")
+            self.disconnect(connection.websocket)
+
+    def _coalesce(self, connection: ClientConnection, message: bytes) -> bytes:
+        """Splices every queued frame and the new one into a single batch frame without re-parsing them."""
+        frames: List[bytes] = []
+        while not connection.queue.empty():
+            frames.append(connection.queue.get_nowait())
+        frames.append(message)
+        connection.coalesced += len(frames)
+        summary = json.dumps(f"{len(frames)} notifications arrived while you were catching up.")
+        header = f'{{"type": "notification_batch", "message": {summary}, "details": {{"count": {len(frames)}, "items": ['.encode()
+        return header + b", ".join(frames) + b"]}}"
+
+    def _enqueue(self, connection: ClientConnection, message: bytes):
+        try:
+            connection.queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == "disconnect":
+            logger.warning(f"WebSocket {connection.websocket.client} fell behind ({connection.queue.qsize()} queued). Disconnecting.")
+            self.disconnected_slow_clients += 1
+            self.disconnect(connection.websocket)
+            close_task = asyncio.create_task(self._close(connection.websocket))
+            self._close_tasks.add(close_task)
+            close_task.add_done_callback(self._close_tasks.discard)
+        elif self.overflow_policy == "coalesce":
+            connection.queue.put_nowait(self._coalesce(connection, message))
+        else:
+            connection.queue.get_nowait()
+            connection.dropped += 1
+            connection.queue.put_nowait(message)
+
+    async def _close(self, websocket: WebSocket):
+        try:
+            await websocket.close(code=SLOW_CLIENT_CLOSE_CODE, reason="Client too slow")
+        except Exception:
+            pass
+
+    async def broadcast(self, message: bytes):
+        """Queues `message` for every connection without waiting on any socket."""
+        for connection in list(self.active_connections.values()):
+            self._enqueue(connection, message)
+
+    def stats(self) -> Dict[str, Any]:
+        connections = [connection.stats() for connection in self.active_connections.values()]
+        return {
+            "connections": len(connections),
+            "overflow_policy": self.overflow_policy,
+            "max_queue": self.max_queue,
+            "total_queued": sum(c["queue_depth"] for c in connections),
+            "total_sent": self._closed_sent + sum(c["sent"] for c in connections),
+            "total_dropped": self._closed_dropped + sum(c["dropped"] for c in connections),
+            "total_coalesced": self._closed_coalesced + sum(c["coalesced"] for c in connections),
+            "disconnected_slow_clients": self.disconnected_slow_clients,
+            "clients": connections,
+        }
+
+
+manager = ConnectionManager()
+
+# Carries frames to the connections of every worker; started in main.lifespan
+broker = create_broker(manager.broadcast)
+
+
+def batch_notification(notifications: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Folds several notifications into the arguments of a single broadcast.
+    A batch keeps the common `type` when all items share it (so the client routes it as before),
+    otherwise it is sent as "notification_batch". The individual notifications are in `details.items`.
+    """
+    if len(notifications) == 1:
+        return notifications[0]
+    types = {notification["type"] for notification in notifications}
+    counts: Dict[str, int] = {}
+    for notification in notifications:
+        counts[notification["type"]] = counts.get(notification["type"], 0) + 1
+    summary = ", ".join(f"{count} {BATCH_LABELS.get(type_, type_.replace('_', ' '))}" for type_, count in counts.items())
+    return {
+        "type": types.pop() if len(types) == 1 else "notification_batch",
+        "message": f"{summary}.",
+        "details": {"count": len(notifications), "items": notifications}
+    }
+
+
+async def broadcast_notification(type: str, message: str, details: Dict[str, Any] = None):
+    payload = {"type": type, "message": message, "details": details or {}}
+    logger.info(f"Broadcasting notification: {type}")
+    logger.debug(f"Notification payload: {payload}")
+    # Serialised once per event; every worker and connection shares the same frame bytes
+    await broker.publish(dumps_bytes(payload))
@@ -0,0 +1,125 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from beanie import PydanticObjectId
+from beanie.operators import In
+
+from admin_api.models.documents import User, UserNameView, UserContactView, ReportValidation, ReportResponse, FinalReport
+
+
+def format_full_name(user: UserNameView) -> str:
+    """Joins the non-empty name parts of a user into a display name."""
+    name_parts = [user.first_name, user.middle_name, user.last_name, user.suffix_name]
+    return " ".join(part for part in name_parts if part).strip()
+
+
+async def resolve_user_names(user_ids: Iterable[Optional[PydanticObjectId]]) -> Dict[PydanticObjectId, str]:
+    """
+    Resolves display names for many users with a single `$in` query.
+    Users without any name parts fall back to "User ID: <id>". Ids that do not
+    belong to a user are simply absent from the returned map.
+    """
+    unique_ids = list({user_id for user_id in user_ids if user_id})
+    if not unique_ids:
+        return {}
+
+    users = await User.find(In(User.id, unique_ids)).project(UserNameView).to_list()
+    names: Dict[PydanticObjectId, str] = {}
+    for user in users:
+        name = format_full_name(user)
+        names[user.id] = name if name else f"User ID: {str(user.id)}"
+    return names
+
+
+async def hydrate_reports(report_docs: List[ReportValidation]) -> List[ReportResponse]:
+    """Builds ReportResponse entries for a page of reports, resolving every reporter/reported name in one query."""
+    user_ids = []
+    for report_doc in report_docs:
+        user_ids.append(report_doc.reporter)
+        user_ids.append(report_doc.reported_object_id)
+    names = await resolve_user_names(user_ids)
+
+    return [
+        ReportResponse(
+            id=report_doc.id,
+            reportedObjectId=report_doc.reported_object_id,
+            reporter=report_doc.reporter,
+            reason=report_doc.reason,
+            status=report_doc.status,
+            dateReported=report_doc.date_reported,
+            dateApproved=report_doc.date_approved,
+            reporterName=names.get(report_doc.reporter, "N/A"),
+            reportedObjectName=names.get(report_doc.reported_object_id, "N/A")
+        )
+        for report_doc in report_docs
+    ]
+
+
+async def load_user_contacts(user_ids: Iterable[Optional[PydanticObjectId]]) -> Dict[PydanticObjectId, UserContactView]:
+    """Loads name and email of many users with a single `$in` query."""
+    unique_ids = list({user_id for user_id in user_ids if user_id})
+    if not unique_ids:
+        return {}
+    users = await User.find(In(User.id, unique_ids)).project(UserContactView).to_list()
+    return {user.id: user for user in users}
+
+
+async def decide_reports(report_ids: List[PydanticObjectId], new_status: str) -> Tuple[List[ReportValidation], Dict[PydanticObjectId, str]]:
+    """
+    Moves many pending reports to "approved" or "rejected" with one guarded `update_many`.
+    Approved reports are copied to FinalReport with one `insert_many`.
+    Returns the reports this call decided and, per id it did not, the reason; a report
+    decided concurrently by another request is reported as already processed.
+    """
+    reports = await ReportValidation.find(In(ReportValidation.id, report_ids)).to_list()
+    found = {report.id: report for report in reports}
+    failures: Dict[PydanticObjectId, str] = {}
+    pending: List[ReportValidation] = []
+    for report_id in report_ids:
+        report = found.get(report_id)
+        if report is None:
+            failures[report_id] = f"Report with id {report_id} not found"
+        elif report.status != "pending":
+            failures[report_id] = f"Report {report_id} already processed. Status: {report.status}"
+        else:
+            pending.append(report)
+    if not pending:
+        return [], failures
+
+    now = datetime.utcnow()
+    decision_id = PydanticObjectId()
+    update = {"status": new_status, "decisionId": decision_id}
+    if new_status == "approved":
+        update["dateApproved"] = now
+    collection = ReportValidation.get_motor_collection()
+    # The status guard lets exactly one decision win per report, even against a concurrent
+    # single approve/reject; the decision id then tells which reports this call won
+    await collection.update_many(
+        {"_id": {"$in": [report.id for report in pending]}, "status": "pending"},
+        {"$set": update}
+    )
+    won = {doc["_id"] async for doc in collection.find({"_id": {"$in": [report.id for report in pending]}, "decisionId": decision_id}, {"_id": 1})}
+    decided: List[ReportValidation] = []
+    for report in pending:
+        if report.id not in won:
+            failures[report.id] = f"Report {report.id} already processed"
+            continue
+        report.status = new_status
+        report.decision_id = decision_id
+        if new_status == "approved":
+            report.date_approved = now
+        decided.append(report)
+
+    if new_status == "approved" and decided:
+        await FinalReport.insert_many([
+            FinalReport(
+                original_report_id=str(report.id),
+                reported_object_id=str(report.reported_object_id),
+                reporter=str(report.reporter),
+                reason=report.reason,
+                date_reported=report.date_reported,
+                date_approved=report.date_approved
+            )
+            for report in decided
+        ])
+    return decided, failures
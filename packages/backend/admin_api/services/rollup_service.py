@@ -0,0 +1,235 @@
+"""
+Materialized daily rollup (`stats_daily`) for the dashboard and analytics.
+
+Each UTC day has one small document holding, per metric, the day's total and its breakdown
+by category, barangay and user type. A day is recomputed from the raw collections with one
+index-bounded `$facet` aggregation per metric, so refreshing it is cheap:
+- the admin write paths (approvals, report decisions) and the notifier schedule a refresh of
+  today's metrics they touch; it runs in the background, coalescing the writes of a short burst;
+- the leader worker refreshes today and yesterday every STATS_ROLLUP_INTERVAL_SECONDS, which
+  picks up writes made by the mobile app;
+- a backfill rebuilds the whole history:
+
+    python -m admin_api.services.rollup_service --backfill [--since 2024-01-01]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Type
+
+from beanie import Document
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+
+from admin_api.models.documents import Applicant, User, Job, ReportValidation, StatsDaily
+from admin_api.utils.cache import invalidate_dashboard_cache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+STATS_ROLLUP_INTERVAL_SECONDS = float(os.getenv("STATS_ROLLUP_INTERVAL_SECONDS", 60))
+# How long a scheduled refresh of today waits for more writes to fold into the same recompute
+STATS_REFRESH_DELAY_SECONDS = float(os.getenv("STATS_REFRESH_DELAY_SECONDS", 1))
+STATS_DAILY_MAX_DAYS = 366
+
+
+@dataclass(frozen=True)
+class RollupMetric:
+    model: Type[Document]
+    date_field: str
+    # Stored field -> DailyMetric breakdown it feeds
+    dimensions: Dict[str, str] = field(default_factory=dict)
+    match: Dict[str, Any] = field(default_factory=dict)
+    # Dashboard cache prefix to invalidate when the metric changes
+    cache_prefix: str = ""
+
+
+ROLLUP_METRICS: Dict[str, RollupMetric] = {
+    "applicantsJoined": RollupMetric(Applicant, "joinedAt", {"userType": "byUserType", "barangay": "byBarangay"}, cache_prefix="applicants"),
+    "usersVerified": RollupMetric(User, "verifiedAt", {"userType": "byUserType", "barangay": "byBarangay"}, cache_prefix="users"),
+    "jobsPosted": RollupMetric(Job, "datePosted", {"category": "byCategory", "jobLocation": "byBarangay"}, cache_prefix="jobs"),
+    "jobsCompleted": RollupMetric(Job, "completedAt", {"category": "byCategory", "jobLocation": "byBarangay"}, cache_prefix="jobs"),
+    "reportsFiled": RollupMetric(ReportValidation, "dateReported", cache_prefix="reports"),
+    "reportsApproved": RollupMetric(ReportValidation, "dateApproved", match={"status": "approved"}, cache_prefix="reports"),
+}
+
+
+def day_start(moment: datetime) -> datetime:
+    return datetime(moment.year, moment.month, moment.day)
+
+
+def _empty_metric() -> Dict[str, Any]:
+    return {"total": 0, "byCategory": [], "byBarangay": [], "byUserType": []}
+
+
+def _metric_pipeline(metric: RollupMetric, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    day = {"$dateToString": {"format": "%Y-%m-%d", "date": f"${metric.date_field}"}}
+    facets = {"total": [{"$group": {"_id": day, "count": {"$sum": 1}}}]}
+    for source_field, breakdown in metric.dimensions.items():
+        facets[breakdown] = [{"$group": {"_id": {"day": day, "key": {"$ifNull": [f"${source_field}", "unknown"]}}, "count": {"$sum": 1}}}]
+    return [
+        {"$match": {**metric.match, metric.date_field: {"$gte": start, "$lt": end}}},
+        {"$facet": facets},
+    ]
+
+
+async def compute_rollup(start: datetime, end: datetime, metric_names: Optional[Iterable[str]] = None) -> Dict[datetime, Dict[str, Dict[str, Any]]]:
+    """Aggregates the raw collections over [start, end) into {day: {metricName: DailyMetric dict}}."""
+    names = list(metric_names or ROLLUP_METRICS)
+    results = await asyncio.gather(*(
+        ROLLUP_METRICS[name].model.aggregate(_metric_pipeline(ROLLUP_METRICS[name], start, end)).to_list() for name in names
+    ))
+    days: Dict[datetime, Dict[str, Dict[str, Any]]] = {}
+    current = day_start(start)
+    while current < end:
+        days[current] = {name: _empty_metric() for name in names}
+        current += timedelta(days=1)
+
+    for name, result in zip(names, results):
+        facets = result[0] if result else {}
+        for group in facets.get("total", []):
+            day = datetime.strptime(group["_id"], "%Y-%m-%d")
+            days.setdefault(day, {n: _empty_metric() for n in names})[name]["total"] = group["count"]
+        for breakdown in ROLLUP_METRICS[name].dimensions.values():
+            for group in facets.get(breakdown, []):
+                day = datetime.strptime(group["_id"]["day"], "%Y-%m-%d")
+                entry = days.setdefault(day, {n: _empty_metric() for n in names})[name]
+                entry[breakdown].append({"key": str(group["_id"]["key"]), "count": group["count"]})
+    return days
+
+
+async def _write_days(days: Dict[datetime, Dict[str, Dict[str, Any]]]) -> int:
+    if not days:
+        return 0
+    now = datetime.utcnow()
+    operations = [
+        UpdateOne({"day": day}, {"$set": {**metrics, "updatedAt": now}}, upsert=True)
+        for day, metrics in days.items()
+    ]
+    await StatsDaily.get_motor_collection().bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+async def refresh_days(days: Iterable[datetime], metric_names: Optional[Iterable[str]] = None) -> int:
+    """Recomputes the given UTC days (only `metric_names`, or every metric) and upserts them."""
+    metric_names = list(metric_names or ROLLUP_METRICS)
+    written = 0
+    for day in sorted({day_start(day) for day in days}):
+        written += await _write_days(await compute_rollup(day, day + timedelta(days=1), metric_names))
+    invalidate_dashboard_cache("stats", *{ROLLUP_METRICS[name].cache_prefix for name in metric_names})
+    return written
+
+
+_pending_refresh: Set[str] = set()
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def _run_scheduled_refresh():
+    global _refresh_task
+    try:
+        await asyncio.sleep(STATS_REFRESH_DELAY_SECONDS)
+        while _pending_refresh:
+            metric_names = list(_pending_refresh)
+            _pending_refresh.clear()
+            # Until the first backfill, a lone day document would make the dashboard read an almost empty rollup
+            if await rollup_available():
+                await refresh_days([datetime.utcnow()], metric_names)
+    except Exception as e:
+        logger.error(f"Failed to refresh stats_daily: {e}")
+    finally:
+        _refresh_task = None
+
+
+def schedule_refresh_today(*metric_names: str):
+    """
+    Queues a recompute of today's `metric_names` (default: every metric) after a write the admin
+    API or the notifier made. Returns at once: the request never waits for the aggregation.
+    """
+    global _refresh_task
+    _pending_refresh.update(metric_names or ROLLUP_METRICS)
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_run_scheduled_refresh())
+
+
+async def backfill(since: Optional[datetime] = None) -> int:
+    """Rebuilds stats_daily from `since` (default: the earliest document) up to today."""
+    if since is None:
+        earliest = []
+        for metric in ROLLUP_METRICS.values():
+            first = await metric.model.get_motor_collection().find_one(
+                {metric.date_field: {"$type": "date"}}, sort=[(metric.date_field, 1)], projection={metric.date_field: 1}
+            )
+            if first:
+                earliest.append(first[metric.date_field])
+        since = min(earliest) if earliest else datetime.utcnow()
+    start, end = day_start(since), day_start(datetime.utcnow()) + timedelta(days=1)
+    written = 0
+    # A month at a time keeps each $facet result well under the 16MB document limit. Every day of
+    # the chunk is upserted whole, so readers see either the old or the new day, never a gap.
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + timedelta(days=31), end)
+        written += await _write_days(await compute_rollup(chunk_start, chunk_end))
+        chunk_start = chunk_end
+    invalidate_dashboard_cache("stats", *{metric.cache_prefix for metric in ROLLUP_METRICS.values()})
+    logger.info(f"stats_daily backfilled with {written} days from {start.date()}.")
+    return written
+
+
+async def rollup_available() -> bool:
+    return await StatsDaily.get_motor_collection().find_one({}, projection={"_id": 1}) is not None
+
+
+async def get_daily_stats(start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    """Reads the rollup documents of [start, end); at most STATS_DAILY_MAX_DAYS of them."""
+    cursor = StatsDaily.get_motor_collection().find(
+        {"day": {"$gte": day_start(start), "$lt": end}}, projection={"_id": 0}
+    ).sort("day", 1).limit(STATS_DAILY_MAX_DAYS)
+    return await cursor.to_list(length=STATS_DAILY_MAX_DAYS)
+
+
+async def get_monthly_rollup(metric_name: str, start: datetime, end: datetime) -> List[int]:
+    """Folds the daily totals of one metric into the dashboard's 12-slot list (index 0 is January)."""
+    monthly_counts = [0] * 12
+    cursor = StatsDaily.get_motor_collection().find(
+        {"day": {"$gte": start, "$lt": end}}, projection={"day": 1, f"{metric_name}.total": 1}
+    )
+    async for doc in cursor:
+        monthly_counts[doc["day"].month - 1] += (doc.get(metric_name) or {}).get("total", 0)
+    return monthly_counts
+
+
+async def run_rollup_worker(interval_seconds: float = STATS_ROLLUP_INTERVAL_SECONDS):
+    """Backfills once if the rollup is empty, then keeps today and yesterday current. Leader only."""
+    logger.info(f"stats_daily rollup worker started. Interval: {interval_seconds}s.")
+    if not await rollup_available():
+        await backfill()
+    while True:
+        try:
+            today = datetime.utcnow()
+            await refresh_days([today - timedelta(days=1), today])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"stats_daily refresh failed: {e}", exc_info=True)
+        await asyncio.sleep(interval_seconds)
+
+
+async def _main(since: Optional[str]):
+    from admin_api.database import init_db
+    await init_db()
+    written = await backfill(datetime.fromisoformat(since) if since else None)
+    print(json.dumps({"days_written": written}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backfill", action="store_true", required=True, help="rebuild stats_daily from the raw collections")
+    parser.add_argument("--since", help="first day to rebuild (YYYY-MM-DD); default: the earliest document")
+    args = parser.parse_args()
+    asyncio.run(_main(args.since))
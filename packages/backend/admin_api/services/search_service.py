@@ -0,0 +1,192 @@
+"""
+Admin search over applicants, users and jobs.
+
+Two query modes share one endpoint:
+- `text`: MongoDB `$text` search on the `search_text` index of each collection, ranked by textScore.
+- `prefix`: type-ahead on `searchTokens`, a multikey array of normalized (lowercased,
+  accent-stripped) words of the searchable fields. An anchored `^prefix` regex on it is an
+  index range scan.
+
+The models recompute `searchTokens` whenever this API inserts, saves or replaces a document.
+The mobile app inserts and edits documents without writing them and sets no `updatedAt`, so
+the leader worker (`run_search_indexer`) fills in missing tokens every
+SEARCH_INDEX_INTERVAL_SECONDS and, every SEARCH_RECONCILE_INTERVAL_SECONDS, recomputes them
+for every document, rewriting only those whose names, email or location changed. Existing data
+can be backfilled with:
+
+    python -m admin_api.services.search_service --backfill
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from beanie import Document
+from beanie.odm.utils.projection import get_projection
+from dotenv import load_dotenv
+from fastapi import HTTPException
+from pydantic import BaseModel
+from pymongo import UpdateOne
+
+from admin_api.models.documents import Applicant, User, Job, ApplicantListView, UserListView, JobListView
+from admin_api.utils.json_encoding import to_jsonable_dict
+from admin_api.utils.search_tokens import WORD_SPLIT, build_search_tokens, normalize
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SEARCH_MAX_OFFSET = int(os.getenv("SEARCH_MAX_OFFSET", 1000))
+SEARCH_INDEX_INTERVAL_SECONDS = float(os.getenv("SEARCH_INDEX_INTERVAL_SECONDS", 30))
+SEARCH_INDEX_BATCH_SIZE = int(os.getenv("SEARCH_INDEX_BATCH_SIZE", 500))
+SEARCH_RECONCILE_INTERVAL_SECONDS = float(os.getenv("SEARCH_RECONCILE_INTERVAL_SECONDS", 3600))
+SEARCH_MIN_PREFIX_LENGTH = 2
+
+SEARCH_MODES = ("auto", "text", "prefix")
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    model: Type[Document]
+    view: Type[BaseModel]
+    token_fields: Tuple[str, ...]  # stored field names whose words become searchTokens
+
+
+SEARCH_SPECS: Dict[str, SearchSpec] = {
+    "applicants": SearchSpec(Applicant, ApplicantListView, Applicant.search_token_fields),
+    "users": SearchSpec(User, UserListView, User.search_token_fields),
+    "jobs": SearchSpec(Job, JobListView, Job.search_token_fields),
+}
+
+def query_terms(text: str) -> List[str]:
+    return [term for term in WORD_SPLIT.split(normalize(text)) if term]
+
+
+def user_search_tokens(first_name: Optional[str], middle_name: Optional[str], last_name: Optional[str], email: Optional[str], barangay: Optional[str]) -> List[str]:
+    """searchTokens for a user or applicant written by this API."""
+    return build_search_tokens(
+        {"firstName": first_name, "middleName": middle_name, "lastName": last_name, "emailAddress": email, "barangay": barangay},
+        SEARCH_SPECS["users"].token_fields
+    )
+
+
+def get_search_spec(collection: str) -> SearchSpec:
+    spec = SEARCH_SPECS.get(collection)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"Unknown search collection '{collection}'. Available: {', '.join(SEARCH_SPECS)}")
+    return spec
+
+
+def resolve_mode(q: str, mode: str) -> str:
+    """`auto` uses prefix matching for a single partial word (type-ahead) and text search otherwise."""
+    if mode != "auto":
+        return mode
+    return "prefix" if len(q.split()) == 1 and not q.endswith(" ") else "text"
+
+
+def prefix_filter(q: str) -> Dict[str, Any]:
+    terms = query_terms(q)
+    if sum(len(term) for term in terms) < SEARCH_MIN_PREFIX_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Prefix search needs at least {SEARCH_MIN_PREFIX_LENGTH} characters")
+    # Every word must prefix-match some token; the anchored regexes are index range scans
+    return {"$and": [{"searchTokens": {"$regex": f"^{re.escape(term)}"}} for term in terms]}
+
+
+async def search(collection: str, q: str, mode: str, limit: int, offset: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Runs one page of a search and returns (items, next_offset). Each item is the collection's
+    list view plus a `score` (textScore in text mode, None in prefix mode).
+    """
+    if offset > SEARCH_MAX_OFFSET:
+        raise HTTPException(status_code=400, detail=f"Search results are limited to the first {SEARCH_MAX_OFFSET} matches; refine the query")
+    spec = get_search_spec(collection)
+    projection = get_projection(spec.view)
+    collection_handle = spec.model.get_motor_collection()
+
+    if resolve_mode(q, mode) == "text":
+        projection = {**projection, "score": {"$meta": "textScore"}}
+        cursor = collection_handle.find({"$text": {"$search": q}}, projection).sort([("score", {"$meta": "textScore"}), ("_id", 1)])
+    else:
+        # A stable order, so offset pages neither repeat nor skip matches
+        cursor = collection_handle.find(prefix_filter(q), projection).sort("_id", 1)
+
+    docs = await cursor.skip(offset).limit(limit + 1).to_list(length=limit + 1)
+    next_offset = offset + limit if len(docs) > limit else None
+    items = []
+    for doc in docs[:limit]:
+        item = to_jsonable_dict(spec.view(**doc))
+        item["score"] = doc.get("score")
+        items.append(item)
+    return items, next_offset
+
+
+async def backfill_search_tokens(spec: SearchSpec, batch_size: int = SEARCH_INDEX_BATCH_SIZE, only_missing: bool = True) -> int:
+    """
+    Writes searchTokens for documents that lack them, or recomputes them for all documents and
+    rewrites those that are stale. Returns how many were updated.
+    """
+    collection = spec.model.get_motor_collection()
+    # Missing fields and empty arrays are both indexed, so this is an index scan
+    query = {"searchTokens": {"$in": [None, []]}} if only_missing else {}
+    projection = {field: 1 for field in (*spec.token_fields, "searchTokens")}
+    updated = 0
+    operations = []
+    async for doc in collection.find(query, projection).batch_size(batch_size):
+        tokens = build_search_tokens(doc, spec.token_fields)
+        if tokens == doc.get("searchTokens"):
+            continue
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"searchTokens": tokens}}))
+        if len(operations) >= batch_size:
+            updated += (await collection.bulk_write(operations, ordered=False)).modified_count
+            operations = []
+    if operations:
+        updated += (await collection.bulk_write(operations, ordered=False)).modified_count
+    return updated
+
+
+async def run_search_indexer(
+    interval_seconds: float = SEARCH_INDEX_INTERVAL_SECONDS,
+    reconcile_interval_seconds: float = SEARCH_RECONCILE_INTERVAL_SECONDS,
+):
+    """
+    Fills in searchTokens for newly inserted documents, and periodically recomputes them all to
+    catch edits made outside this API; run on the leader worker only.
+    """
+    logger.info(f"Search token indexer started. Interval: {interval_seconds}s, reconcile: {reconcile_interval_seconds}s.")
+    next_reconcile = time.monotonic() + reconcile_interval_seconds
+    while True:
+        reconcile = time.monotonic() >= next_reconcile
+        if reconcile:
+            next_reconcile = time.monotonic() + reconcile_interval_seconds
+        for name, spec in SEARCH_SPECS.items():
+            try:
+                updated = await backfill_search_tokens(spec, only_missing=not reconcile)
+                if updated:
+                    logger.info(f"Search token indexer updated {updated} {name}.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Search token indexer failed for {name}: {e}", exc_info=True)
+        await asyncio.sleep(interval_seconds)
+
+
+async def _main(rebuild: bool):
+    from admin_api.database import init_db
+    await init_db()
+    counts = {name: await backfill_search_tokens(spec, only_missing=not rebuild) for name, spec in SEARCH_SPECS.items()}
+    print(json.dumps({"updated": counts}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backfill", action="store_true", help="fill in searchTokens where missing")
+    parser.add_argument("--rebuild", action="store_true", help="recompute searchTokens for every document")
+    args = parser.parse_args()
+    if not (args.backfill or args.rebuild):
+        parser.error("pass --backfill or --rebuild")
+    asyncio.run(_main(args.rebuild))
@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import asyncio
+
+from beanie import Document
+
+from admin_api.models.documents import Applicant, User, Job, ReportValidation
+from admin_api.utils.cache import dashboard_cache
+from admin_api.services.rollup_service import rollup_available, get_monthly_rollup
+
+
+def monthly_window(current_date: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Returns [start, end) covering the current UTC month and the 11 months before it, in UTC like the stats_daily days."""
+    current_date = current_date or datetime.utcnow()
+    start_month = current_date.month - 11
+    start_year = current_date.year
+    if start_month < 1:
+        start_month += 12
+        start_year -= 1
+    start_date = datetime(start_year, start_month, 1, 0, 0, 0)
+    if current_date.month == 12:
+        end_date = datetime(current_date.year + 1, 1, 1, 0, 0, 0)
+    else:
+        end_date = datetime(current_date.year, current_date.month + 1, 1, 0, 0, 0)
+    return start_date, end_date
+
+
+def monthly_counts_pipeline(date_field: str, start_date: datetime, end_date: datetime, match: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Builds the `$match` + `$group` pipeline counting documents per calendar month of `date_field`."""
+    return [
+        {"$match": {**(match or {}), date_field: {"$gte": start_date, "$lt": end_date}}},
+        {"$group": {
+            "_id": {"year": {"$year": f"${date_field}"}, "month": {"$month": f"${date_field}"}},
+            "count": {"$sum": 1},
+        }},
+    ]
+
+
+def to_monthly_data(groups: List[Dict[str, Any]]) -> List[int]:
+    """
+    Folds `{_id: {year, month}, count}` groups into the MonthlyData list.
+    Like the dashboard has always expected, index 0 is January and index 11 is December;
+    the window spans exactly 12 months so each calendar month appears at most once.
+    """
+    monthly_counts = [0] * 12
+    for group in groups:
+        monthly_counts[group["_id"]["month"] - 1] += group["count"]
+    return monthly_counts
+
+
+async def get_monthly_counts(
+    document_model: Type[Document],
+    date_field: str,
+    match: Optional[Dict[str, Any]] = None,
+    window: Optional[Tuple[datetime, datetime]] = None,
+) -> List[int]:
+    """Counts documents of `document_model` per month over the last 12 months inside MongoDB."""
+    start_date, end_date = window or monthly_window()
+    pipeline = monthly_counts_pipeline(date_field, start_date, end_date, match)
+    groups = await document_model.aggregate(pipeline).to_list()
+    return to_monthly_data(groups)
+
+
+async def get_monthly_metric(metric_name: str, document_model: Type[Document], date_field: str) -> List[int]:
+    """
+    Monthly chart data from the stats_daily rollup (at most 366 small documents), falling back
+    to aggregating the raw collection until the rollup has been built.
+    """
+    if await rollup_available():
+        start_date, end_date = monthly_window()
+        return await get_monthly_rollup(metric_name, start_date, end_date)
+    return await get_monthly_counts(document_model, date_field)
+
+
+async def _total(document_model: Type[Document]) -> int:
+    """Exact whole-collection total; the metadata estimate can drift after unclean shutdowns and on sharded clusters."""
+    return await document_model.get_motor_collection().count_documents({})
+
+
+async def _applicant_summary(start_date: datetime, end_date: datetime, use_rollup: bool) -> Dict[str, Any]:
+    if use_rollup:
+        monthly = get_monthly_rollup("applicantsJoined", start_date, end_date)
+    else:
+        monthly = get_monthly_counts(Applicant, "joinedAt", window=(start_date, end_date))
+    total, pending, monthly_applications = await asyncio.gather(
+        _total(Applicant),
+        Applicant.get_motor_collection().count_documents({"verificationStatus": "pending"}),
+        monthly,
+    )
+    return {
+        "total_applicants": total,
+        "pending_applicants": pending,
+        "monthly_applications": monthly_applications,
+    }
+
+
+async def _user_summary(start_date: datetime, end_date: datetime, use_rollup: bool) -> Dict[str, Any]:
+    if use_rollup:
+        monthly = get_monthly_rollup("usersVerified", start_date, end_date)
+    else:
+        monthly = get_monthly_counts(User, "verifiedAt", window=(start_date, end_date))
+    total, monthly_users = await asyncio.gather(_total(User), monthly)
+    return {"total_users": total, "monthly_users": monthly_users}
+
+
+async def _report_summary() -> Dict[str, Any]:
+    return {"pending_reports": await ReportValidation.find(ReportValidation.status == "pending").count()}
+
+
+async def _job_summary() -> Dict[str, Any]:
+    return {"total_jobs": await _total(Job)}
+
+
+async def get_dashboard_summary() -> Dict[str, Any]:
+    """
+    Computes every dashboard figure concurrently: exact totals and filtered counts from
+    `count_documents` (the filtered ones on an indexed field), monthly series from the date-window
+    pipelines (or the rollup). Each collection's part is cached under its own key so the usual write-path
+    invalidation ("users", "applicants", "reports", ...) applies.
+    """
+    start_date, end_date = monthly_window()
+    use_rollup = await rollup_available()
+    parts = await asyncio.gather(
+        dashboard_cache.get_or_set("applicants:summary", lambda: _applicant_summary(start_date, end_date, use_rollup)),
+        dashboard_cache.get_or_set("users:summary", lambda: _user_summary(start_date, end_date, use_rollup)),
+        dashboard_cache.get_or_set("reports:summary", _report_summary),
+        dashboard_cache.get_or_set("jobs:summary", _job_summary),
+    )
+    summary: Dict[str, Any] = {}
+    for part in parts:
+        summary.update(part)
+    return summary
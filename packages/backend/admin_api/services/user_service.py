@@ -0,0 +1,63 @@
+"""
+Explicit loaders for a user's related documents.
+
+`User.achievements` is a list of Links, but nothing fetches them implicitly: resolving links
+costs a lookup per achievement, and users created before the links existed have none.
+Achievements are instead read by their `userId` (indexed), in bulk or through the
+user-detail `$lookup` pipeline, and only by the endpoints that ask for them.
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from beanie import PydanticObjectId
+from beanie.odm.utils.parsing import parse_obj
+from beanie.odm.utils.projection import get_projection
+
+from admin_api.models.documents import User, Achievement, AchievementView, JobSeeker, UserDetail
+
+USER_DETAIL_INCLUDES = ("achievements", "job_seeker")
+
+
+async def load_achievements(user_ids: Iterable[Optional[PydanticObjectId]]) -> Dict[PydanticObjectId, List[AchievementView]]:
+    """Loads the achievements of many users with a single `userId $in` query, oldest first per user."""
+    unique_ids = list({user_id for user_id in user_ids if user_id})
+    if not unique_ids:
+        return {}
+    projection = {**get_projection(AchievementView), "userId": 1}
+    cursor = Achievement.get_motor_collection().find({"userId": {"$in": unique_ids}}, projection).sort("dateAchieved", 1)
+    achievements: Dict[PydanticObjectId, List[AchievementView]] = defaultdict(list)
+    async for doc in cursor:
+        achievements[doc["userId"]].append(parse_obj(AchievementView, doc))
+    return dict(achievements)
+
+
+def user_detail_pipeline(user_id: PydanticObjectId, include: Iterable[str] = USER_DETAIL_INCLUDES) -> List[Dict[str, Any]]:
+    """One round trip: the user's own fields, then a `$lookup` per requested relation on its indexed userId."""
+    include = set(include)
+    # The stored achievements are Link refs; the lookup below replaces them with the documents
+    projection = {field: value for field, value in get_projection(UserDetail).items() if field not in ("achievements", "jobSeeker")}
+    pipeline: List[Dict[str, Any]] = [
+        {"$match": {"_id": user_id}},
+        {"$project": projection},
+    ]
+    if "achievements" in include:
+        pipeline.append(
+            {"$lookup": {"from": Achievement.get_motor_collection().name, "localField": "_id", "foreignField": "userId", "as": "achievements"}}
+        )
+    if "job_seeker" in include:
+        pipeline += [
+            {"$lookup": {"from": JobSeeker.get_motor_collection().name, "localField": "_id", "foreignField": "userId", "as": "jobSeeker"}},
+            {"$set": {"jobSeeker": {"$arrayElemAt": ["$jobSeeker", 0]}}},
+        ]
+    return pipeline
+
+
+async def get_user_detail(user_id: PydanticObjectId, include: Iterable[str] = USER_DETAIL_INCLUDES) -> Optional[UserDetail]:
+    result = await User.aggregate(user_detail_pipeline(user_id, include)).to_list()
+    if not result:
+        return None
+    detail = parse_obj(UserDetail, result[0])
+    # $lookup keeps no order; a user has a handful of achievements, so they are sorted here
+    detail.achievements.sort(key=lambda achievement: achievement.date_achieved or datetime.min)
+    return detail
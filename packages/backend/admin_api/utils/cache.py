@@ -0,0 +1,123 @@
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from dotenv import load_dotenv
+from fastapi import Request, Response
+
+from admin_api.utils.json_encoding import dumps_bytes
+
+load_dotenv()
+
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", 60))
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", 256))
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded in-process cache: entries expire after `ttl` seconds and the least recently
+    used entry is evicted beyond `maxsize`. Concurrent misses on one key share a single load.
+    Every invalidation bumps a generation; a load that started before it is returned to its
+    caller but not stored, so a write is never hidden behind data read before it.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, generation: Optional[int] = None):
+        """Stores `value`; with `generation`, only if nothing was invalidated since that generation was read."""
+        if generation is not None and generation != self._generation:
+            return
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *prefixes: str):
+        """Drops every string key starting with one of `prefixes`; with no prefixes, drops everything."""
+        self._generation += 1
+        if not prefixes:
+            self._entries.clear()
+            return
+        for key in list(self._entries):
+            if isinstance(key, str) and key.startswith(prefixes):
+                self._entries.pop(key, None)
+
+    def invalidate_matching(self, predicate: Callable[[Hashable, Any], bool]):
+        """Drops every entry for which `predicate(key, value)` is true."""
+        self._generation += 1
+        for key, (_, value) in list(self._entries.items()):
+            if predicate(key, value):
+                self._entries.pop(key, None)
+
+    async def get_or_set(self, key: Hashable, loader: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                value = self.get(key, _MISSING)
+                if value is not _MISSING:
+                    self.hits += 1
+                    return value
+                self.misses += 1
+                generation = self._generation
+                value = await loader()
+                self.set(key, value, ttl, generation=generation)
+                return value
+        finally:
+            # Also when the loader raises, so a failing key does not keep its lock forever
+            if self._locks.get(key) is lock:
+                self._locks.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "maxsize": self.maxsize, "ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+
+# Read-mostly dashboard aggregates. Keys are namespaced by collection ("users:total",
+# "applicants:monthly", ...) so write paths can invalidate everything derived from a collection.
+# Invalidation is per process; with several workers the TTL bounds how stale other workers can be.
+dashboard_cache = TTLCache(maxsize=DASHBOARD_CACHE_MAX_ENTRIES, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+
+
+def invalidate_dashboard_cache(*collections: str):
+    """Invalidates the cached aggregates of the given collections, e.g. ("users", "applicants")."""
+    dashboard_cache.invalidate(*(f"{collection}:" for collection in collections))
+
+
+def conditional_response(request: Request, content: Any, max_age: int = int(DASHBOARD_CACHE_TTL_SECONDS)) -> Response:
+    """
+    Returns `content` as JSON with an ETag and Cache-Control, or a bare 304 when the
+    client's If-None-Match already names this representation.
+    """
+    body = dumps_bytes(content)
+    etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Callable, Coroutine, Any, Dict, List, Type
+
+from beanie import Document
+from beanie.odm.utils.parsing import parse_obj
+from beanie.odm.utils.projection import get_projection
+from dotenv import load_dotenv
+from pymongo.errors import OperationFailure, PyMongoError
+
+from admin_api.database import is_replica_set
+from admin_api.models.documents import Applicant, ApplicantNotificationView, ReportValidation, NotifierState
+from admin_api.services.report_service import resolve_user_names
+from admin_api.utils.polling_service import applicant_notification, report_notification
+from admin_api.utils.cache import invalidate_dashboard_cache
+from admin_api.services.rollup_service import schedule_refresh_today
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# "change_stream", "polling", or "auto" (change streams when connected to a replica set, polling otherwise)
+NOTIFIER_MODE = os.getenv("NOTIFIER_MODE", "auto").lower()
+CHANGE_STREAM_RETRY_SECONDS = float(os.getenv("CHANGE_STREAM_RETRY_SECONDS", 5))
+
+# Resume token too old for the oplog; the stream has to start again from "now"
+CHANGE_STREAM_HISTORY_LOST = 286
+
+BroadcastFunc = Callable[[str, str, Dict[str, Any]], Coroutine[Any, Any, None]]
+
+
+async def supports_change_streams() -> bool:
+    """A standalone mongod has no change streams."""
+    return await is_replica_set()
+
+
+async def _load_resume_token(name: str) -> dict | None:
+    state = await NotifierState.find_one(NotifierState.name == name)
+    return state.resume_token if state else None
+
+
+async def _save_resume_token(name: str, token: dict | None):
+    await NotifierState.get_motor_collection().update_one(
+        {"name": name},
+        {"$set": {"resumeToken": token, "updatedAt": datetime.utcnow()}},
+        upsert=True
+    )
+
+
+async def _notify_new_applicant(document: Dict[str, Any], broadcast_func: BroadcastFunc):
+    app = parse_obj(ApplicantNotificationView, document)
+    invalidate_dashboard_cache("applicants")
+    schedule_refresh_today("applicantsJoined")
+    await broadcast_func(**applicant_notification(app))
+
+
+async def _notify_new_report(document: Dict[str, Any], broadcast_func: BroadcastFunc):
+    report = parse_obj(ReportValidation, document)
+    invalidate_dashboard_cache("reports")
+    schedule_refresh_today("reportsFiled")
+    names = await resolve_user_names([report.reported_object_id])
+    reported_entity_display = names.get(report.reported_object_id, f"ID: {str(report.reported_object_id)}")
+    await broadcast_func(**report_notification(report, reported_entity_display))
+
+
+async def watch_collection(
+    name: str,
+    document_model: Type[Document],
+    pipeline: List[Dict[str, Any]],
+    handler: Callable[[Dict[str, Any], BroadcastFunc], Coroutine[Any, Any, None]],
+    broadcast_func: BroadcastFunc
+):
+    """
+    Watches one collection and hands each matching change to `handler`.
+    The resume token is persisted after every event so a restart continues where it left off.
+    """
+    collection = document_model.get_motor_collection()
+    while True:
+        resume_token = await _load_resume_token(name)
+        try:
+            async with collection.watch(pipeline, resume_after=resume_token) as stream:
+                logger.info(f"[CHANGE_STREAM:{name}] Watching {collection.name} (resumed: {resume_token is not None}).")
+                async for change in stream:
+                    try:
+                        await handler(change["fullDocument"], broadcast_func)
+                    except Exception as e:
+                        logger.error(f"[CHANGE_STREAM:{name}] Error handling change {change.get('_id')}: {e}", exc_info=True)
+                    await _save_resume_token(name, stream.resume_token)
+        except asyncio.CancelledError:
+            raise
+        except OperationFailure as e:
+            if e.code == CHANGE_STREAM_HISTORY_LOST:
+                logger.warning(f"[CHANGE_STREAM:{name}] Resume token is no longer in the oplog; restarting from now.")
+                await _save_resume_token(name, None)
+                continue
+            logger.error(f"[CHANGE_STREAM:{name}] Stream failed: {e}. Retrying in {CHANGE_STREAM_RETRY_SECONDS}s.")
+        except PyMongoError as e:
+            logger.error(f"[CHANGE_STREAM:{name}] Stream interrupted: {e}. Retrying in {CHANGE_STREAM_RETRY_SECONDS}s.")
+        await asyncio.sleep(CHANGE_STREAM_RETRY_SECONDS)
+
+
+async def start_change_stream_notifier(broadcast_func: BroadcastFunc):
+    """Pushes new pending applicants and reports to `broadcast_func` as soon as they are inserted."""
+    logger.info("Change stream notifier started.")
+    await asyncio.gather(
+        watch_collection(
+            "applicants",
+            Applicant,
+            [
+                {"$match": {"operationType": "insert", "fullDocument.verificationStatus": "pending"}},
+                # Only the notification's fields travel in each event, not ID images or the password hash
+                {"$project": {f"fullDocument.{field}": 1 for field in get_projection(ApplicantNotificationView)}},
+            ],
+            _notify_new_applicant,
+            broadcast_func
+        ),
+        watch_collection(
+            "report_validation",
+            ReportValidation,
+            [{"$match": {"operationType": "insert", "fullDocument.status": "pending"}}],
+            _notify_new_report,
+            broadcast_func
+        ),
+    )
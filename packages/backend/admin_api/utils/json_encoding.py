@@ -0,0 +1,58 @@
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces the same JSON, only slower
+    orjson = None
+
+
+def to_jsonable_dict(model: BaseModel) -> dict:
+    """Dumps a pydantic model by alias (e.g. `_id`, `firstName`), as the API has always returned it."""
+    if hasattr(model, "model_dump"):
+        return model.model_dump(by_alias=True)
+    return model.dict(by_alias=True)
+
+
+def _default(obj: Any) -> Any:
+    """Encodes the types orjson/json do not know natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return to_jsonable_dict(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        return dumps_bytes(obj).decode("utf-8")
+    return json.dumps(obj, default=_default, separators=(",", ":"))
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when available.
+    Returning it directly from an endpoint skips FastAPI's response validation and
+    jsonable_encoder pass, which dominate the cost of large lists of documents.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Coroutine, Optional
+
+from dotenv import load_dotenv
+from pymongo.errors import DuplicateKeyError
+
+from admin_api.models.documents import LeaderLease
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+LEADER_LEASE_SECONDS = int(os.getenv("LEADER_LEASE_SECONDS", 30))
+
+# Identifies this worker process in the lease document
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+async def try_acquire_lease(name: str, holder: str = WORKER_ID, lease_seconds: int = LEADER_LEASE_SECONDS) -> bool:
+    """Takes or renews the lease `name` if it is free, expired, or already ours. Returns True when held."""
+    now = datetime.utcnow()
+    try:
+        result = await LeaderLease.get_motor_collection().update_one(
+            {"name": name, "$or": [{"holder": holder}, {"expiresAt": {"$lt": now}}]},
+            {"$set": {"holder": holder, "expiresAt": now + timedelta(seconds=lease_seconds)}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        # Another worker holds a live lease, so the filter missed and the upsert hit the unique index
+        return False
+    return result.matched_count == 1 or result.upserted_id is not None
+
+
+async def release_lease(name: str, holder: str = WORKER_ID):
+    await LeaderLease.get_motor_collection().delete_one({"name": name, "holder": holder})
+
+
+async def run_as_leader(
+    name: str,
+    task_factory: Callable[[], Coroutine[Any, Any, None]],
+    lease_seconds: int = LEADER_LEASE_SECONDS
+):
+    """
+    Runs `task_factory()` only while this worker holds the lease `name`.
+    Every worker calls this; one of them wins the lease and renews it every third of its
+    duration. If renewal fails the task is cancelled and another worker takes over once the
+    lease expires.
+    """
+    task: Optional[asyncio.Task] = None
+    try:
+        while True:
+            try:
+                is_leader = await try_acquire_lease(name, lease_seconds=lease_seconds)
+            except Exception as e:
+                logger.error(f"[LEADER:{name}] Lease check failed: {e}")
+                is_leader = False
+
+            if is_leader and task is None:
+                logger.info(f"[LEADER:{name}] {WORKER_ID} acquired the lease; starting task.")
+                task = asyncio.create_task(task_factory())
+            elif not is_leader and task is not None:
+                logger.warning(f"[LEADER:{name}] {WORKER_ID} lost the lease; stopping task.")
+                task.cancel()
+                task = None
+            elif task is not None and task.done():
+                if not task.cancelled() and task.exception():
+                    logger.error(f"[LEADER:{name}] Task exited with error: {task.exception()}. Restarting.")
+                task = asyncio.create_task(task_factory())
+
+            await asyncio.sleep(lease_seconds / 3)
+    finally:
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+            try:
+                await release_lease(name)
+            except Exception:
+                pass
@@ -0,0 +1,199 @@
+"""
+Request and MongoDB latency metrics in Prometheus text format, plus slow request/query logs.
+
+- MetricsMiddleware times every HTTP request per route template (e.g. `/admin/get_applicant/{applicant_id}`).
+- MongoCommandMetrics is a PyMongo CommandListener; Motor runs commands on its executor
+  threads, so the listener and the histograms are thread-safe.
+- render_metrics() produces the body of `GET /metrics`.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from pymongo import monitoring
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+slow_logger = logging.getLogger("admin_api.slow")
+
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", 500))
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 100))
+# If set, GET /metrics requires `Authorization: Bearer <METRICS_TOKEN>`
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DOCUMENT_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+LabelValues = Tuple[str, ...]
+
+
+class Histogram:
+    """A labelled Prometheus histogram (cumulative buckets, sum and count)."""
+
+    def __init__(self, name: str, help_text: str, label_names: Iterable[str], buckets: Iterable[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series: Dict[LabelValues, List[float]] = {}  # bucket counts..., sum, count
+        self._lock = threading.Lock()
+
+    def observe(self, labels: LabelValues, value: float):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in sorted(snapshot.items()):
+            base = [f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels)]
+            for bound, count in zip(self.buckets + ("+Inf",), series[:len(self.buckets)] + [series[-1]]):
+                bucket_labels = ",".join(base + ['le="%s"' % bound])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {int(count)}")
+            label_text = "{" + ",".join(base) + "}" if base else ""
+            lines.append(f"{self.name}_sum{label_text} {series[-2]}")
+            lines.append(f"{self.name}_count{label_text} {int(series[-1])}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+http_request_seconds = Histogram(
+    "admin_http_request_duration_seconds", "HTTP request latency by route template.",
+    ("method", "route", "status"), LATENCY_BUCKETS
+)
+mongo_command_seconds = Histogram(
+    "admin_mongo_command_duration_seconds", "MongoDB command latency by collection and operation.",
+    ("collection", "command", "outcome"), LATENCY_BUCKETS
+)
+mongo_command_documents = Histogram(
+    "admin_mongo_command_documents", "Documents returned or written per MongoDB command.",
+    ("collection", "command"), DOCUMENT_BUCKETS
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (so streaming responses are timed to their last chunk)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            # The router stores the matched route in the shared scope; its template keeps cardinality low
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            http_request_seconds.observe((scope["method"], route, str(status["code"])), elapsed)
+            if elapsed * 1000 >= SLOW_REQUEST_MS:
+                slow_logger.warning(
+                    f"Slow request: {scope['method']} {route} -> {status['code']} in {elapsed * 1000:.1f} ms",
+                    extra={"route": route, "method": scope["method"], "status": status["code"], "duration_ms": round(elapsed * 1000, 1)}
+                )
+
+
+# Commands whose first value is not a collection name
+_NON_COLLECTION_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "buildInfo", "endSessions", "saslStart", "saslContinue",
+                            "commitTransaction", "abortTransaction", "killCursors", "listCollections", "listDatabases"}
+
+
+def _query_shape(value: Any, depth: int = 0) -> Any:
+    """Replaces the values in a filter with "?" so slow-query logs show the shape but no user data."""
+    if depth > 4:
+        return "..."
+    if isinstance(value, dict):
+        return {key: _query_shape(item, depth + 1) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_query_shape(value[0], depth + 1)] if value else []
+    return "?"
+
+
+def _returned_documents(command_name: str, reply: Dict[str, Any]) -> Optional[int]:
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        batch = cursor.get("firstBatch", cursor.get("nextBatch"))
+        if batch is not None:
+            return len(batch)
+    if "n" in reply:
+        return reply["n"]
+    return None
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Records latency and document counts of every MongoDB command and logs the slow ones."""
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[int, Any], Tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        command = event.command
+        collection = "-"
+        if event.command_name not in _NON_COLLECTION_COMMANDS:
+            target = command.get(event.command_name)
+            if isinstance(target, str):
+                collection = target
+            elif event.command_name == "getMore":
+                collection = command.get("collection", "-")
+        query = command.get("filter", command.get("q", command.get("pipeline")))
+        with self._lock:
+            self._inflight[(event.request_id, event.connection_id)] = (collection, query)
+
+    def _finish(self, event, outcome: str, reply: Optional[Dict[str, Any]]):
+        with self._lock:
+            collection, query = self._inflight.pop((event.request_id, event.connection_id), ("-", None))
+        if event.command_name in _NON_COLLECTION_COMMANDS:
+            return
+        seconds = event.duration_micros / 1_000_000
+        mongo_command_seconds.observe((collection, event.command_name, outcome), seconds)
+        documents = _returned_documents(event.command_name, reply) if reply else None
+        if documents is not None:
+            mongo_command_documents.observe((collection, event.command_name), documents)
+        if seconds * 1000 >= SLOW_QUERY_MS:
+            slow_logger.warning(
+                f"Slow query: {event.command_name} on {collection} took {seconds * 1000:.1f} ms",
+                extra={"collection": collection, "command": event.command_name, "duration_ms": round(seconds * 1000, 1),
+                       "documents": documents, "query_shape": _query_shape(query) if query is not None else None}
+            )
+
+    def succeeded(self, event):
+        self._finish(event, "ok", event.reply)
+
+    def failed(self, event):
+        self._finish(event, "error", None)
+
+
+mongo_metrics_listener = MongoCommandMetrics()
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for histogram in (http_request_seconds, mongo_command_seconds, mongo_command_documents):
+        lines += histogram.render()
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,134 @@
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import pymongo
+from beanie import Document, PydanticObjectId
+from fastapi import HTTPException
+from pydantic import BaseModel
+from dotenv import load_dotenv
+
+from admin_api.utils.json_encoding import FastJSONResponse, to_jsonable_dict
+
+load_dotenv()
+
+DEFAULT_PAGE_LIMIT = int(os.getenv("LIST_PAGE_LIMIT", 100))
+MAX_PAGE_LIMIT = int(os.getenv("LIST_MAX_PAGE_LIMIT", 1000))
+
+# Clients read the cursor for the next page from this header so list bodies stay plain JSON arrays
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: Any, doc_id: PydanticObjectId) -> str:
+    """Encodes the sort key of the last item of a page into an opaque cursor."""
+    if isinstance(sort_value, datetime):
+        value, value_type = sort_value.isoformat(), "dt"
+    elif isinstance(sort_value, PydanticObjectId):
+        value, value_type = str(sort_value), "oid"
+    else:
+        value, value_type = sort_value, "raw"
+    raw = json.dumps({"v": value, "t": value_type, "id": str(doc_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, PydanticObjectId]:
+    """Decodes a cursor produced by encode_cursor back into (sort_value, _id)."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        value = data["v"]
+        if data["t"] == "dt":
+            value = datetime.fromisoformat(value)
+        elif data["t"] == "oid":
+            value = PydanticObjectId(value)
+        return value, PydanticObjectId(data["id"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def parse_sort(sort: str, allowed_sorts: Dict[str, str]) -> Tuple[str, int]:
+    """
+    Parses a sort parameter such as "-joinedAt" against a whitelist.
+    `allowed_sorts` maps the stored field name to the attribute name on the projection model.
+    """
+    direction = pymongo.DESCENDING if sort.startswith("-") else pymongo.ASCENDING
+    field = sort.lstrip("+-")
+    if field not in allowed_sorts:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort field '{field}'. Allowed: {', '.join(sorted(allowed_sorts))}"
+        )
+    return field, direction
+
+
+def keyset_after(field: str, direction: int, last_value: Any, last_id: Optional[PydanticObjectId]) -> Dict[str, Any]:
+    """
+    Selects documents strictly after (last_value, last_id) in (field, _id) order. Documents that
+    share `last_value` are told apart by `_id`; without a `last_id`, only values past `last_value` match.
+    """
+    op = "$lt" if direction == pymongo.DESCENDING else "$gt"
+    if field == "_id":
+        return {"_id": {op: last_id}}
+    if last_id is None:
+        return {field: {op: last_value}}
+    return {
+        "$or": [
+            {field: {op: last_value}},
+            {field: last_value, "_id": {op: last_id}},
+        ]
+    }
+
+
+def keyset_filter(field: str, direction: int, cursor: Optional[str]) -> Dict[str, Any]:
+    """Builds the filter selecting documents strictly after the cursor in (field, _id) order."""
+    if not cursor:
+        return {}
+    last_value, last_id = decode_cursor(cursor)
+    return keyset_after(field, direction, last_value, last_id)
+
+
+def keyset_sort(field: str, direction: int) -> List[Tuple[str, int]]:
+    """The (field, _id) sort keyset pagination relies on; the compound indexes on the models match it."""
+    if field == "_id":
+        return [("_id", direction)]
+    return [(field, direction), ("_id", direction)]
+
+
+async def paginate(
+    document_model: Type[Document],
+    filters: Dict[str, Any],
+    allowed_sorts: Dict[str, str],
+    sort: str,
+    cursor: Optional[str],
+    limit: int,
+    projection_model: Optional[Type[BaseModel]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Loads one page of `document_model` using keyset pagination on (sort field, _id).
+    Returns the page and the cursor for the next page, or None when this is the last page.
+    """
+    field, direction = parse_sort(sort, allowed_sorts)
+    query = dict(filters)
+    after = keyset_filter(field, direction, cursor)
+    if after:
+        query = {"$and": [query, after]} if query else after
+
+    find_query = document_model.find(query).sort(keyset_sort(field, direction)).limit(limit + 1)
+    if projection_model is not None:
+        find_query = find_query.project(projection_model)
+    items = await find_query.to_list()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, allowed_sorts[field]), last.id)
+    return items, next_cursor
+
+
+def page_response(items: List[Any], next_cursor: Optional[str]) -> FastJSONResponse:
+    """Serialises a page straight to JSON bytes, with the next-page cursor in NEXT_CURSOR_HEADER."""
+    content = [to_jsonable_dict(item) if isinstance(item, BaseModel) else item for item in items]
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return FastJSONResponse(content, headers=headers)
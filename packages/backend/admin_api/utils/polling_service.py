@@ -1,15 +1,34 @@
 import asyncio
 import logging
+import os
 from datetime import datetime, timezone
-from typing import Callable, Coroutine, Any, Dict
+from typing import Callable, Coroutine, Any, Dict, List, Optional
 
-from admin_api.models.documents import Applicant, ReportValidation, User
+import pymongo
+from beanie import PydanticObjectId
+from dotenv import load_dotenv
+
+from admin_api.models.documents import Applicant, ApplicantNotificationView, ReportValidation
+from admin_api.services.report_service import resolve_user_names
+from admin_api.utils.cache import invalidate_dashboard_cache
+from admin_api.services.rollup_service import schedule_refresh_today
+from admin_api.services.notification_service import batch_notification
+from admin_api.utils.pagination import keyset_after
+
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on documents each poller processes per cycle, so a burst cannot stall the loop
+POLL_MAX_DOCS_PER_CYCLE = int(os.getenv("POLL_MAX_DOCS_PER_CYCLE", 200))
+
+# High-water marks: (timestamp, _id) of the newest document processed, compared as a keyset so
+# documents sharing the cut-off timestamp are neither skipped nor repeated.
 # Initialize with timezone-aware UTC datetime
 last_applicant_timestamp: datetime = datetime.now(timezone.utc)
+last_applicant_id: Optional[PydanticObjectId] = None
 last_report_timestamp: datetime = datetime.now(timezone.utc)
+last_report_id: Optional[PydanticObjectId] = None
 
 def _ensure_utc_aware(dt: datetime) -> datetime:
     """Ensures a datetime object is timezone-aware and in UTC."""
@@ -17,137 +36,136 @@ def _ensure_utc_aware(dt: datetime) -> datetime:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
-async def poll_new_applicants(
-    broadcast_func: Callable[[str, str, Dict[str, Any]], Coroutine[Any, Any, None]]
-):
-    """Polls for new pending applicants and broadcasts notifications."""
-    global last_applicant_timestamp
+def applicant_notification(app: ApplicantNotificationView) -> Dict[str, Any]:
+    """Builds the broadcast arguments announcing a new pending applicant."""
+    app_joined_at_utc = _ensure_utc_aware(app.joined_at)
+    return {
+        "type": "new_verification_request",
+        "message": f"New verification request from {app.email}.",
+        "details": {"applicantId": str(app.id), "email": app.email, "userType": app.user_type, "joinedAt": app_joined_at_utc.isoformat()}
+    }
+
+def report_notification(report: ReportValidation, reported_entity_display: str) -> Dict[str, Any]:
+    """Builds the broadcast arguments announcing a new pending report."""
+    report_date_utc = _ensure_utc_aware(report.date_reported)
+    return {
+        "type": "new_report_filed",
+        "message": f"New report filed regarding: {reported_entity_display}.",
+        "details": {
+            "reportId": str(report.id),
+            "reportedObjectId": str(report.reported_object_id),
+            "reportedObjectName": reported_entity_display, # Add resolved name to details
+            "reporterId": str(report.reporter),
+            "reason": report.reason,
+            "dateReported": report_date_utc.isoformat()
+        }
+    }
+
+async def poll_new_applicants(max_docs: int = POLL_MAX_DOCS_PER_CYCLE) -> List[Dict[str, Any]]:
+    """Polls for new pending applicants and returns their notifications."""
+    global last_applicant_timestamp, last_applicant_id
     # Ensure last_applicant_timestamp is UTC aware for consistent comparison
     # This should already be the case due to initialization and updates
     # but as a safeguard if it were ever to become naive.
     safe_last_applicant_ts = _ensure_utc_aware(last_applicant_timestamp)
 
-    logger.info(f"[POLL_APPLICANTS] Starting poll. Querying for joined_at > {safe_last_applicant_ts.isoformat()}")
+    logger.debug(f"[POLL_APPLICANTS] Starting poll. Querying for (joined_at, _id) > ({safe_last_applicant_ts.isoformat()}, {last_applicant_id})")
+    notifications = []
     try:
+        # Capped per cycle; the remainder is picked up next cycle since the high-water mark only
+        # advances to the last applicant actually processed.
         new_applicants = await Applicant.find(
             Applicant.verification_status == "pending",
-            Applicant.joined_at > safe_last_applicant_ts
-        ).sort(+Applicant.joined_at).to_list()
+            keyset_after("joinedAt", pymongo.ASCENDING, safe_last_applicant_ts, last_applicant_id)
+        ).sort(+Applicant.joined_at, +Applicant.id).limit(max_docs).project(ApplicantNotificationView).to_list()
 
         if new_applicants:
             logger.info(f"[POLL_APPLICANTS] Found {len(new_applicants)} new applicant(s).")
-            max_ts_in_batch = safe_last_applicant_ts
-            
+            invalidate_dashboard_cache("applicants")
+            schedule_refresh_today("applicantsJoined")
             for app in new_applicants:
                 app_joined_at_utc = _ensure_utc_aware(app.joined_at)
-                logger.info(f"[POLL_APPLICANTS] Processing applicant ID {app.id}, Email: {app.email}, joined_at_utc: {app_joined_at_utc.isoformat()}")
-                
-                await broadcast_func(
-                    type="new_verification_request",
-                    message=f"New verification request from {app.email}.",
-                    details={"applicantId": str(app.id), "email": app.email, "userType": app.user_type, "joinedAt": app_joined_at_utc.isoformat()}
-                )
-                
-                if app_joined_at_utc > max_ts_in_batch:
-                    max_ts_in_batch = app_joined_at_utc
-            
-            # Update global timestamp only if new max is greater
-            if max_ts_in_batch > last_applicant_timestamp: # Compare with original global to prevent re-setting if only tz changed
-                last_applicant_timestamp = max_ts_in_batch
-                logger.info(f"[POLL_APPLICANTS] Updated last_applicant_timestamp to: {last_applicant_timestamp.isoformat()}")
-            # else:
-                # logger.info(f"[POLL_APPLICANTS] No update to last_applicant_timestamp needed. max_ts_in_batch: {max_ts_in_batch.isoformat()}, current: {last_applicant_timestamp.isoformat()}")
+                logger.debug(f"[POLL_APPLICANTS] Processing applicant ID {app.id}, Email: {app.email}, joined_at_utc: {app_joined_at_utc.isoformat()}")
+                notifications.append(applicant_notification(app))
 
-        # else:
-            # logger.info("[POLL_APPLICANTS] No new applicants found.") # Can be noisy
+            # Results are in (joined_at, _id) order, so the last one is the new high-water mark
+            last_applicant_timestamp = _ensure_utc_aware(new_applicants[-1].joined_at)
+            last_applicant_id = new_applicants[-1].id
+            logger.info(f"[POLL_APPLICANTS] Updated high-water mark to: ({last_applicant_timestamp.isoformat()}, {last_applicant_id})")
 
     except Exception as e:
         logger.error(f"[POLL_APPLICANTS] Error: {e}", exc_info=True)
+    return notifications
 
-async def poll_new_reports(
-    broadcast_func: Callable[[str, str, Dict[str, Any]], Coroutine[Any, Any, None]]
-):
-    """Polls for new pending reports and broadcasts notifications."""
-    global last_report_timestamp
+async def poll_new_reports(max_docs: int = POLL_MAX_DOCS_PER_CYCLE) -> List[Dict[str, Any]]:
+    """Polls for new pending reports and returns their notifications."""
+    global last_report_timestamp, last_report_id
     safe_last_report_ts = _ensure_utc_aware(last_report_timestamp)
 
-    logger.info(f"[POLL_REPORTS] Starting poll. Querying for date_reported > {safe_last_report_ts.isoformat()}")
+    logger.debug(f"[POLL_REPORTS] Starting poll. Querying for (date_reported, _id) > ({safe_last_report_ts.isoformat()}, {last_report_id})")
+    notifications = []
     try:
         new_reports = await ReportValidation.find(
             ReportValidation.status == "pending",
-            ReportValidation.date_reported > safe_last_report_ts
-        ).sort(+ReportValidation.date_reported).to_list()
+            keyset_after("dateReported", pymongo.ASCENDING, safe_last_report_ts, last_report_id)
+        ).sort(+ReportValidation.date_reported, +ReportValidation.id).limit(max_docs).to_list()
 
         if new_reports:
             logger.info(f"[POLL_REPORTS] Found {len(new_reports)} new report(s).")
-            max_ts_in_batch = safe_last_report_ts
+            invalidate_dashboard_cache("reports")
+            schedule_refresh_today("reportsFiled")
+
+            # Resolve every reported user's name for this cycle in one query
+            reported_names = {}
+            try:
+                reported_names = await resolve_user_names(report.reported_object_id for report in new_reports)
+            except Exception as e_fetch:
+                logger.error(f"[POLL_REPORTS] Error fetching reported entity names: {e_fetch}")
 
             for report in new_reports:
                 report_date_utc = _ensure_utc_aware(report.date_reported)
-                logger.info(f"[POLL_REPORTS] Processing report ID {report.id}, date_reported_utc: {report_date_utc.isoformat()}")
-                
-                reported_entity_display = f"ID: {str(report.reported_object_id)}" # Default display
-                try:
-                    if report.reported_object_id:
-                        # Attempt to fetch as User, similar to get_pending_reports
-                        reported_user = await User.get(report.reported_object_id)
-                        if reported_user:
-                            name_parts = []
-                            if reported_user.first_name: name_parts.append(reported_user.first_name)
-                            if reported_user.middle_name: name_parts.append(reported_user.middle_name)
-                            if reported_user.last_name: name_parts.append(reported_user.last_name)
-                            if reported_user.suffix_name: name_parts.append(reported_user.suffix_name)
-                            name = " ".join(name_parts).strip()
-                            if name:
-                                reported_entity_display = name
-                            else:
-                                reported_entity_display = f"User (ID: {str(reported_user.id)})"
-                        else:
-                            # Potentially try fetching as Job or other entity types if needed in future
-                            logger.warning(f"[POLL_REPORTS] Reported object ID {report.reported_object_id} not found as User.")
-                except Exception as e_fetch:
-                    logger.error(f"[POLL_REPORTS] Error fetching reported entity details for ID {report.reported_object_id}: {e_fetch}")
-
-                await broadcast_func(
-                    type="new_report_filed",
-                    message=f"New report filed regarding: {reported_entity_display}.",
-                    details={
-                        "reportId": str(report.id),
-                        "reportedObjectId": str(report.reported_object_id),
-                        "reportedObjectName": reported_entity_display, # Add resolved name to details
-                        "reporterId": str(report.reporter),
-                        "reason": report.reason,
-                        "dateReported": report_date_utc.isoformat()
-                    }
-                )
-                if report_date_utc > max_ts_in_batch:
-                    max_ts_in_batch = report_date_utc
-
-            if max_ts_in_batch > last_report_timestamp:
-                last_report_timestamp = max_ts_in_batch
-                logger.info(f"[POLL_REPORTS] Updated last_report_timestamp to: {last_report_timestamp.isoformat()}")
-            # else:
-                # logger.info(f"[POLL_REPORTS] No update to last_report_timestamp needed. max_ts_in_batch: {max_ts_in_batch.isoformat()}, current: {last_report_timestamp.isoformat()}")
-        # else:
-            # logger.info("[POLL_REPORTS] No new reports found.") # Can be noisy
+                logger.debug(f"[POLL_REPORTS] Processing report ID {report.id}, date_reported_utc: {report_date_utc.isoformat()}")
+                # Potentially try resolving Job or other entity types if needed in future
+                reported_entity_display = reported_names.get(report.reported_object_id, f"ID: {str(report.reported_object_id)}")
+                notifications.append(report_notification(report, reported_entity_display))
+
+            last_report_timestamp = _ensure_utc_aware(new_reports[-1].date_reported)
+            last_report_id = new_reports[-1].id
+            logger.info(f"[POLL_REPORTS] Updated high-water mark to: ({last_report_timestamp.isoformat()}, {last_report_id})")
             
     except Exception as e:
         logger.error(f"[POLL_REPORTS] Error: {e}", exc_info=True)
+    return notifications
+
+async def run_poll_cycle(
+    broadcast_func: Callable[[str, str, Dict[str, Any]], Coroutine[Any, Any, None]],
+    max_docs: int = POLL_MAX_DOCS_PER_CYCLE
+):
+    """Runs both pollers concurrently and sends everything they found as one broadcast."""
+    applicant_notifications, report_notifications = await asyncio.gather(
+        poll_new_applicants(max_docs),
+        poll_new_reports(max_docs)
+    )
+    notifications = applicant_notifications + report_notifications
+    if notifications:
+        await broadcast_func(**batch_notification(notifications))
 
 async def start_polling(
     broadcast_func: Callable[[str, str, Dict[str, Any]], Coroutine[Any, Any, None]],
     interval_seconds: int = 10
 ):
     """Starts the polling loop for applicants and reports."""
-    logger.info(f"Polling service started. Interval: {interval_seconds} seconds.")
+    logger.info(f"Polling service started. Interval: {interval_seconds} seconds. Max documents per cycle: {POLL_MAX_DOCS_PER_CYCLE}.")
     # Initialize timestamps just before the loop starts to get the most current time
-    global last_applicant_timestamp, last_report_timestamp
-    last_applicant_timestamp = datetime.now(timezone.utc)
-    last_report_timestamp = datetime.now(timezone.utc)
+    global last_applicant_timestamp, last_applicant_id, last_report_timestamp, last_report_id
+    last_applicant_timestamp, last_applicant_id = datetime.now(timezone.utc), None
+    last_report_timestamp, last_report_id = datetime.now(timezone.utc), None
     logger.info(f"Initial last_applicant_timestamp: {last_applicant_timestamp.isoformat()}")
     logger.info(f"Initial last_report_timestamp: {last_report_timestamp.isoformat()}")
 
     while True:
-        await poll_new_applicants(broadcast_func)
-        await poll_new_reports(broadcast_func)
+        try:
+            await run_poll_cycle(broadcast_func)
+        except Exception as e:
+            logger.error(f"[POLL] Error broadcasting poll results: {e}", exc_info=True)
         await asyncio.sleep(interval_seconds)
@@ -0,0 +1,79 @@
+import os
+import time
+from collections import OrderedDict, deque
+from typing import Deque
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+
+load_dotenv()
+
+LOGIN_MAX_ATTEMPTS_PER_EMAIL = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_EMAIL", 5))
+LOGIN_MAX_ATTEMPTS_PER_IP = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_IP", 20))
+LOGIN_ATTEMPT_WINDOW_SECONDS = float(os.getenv("LOGIN_ATTEMPT_WINDOW_SECONDS", 60))
+
+
+class SlidingWindowLimiter:
+    """
+    Counts events per key within a sliding window. At most `max_keys` keys are tracked;
+    the least recently used key is forgotten first so memory stays bounded under a storm.
+    """
+
+    def __init__(self, max_events: int, window_seconds: float, max_keys: int = 10000):
+        self.max_events = max_events
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._events: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    def _window(self, key: str, now: float) -> Deque[float]:
+        events = self._events.get(key)
+        if events is None:
+            events = deque()
+            self._events[key] = events
+            while len(self._events) > self.max_keys:
+                self._events.popitem(last=False)
+        else:
+            self._events.move_to_end(key)
+        while events and events[0] <= now - self.window_seconds:
+            events.popleft()
+        return events
+
+    def retry_after(self, key: str) -> float:
+        """Seconds until `key` may act again; 0 when it is under the limit."""
+        now = time.monotonic()
+        events = self._window(key, now)
+        if len(events) < self.max_events:
+            return 0
+        return max(events[0] + self.window_seconds - now, 0)
+
+    def hit(self, key: str):
+        now = time.monotonic()
+        self._window(key, now).append(now)
+
+    def reset(self, key: str):
+        self._events.pop(key, None)
+
+
+# Every attempt from an address counts; for an email only failed attempts count
+login_ip_limiter = SlidingWindowLimiter(LOGIN_MAX_ATTEMPTS_PER_IP, LOGIN_ATTEMPT_WINDOW_SECONDS)
+login_email_limiter = SlidingWindowLimiter(LOGIN_MAX_ATTEMPTS_PER_EMAIL, LOGIN_ATTEMPT_WINDOW_SECONDS)
+
+
+def check_login_allowed(email: str, client_ip: str):
+    """Rejects the attempt with 429 before any password hashing work is done."""
+    retry_after = max(login_ip_limiter.retry_after(client_ip), login_email_limiter.retry_after(email.lower()))
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+    login_ip_limiter.hit(client_ip)
+
+
+def record_login_failure(email: str):
+    login_email_limiter.hit(email.lower())
+
+
+def record_login_success(email: str):
+    login_email_limiter.reset(email.lower())
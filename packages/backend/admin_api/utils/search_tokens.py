@@ -0,0 +1,31 @@
+"""
+Normalized word tokens for type-ahead search, shared by the models (which refresh them on
+every whole-document write) and services.search_service (which queries and backfills them).
+"""
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List
+
+WORD_SPLIT = re.compile(r"[^0-9a-z@._+-]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercases and strips accents, so "José" and "jose" match."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def build_search_tokens(doc: Dict[str, Any], fields: Iterable[str]) -> List[str]:
+    """Distinct normalized words of `fields`; emails also contribute their local part and domain."""
+    tokens = set()
+    for field in fields:
+        value = doc.get(field)
+        if not isinstance(value, str):
+            continue
+        for word in WORD_SPLIT.split(normalize(value)):
+            if not word:
+                continue
+            tokens.add(word)
+            if "@" in word:
+                tokens.update(part for part in word.split("@") if part)
+    return sorted(tokens)
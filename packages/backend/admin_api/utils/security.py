@@ -1,5 +1,9 @@
 from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import time
 import jwt
 from dotenv import load_dotenv
 import os
@@ -7,6 +11,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel, EmailStr
 from admin_api.models.documents import Admin
+from admin_api.utils.cache import TTLCache
 
 load_dotenv()
 
@@ -14,12 +19,23 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 
+# Verified token -> Admin, so repeated requests with the same token skip the JWT check and the DB lookup
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", 60))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", 1024))
+admin_token_cache = TTLCache(maxsize=AUTH_CACHE_MAX_ENTRIES, ttl=AUTH_CACHE_TTL_SECONDS)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/login")
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt takes 100-300 ms of CPU per call; it runs on this pool so the event loop keeps serving.
+# The pool size is the limit on concurrent hashes; further calls wait in the pool's queue.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
 class TokenData(BaseModel):
     sub: EmailStr | None = None
+    exp: float | None = None
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -28,6 +44,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, get_password_hash, password)
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -54,7 +78,7 @@ def decode_access_token(token: str) -> TokenData | None:
         email: str | None = payload.get("sub")
         if email is None:
             return None
-        return TokenData(sub=email)
+        return TokenData(sub=email, exp=payload.get("exp"))
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -64,12 +88,28 @@ def decode_access_token(token: str) -> TokenData | None:
     except jwt.JWTError:
         return None
 
+def _token_cache_key(token: str) -> str:
+    # Keyed on a hash so raw bearer tokens are never kept in memory longer than the request
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def invalidate_admin_cache(email: str | None = None):
+    """Forgets cached token verifications for one admin, or for all admins when no email is given."""
+    if email is None:
+        admin_token_cache.invalidate()
+    else:
+        admin_token_cache.invalidate_matching(lambda _key, admin: admin.email == email)
+
 async def get_current_active_admin(token: str = Depends(oauth2_scheme)) -> Admin:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    cache_key = _token_cache_key(token)
+    cached_admin = admin_token_cache.get(cache_key)
+    if cached_admin is not None:
+        return cached_admin
+
     token_data = decode_access_token(token)
     if token_data is None or token_data.sub is None:
         raise credentials_exception
@@ -77,4 +117,11 @@ async def get_current_active_admin(token: str = Depends(oauth2_scheme)) -> Admin
     admin = await Admin.find_one(Admin.email == token_data.sub)
     if admin is None:
         raise credentials_exception
+
+    # Never cache past the token's own expiry
+    ttl = AUTH_CACHE_TTL_SECONDS
+    if token_data.exp is not None:
+        ttl = min(ttl, token_data.exp - time.time())
+    if ttl > 0:
+        admin_token_cache.set(cache_key, admin, ttl=ttl)
     return admin
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Compares email body render throughput: the precompiled Jinja2 templates in
+admin_api.services.email_service against the f-string builders they replaced.
+
+Run from `packages/backend`:
+
+    python -m benchmarks.email_templates --recipients 5000
+"""
+import argparse
+import json
+import time
+from typing import Optional
+
+from admin_api.services import email_service
+
+
+# The previous implementations, kept verbatim as the baseline.
+def legacy_get_verification_email_body(name: str, status: str, reason: Optional[str] = None) -> str:
+    """Generates HTML email body for application verification status."""
+    status_action = "approved" if status == "verified" else status
+    
+    html_body = f"""
+    <p>Dear {name},</p>
+    """
+    if status == "verified":
+        html_body += f"""
+        <p>Congratulations! Your application for Trabahanap has been <strong>{status_action}</strong>.</p>
+        <p>You can now log in and access all features available to verified users.</p>
+        """
+    elif status == "rejected":
+        html_body += f"""
+        <p>We regret to inform you that your application for Trabahanap has been <strong>{status_action}</strong>.</p>
+        """
+        if reason:
+            html_body += f"<p>Reason: {reason}</p>"
+        html_body += "<p>If you believe this was a mistake or have further questions, please contact our support team.</p>"
+    
+    html_body += """
+    <p>Thank you for your interest in Trabahanap.</p>
+    <p>Regards,<br>The Trabahanap Team</p>
+    """
+    return html_body
+
+def legacy_get_report_email_body(reporter_name: str, report_status: str, reported_item_info: str, reason: Optional[str] = None) -> str:
+    """Generates HTML email body for user report status."""
+    action_taken_text = "taken appropriate action based on your report" if report_status == "approved" else "decided not to take action at this time"
+    
+    html_body = f"""
+    <p>Dear {reporter_name},</p>
+    <p>Thank you for your report regarding: <strong>{reported_item_info}</strong>.</p>
+    <p>We have reviewed your report. After careful consideration, we have <strong>{action_taken_text}</strong>.</p>
+    """
+    
+    if report_status == "rejected" and reason:
+        html_body += f"<p>Reason for this decision: {reason}</p>"
+    elif report_status == "approved" and reason: # Optional: provide reason for approval action
+        html_body += f"<p>Details regarding the action taken: {reason}</p>"
+
+    html_body += """
+    <p>Your efforts help us maintain a safe and respectful community on Trabahanap. If you have further concerns, please don't hesitate to reach out.</p>
+    <p>Regards,<br>The Trabahanap Team</p>
+    """
+    return html_body
+
+def legacy_get_notification_for_reported_user_body(reported_user_name: str, reported_item_info: str, report_reason: str) -> str:
+    """
+    Generates the HTML email body for a user who was reported, after the report against them has been approved.
+    Does not reveal the identity of the reporter.
+    """
+    html_content = f"""
+    <html>
+        <head>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; color: #333; }}
+                .container {{ background-color: #f9f9f9; padding: 20px; border-radius: 5px; }}
+                .header {{ color: #2c3e50; }}
+                .content p {{ line-height: 1.6; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h2 class="header">Notification Regarding Your Account/Content on Trabahanap</h2>
+                <div class="content">
+                    <p>Dear {reported_user_name},</p>
+                    <p>This email is to inform you that action has been taken regarding a report concerning your account or content on Trabahanap. Specifically, a report related to: <strong>{reported_item_info}</strong> for the following reason: <em>{report_reason}</em>.</p>
+                    <p>Our team has reviewed the report and has taken appropriate action in accordance with our community guidelines and terms of service.</p>
+                    <p>We encourage you to review our policies to ensure a safe and respectful environment for all users. If you have questions or believe there has been a misunderstanding, please contact our support team through the app.</p>
+                    <p>Thank you for your understanding and cooperation.</p>
+                    <p>Sincerely,<br>The Trabahanap Team</p>
+                </div>
+            </div>
+        </body>
+    </html>
+    """
+    return html_content
+
+
+def throughput(render, contexts) -> float:
+    started = time.perf_counter()
+    for context in contexts:
+        render(**context)
+    return round(len(contexts) / (time.perf_counter() - started), 1)
+
+
+def batch_throughput(template_name, contexts) -> float:
+    started = time.perf_counter()
+    email_service.render_emails(template_name, contexts)
+    return round(len(contexts) / (time.perf_counter() - started), 1)
+
+
+def main(recipients: int):
+    verification = [{"name": f"Applicant {i}", "status": "verified" if i % 2 else "rejected"} for i in range(recipients)]
+    reports = [
+        {"reporter_name": f"Reporter {i}", "report_status": "approved", "reported_item_info": f"Report ID {i}", "reason": "Spam"}
+        for i in range(recipients)
+    ]
+    reported = [
+        {"reported_user_name": f"User {i}", "reported_item_info": f"Ref {i}", "report_reason": "Inappropriate content"}
+        for i in range(recipients)
+    ]
+    results = {
+        "recipients": recipients,
+        "verification": {
+            "legacy_per_s": throughput(legacy_get_verification_email_body, verification),
+            "template_per_s": throughput(email_service.get_verification_email_body, verification),
+            "template_batch_per_s": batch_throughput(email_service.VERIFICATION_TEMPLATE, verification),
+        },
+        "report": {
+            "legacy_per_s": throughput(legacy_get_report_email_body, reports),
+            "template_per_s": throughput(email_service.get_report_email_body, reports),
+            "template_batch_per_s": batch_throughput(email_service.REPORT_TEMPLATE, reports),
+        },
+        "reported_user": {
+            "legacy_per_s": throughput(legacy_get_notification_for_reported_user_body, reported),
+            "template_per_s": throughput(email_service.get_notification_for_reported_user_body, reported),
+            "template_batch_per_s": batch_throughput(email_service.REPORTED_USER_TEMPLATE, reported),
+        },
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recipients", type=int, default=5000, help="bodies rendered per template and mode")
+    args = parser.parse_args()
+    main(args.recipients)
@@ -0,0 +1,205 @@
+"""
+Load benchmark for the admin API's hot endpoints.
+
+Seeds (or reuses) a local MongoDB database with synthetic data, then drives the real FastAPI
+app in-process through httpx's ASGI transport:
+
+- GET  /admin/api/reports/all, /admin/get_monthly_applications, /admin/get_monthly_users
+- PUT  /admin/update_verification_status/{id} (each request verifies a different pending applicant)
+- POST /admin/login
+- notification fan-out: broadcast_notification -> every connected WebSocket's writer
+
+Each scenario reports throughput and p50/p99 latency; the results are written as JSON so two
+runs (e.g. before and after a change) can be diffed.
+
+Needs a running `mongod`; transactions in the approval path need a replica set. Run from
+`packages/backend`:
+
+    python -m benchmarks.load_test --applicants 100000 --reports 50000 --requests 500 --concurrency 20 --output bench.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List
+
+from benchmarks.seed import add_seed_arguments, seed_database
+
+BENCHMARK_ADMIN_EMAIL = "benchmark-admin@example.com"
+BENCHMARK_ADMIN_PASSWORD = "benchmark-password"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(name: str, latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    return {
+        "scenario": name,
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(statistics.median(latencies), 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99), 2) if latencies else None,
+        "max_ms": round(max(latencies), 2) if latencies else None,
+    }
+
+
+async def run_scenario(name: str, call: Callable[[int], Awaitable[Any]], requests: int, concurrency: int) -> Dict[str, Any]:
+    """Runs `call(i)` for i in range(requests) from `concurrency` workers; a 4xx/5xx or exception counts as an error."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            started = time.perf_counter()
+            try:
+                response = await call(i)
+                if getattr(response, "status_code", 200) >= 400:
+                    errors += 1
+                    continue
+            except Exception:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(name, latencies, errors, time.perf_counter() - started)
+
+
+class BenchmarkSocket:
+    """Stands in for a starlette WebSocket: records when each frame reaches the writer."""
+
+    def __init__(self, index: int, arrivals: List[float]):
+        self.client = f"benchmark-{index}"
+        self.arrivals = arrivals
+
+    async def accept(self):
+        pass
+
+    async def send_bytes(self, data: bytes):
+        sent_at = json.loads(data)["details"]["sentAt"]
+        self.arrivals.append((time.perf_counter() - sent_at) * 1000)
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+async def websocket_fanout(clients: int, notifications: int) -> Dict[str, Any]:
+    """Broadcasts `notifications` events to `clients` sockets and measures publish-to-delivery latency."""
+    from admin_api.services import notification_service
+
+    arrivals: List[float] = []
+    sockets = [BenchmarkSocket(i, arrivals) for i in range(clients)]
+    for socket in sockets:
+        await notification_service.manager.connect(socket)
+    started = time.perf_counter()
+    for i in range(notifications):
+        await notification_service.broadcast_notification(
+            type="new_applicant", message=f"Benchmark event {i}", details={"sentAt": time.perf_counter()}
+        )
+        await asyncio.sleep(0)
+    expected = clients * notifications
+    deadline = time.perf_counter() + 30
+    while len(arrivals) < expected and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    for socket in sockets:
+        notification_service.manager.disconnect(socket)
+    result = summarize("websocket_fanout", arrivals, expected - len(arrivals), elapsed)
+    result.update({"clients": clients, "notifications": notifications})
+    return result
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+async def main(args):
+    # The app reads its configuration at import time, so point it at the benchmark database first
+    os.environ["MONGO_URI"] = args.mongo_uri
+    os.environ["MONGO_DB_NAME"] = args.database
+    os.environ.setdefault("LOGIN_MAX_ATTEMPTS_PER_IP", str(args.requests * 10))
+    os.environ.setdefault("LOGIN_MAX_ATTEMPTS_PER_EMAIL", str(args.requests * 10))
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if args.no_cache:
+        os.environ["DASHBOARD_CACHE_TTL_SECONDS"] = "0"
+
+    import httpx
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from admin_api.database import init_db
+    from admin_api.main import app
+    from admin_api.models.documents import Admin, Applicant
+    from admin_api.utils.security import get_password_hash
+
+    client = AsyncIOMotorClient(args.mongo_uri)
+    if args.reset:
+        await client.drop_database(args.database)
+    seeded = None
+    if args.reset or await client[args.database]["applicants"].estimated_document_count() == 0:
+        seeded = await seed_database(client[args.database], args.applicants, args.users, args.jobs, args.reports, args.seed)
+    await init_db()
+
+    if not await Admin.find_one(Admin.email == BENCHMARK_ADMIN_EMAIL):
+        await Admin(full_name="Benchmark Admin", email=BENCHMARK_ADMIN_EMAIL, password=get_password_hash(BENCHMARK_ADMIN_PASSWORD)).insert()
+    pending = await Applicant.find(Applicant.verification_status == "pending").limit(args.requests).to_list()
+    pending_ids = [str(applicant.id) for applicant in pending]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as http:
+        login = {"email": BENCHMARK_ADMIN_EMAIL, "password": BENCHMARK_ADMIN_PASSWORD}
+        token = (await http.post("/admin/login", json=login)).json()["access_token"]
+        auth = {"Authorization": f"Bearer {token}"}
+
+        scenarios = [
+            await run_scenario("get_all_reports", lambda i: http.get("/admin/api/reports/all", headers=auth), args.requests, args.concurrency),
+            await run_scenario("get_monthly_applications", lambda i: http.get("/admin/get_monthly_applications"), args.requests, args.concurrency),
+            await run_scenario("get_monthly_users", lambda i: http.get("/admin/get_monthly_users"), args.requests, args.concurrency),
+            await run_scenario(
+                "update_verification_status",
+                lambda i: http.put(f"/admin/update_verification_status/{pending_ids[i]}", params={"status": "verified"}),
+                len(pending_ids), args.concurrency
+            ),
+            await run_scenario("login", lambda i: http.post("/admin/login", json=login), args.login_requests, args.concurrency),
+            await websocket_fanout(args.ws_clients, args.ws_notifications),
+        ]
+
+    results = {
+        "revision": _git_revision(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "database": args.database,
+        "seeded": seeded,
+        "dashboard_cache": not args.no_cache,
+        "concurrency": args.concurrency,
+        "scenarios": scenarios,
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_seed_arguments(parser)
+    parser.add_argument("--requests", type=int, default=500, help="requests per HTTP scenario")
+    parser.add_argument("--login-requests", type=int, default=50, help="logins (bcrypt makes each one expensive)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--ws-clients", type=int, default=100, help="simulated notification WebSockets")
+    parser.add_argument("--ws-notifications", type=int, default=200)
+    parser.add_argument("--no-cache", action="store_true", help="disable the dashboard cache to measure the aggregations")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,91 @@
+"""
+Shows what concurrent logins do to the latency of every other endpoint on the same worker.
+
+Two handlers check the same bcrypt hash: one calls verify_password inline (the old login),
+the other awaits verify_password_async (the thread pool). While a burst of logins runs
+against each, a steady stream of cheap requests measures p50/p99 latency.
+
+Run from `packages/backend`:
+
+    python -m benchmarks.login_contention --logins 40 --pings 200
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from admin_api.utils.security import get_password_hash, verify_password, verify_password_async, PASSWORD_HASH_WORKERS
+
+PASSWORD = "benchmark-password"
+
+
+def build_app(hashed: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login-inline")
+    async def login_inline():
+        return {"ok": verify_password(PASSWORD, hashed)}
+
+    @app.post("/login-offloaded")
+    async def login_offloaded():
+        return {"ok": await verify_password_async(PASSWORD, hashed)}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def measure(client: httpx.AsyncClient, login_path: str, logins: int, pings: int, ping_interval: float):
+    latencies = []
+
+    async def ping_loop():
+        for _ in range(pings):
+            started = time.perf_counter()
+            await client.get("/ping")
+            latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(ping_interval)
+
+    started = time.perf_counter()
+    await asyncio.gather(ping_loop(), *(client.post(login_path) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    return {
+        "login_path": login_path,
+        "logins": logins,
+        "elapsed_s": round(elapsed, 3),
+        "ping_p50_ms": round(statistics.median(latencies), 2),
+        "ping_p99_ms": round(percentile(latencies, 99), 2),
+        "ping_max_ms": round(max(latencies), 2),
+    }
+
+
+async def main(logins: int, pings: int, ping_interval: float):
+    app = build_app(get_password_hash(PASSWORD))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        results = {
+            "password_hash_workers": PASSWORD_HASH_WORKERS,
+            "inline": await measure(client, "/login-inline", logins, pings, ping_interval),
+            "offloaded": await measure(client, "/login-offloaded", logins, pings, ping_interval),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=40, help="concurrent login requests per mode")
+    parser.add_argument("--pings", type=int, default=200, help="latency probes per mode")
+    parser.add_argument("--ping-interval", type=float, default=0.01, help="seconds between probes")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.pings, args.ping_interval))
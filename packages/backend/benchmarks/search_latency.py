@@ -0,0 +1,106 @@
+"""
+Measures admin search latency against a large synthetic applicants collection.
+
+Seeds `--docs` applicants (with searchTokens) into a throwaway database, lets Beanie build
+the declared text and prefix indexes, then times admin_api.services.search_service.search
+for type-ahead prefixes and multi-word text queries and reports p50/p99 against the budget.
+
+Needs a running MongoDB (MONGO_URI). Run from `packages/backend`:
+
+    python -m benchmarks.search_latency --docs 1000000 --queries 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from admin_api.models.documents import Applicant, User, Job
+from admin_api.services.search_service import SEARCH_SPECS, build_search_tokens, search
+
+FIRST_NAMES = ["Juan", "Maria", "José", "Ana", "Pedro", "Luz", "Ramon", "Carmela", "Andres", "Rosario", "Miguel", "Teresa", "Paolo", "Liza", "Noel"]
+LAST_NAMES = ["Dela Cruz", "Santos", "Reyes", "Bautista", "Garcia", "Mendoza", "Ramos", "Aquino", "Villanueva", "Castillo", "Navarro", "Peñaflor"]
+BARANGAYS = ["San Roque", "Poblacion", "Santa Cruz", "San Isidro", "Bagong Silang", "Malanday", "Concepcion", "Tumana"]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def fake_applicant(i: int) -> dict:
+    first, last = random.choice(FIRST_NAMES), random.choice(LAST_NAMES)
+    doc = {
+        "firstName": first,
+        "lastName": last,
+        "emailAddress": f"{first.lower()}.{last.lower().replace(' ', '')}{i}@example.com",
+        "gender": random.choice(["Male", "Female"]),
+        "birthday": datetime(1990, 1, 1),
+        "age": random.randint(18, 65),
+        "password": "x",
+        "barangay": random.choice(BARANGAYS),
+        "street": f"{i % 500} Rizal St.",
+        "userType": random.choice(["client", "job-seeker"]),
+        "joinedAt": datetime(2024, 1, 1) + timedelta(minutes=i),
+        "verificationStatus": random.choice(["pending", "verified", "rejected"]),
+    }
+    doc["searchTokens"] = build_search_tokens(doc, SEARCH_SPECS["applicants"].token_fields)
+    return doc
+
+
+async def seed(collection, docs: int, batch: int = 10000):
+    existing = await collection.estimated_document_count()
+    for start in range(existing, docs, batch):
+        await collection.insert_many([fake_applicant(i) for i in range(start, min(start + batch, docs))], ordered=False)
+    return max(existing, docs)
+
+
+async def time_queries(queries, mode: str):
+    latencies = []
+    for q in queries:
+        started = time.perf_counter()
+        await search("applicants", q, mode, limit=20, offset=0)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return {
+        "mode": mode,
+        "queries": len(latencies),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+async def main(docs: int, queries: int, budget_ms: float, database: str):
+    client = AsyncIOMotorClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    db = client[database]
+    await init_beanie(database=db, document_models=[Applicant, User, Job])
+    total = await seed(Applicant.get_motor_collection(), docs)
+
+    prefixes = [random.choice(FIRST_NAMES + LAST_NAMES)[:random.randint(2, 4)] for _ in range(queries)]
+    phrases = [f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}" for _ in range(queries)]
+    await time_queries(prefixes[:10], "prefix")  # warm the cache
+    results = {
+        "documents": total,
+        "budget_ms": budget_ms,
+        "prefix": await time_queries(prefixes, "prefix"),
+        "text": await time_queries(phrases, "text"),
+    }
+    results["within_budget"] = all(results[mode]["p50_ms"] < budget_ms for mode in ("prefix", "text"))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=1_000_000, help="applicants to seed (kept between runs)")
+    parser.add_argument("--queries", type=int, default=200, help="queries timed per mode")
+    parser.add_argument("--budget-ms", type=float, default=50, help="latency budget per query")
+    parser.add_argument("--database", default="admin_search_benchmark", help="throwaway database to seed")
+    args = parser.parse_args()
+    asyncio.run(main(args.docs, args.queries, args.budget_ms, args.database))
@@ -0,0 +1,143 @@
+"""
+Seeds a throwaway MongoDB database with synthetic applicants, users, jobs and reports for
+the load benchmarks. Documents are written with raw insert_many in batches, so 1M rows take
+minutes rather than hours. Generation is seeded, so runs are reproducible.
+
+Run from `packages/backend` against a local `mongod`:
+
+    python -m benchmarks.seed --database admin_benchmark --applicants 100000 --users 50000 --jobs 50000 --reports 20000 --reset
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorClient
+
+FIRST_NAMES = ["Juan", "Maria", "José", "Ana", "Pedro", "Luz", "Ramon", "Carmela", "Andres", "Rosario", "Miguel", "Teresa"]
+LAST_NAMES = ["Dela Cruz", "Santos", "Reyes", "Bautista", "Garcia", "Mendoza", "Ramos", "Aquino", "Villanueva", "Castillo"]
+BARANGAYS = ["San Roque", "Poblacion", "Santa Cruz", "San Isidro", "Bagong Silang", "Malanday", "Concepcion", "Tumana"]
+CATEGORIES = ["Plumbing", "Electrical", "Cleaning", "Carpentry", "Gardening", "Tutoring", "Delivery", "Painting"]
+JOB_STATUSES = ["open", "pending", "completed", "reviewed"]
+REPORT_REASONS = ["Spam", "Harassment", "Fake profile", "Inappropriate content", "Scam"]
+
+BATCH_SIZE = 10000
+
+
+def _person(rng: random.Random, i: int, now: datetime) -> Dict[str, Any]:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "firstName": first,
+        "lastName": last,
+        "gender": rng.choice(["Male", "Female"]),
+        "birthday": datetime(1970, 1, 1) + timedelta(days=rng.randint(0, 15000)),
+        "age": rng.randint(18, 65),
+        "emailAddress": f"{first.lower()}.{last.lower().replace(' ', '')}.{i}@example.com",
+        "password": "$2b$12$benchmarkbenchmarkbenchmarkbenchmarkbenchmarkbenchm",
+        "barangay": rng.choice(BARANGAYS),
+        "street": f"{i % 500} Rizal St.",
+        "userType": rng.choice(["client", "job-seeker"]),
+        "jobsDone": 0,
+        "joinedAt": now - timedelta(minutes=rng.randint(0, 60 * 24 * 400)),
+    }
+
+
+def make_applicant(rng: random.Random, i: int, now: datetime) -> Dict[str, Any]:
+    doc = _person(rng, i, now)
+    doc["verificationStatus"] = rng.choices(["pending", "verified", "rejected"], weights=[5, 3, 2])[0]
+    return doc
+
+
+def make_user(rng: random.Random, i: int, now: datetime, user_id: ObjectId) -> Dict[str, Any]:
+    doc = _person(rng, i, now)
+    doc.update({"_id": user_id, "achievements": [], "verificationStatus": "verified", "verifiedAt": doc["joinedAt"]})
+    return doc
+
+
+def make_job(rng: random.Random, i: int, now: datetime, user_ids: List[ObjectId]) -> Dict[str, Any]:
+    category = rng.choice(CATEGORIES)
+    status = rng.choice(JOB_STATUSES)
+    posted = now - timedelta(minutes=rng.randint(0, 60 * 24 * 400))
+    doc = {
+        "clientId": rng.choice(user_ids),
+        "applicantCount": rng.randint(0, 20),
+        "jobTitle": f"{category} job #{i}",
+        "jobDescription": f"Looking for help with {category.lower()} in {rng.choice(BARANGAYS)}.",
+        "category": category,
+        "jobLocation": rng.choice(BARANGAYS),
+        "jobStatus": status,
+        "budget": str(rng.randint(300, 10000)),
+        "jobDuration": f"{rng.randint(1, 14)} days",
+        "jobImage": [],
+        "datePosted": posted,
+    }
+    # Past "open", a job seeker has accepted it; completed and reviewed jobs also have a finish time and rating
+    if status != "open":
+        accepted = min(now, posted + timedelta(minutes=rng.randint(10, 60 * 24 * 7)))
+        doc.update({"jobSeekerId": rng.choice(user_ids), "acceptedAt": accepted})
+        if status in ("completed", "reviewed"):
+            doc["completedAt"] = min(now, accepted + timedelta(minutes=rng.randint(60, 60 * 24 * 14)))
+        if status == "reviewed":
+            doc["jobRating"] = rng.randint(1, 5)
+    return doc
+
+
+def make_report(rng: random.Random, i: int, now: datetime, user_ids: List[ObjectId]) -> Dict[str, Any]:
+    return {
+        "reportedObjectId": rng.choice(user_ids),
+        "reporter": rng.choice(user_ids),
+        "reason": rng.choice(REPORT_REASONS),
+        "status": rng.choices(["pending", "approved", "rejected"], weights=[6, 2, 2])[0],
+        "dateReported": now - timedelta(minutes=rng.randint(0, 60 * 24 * 400)),
+    }
+
+
+async def _insert(db: AsyncIOMotorDatabase, collection: str, count: int, factory: Callable[[int], Dict[str, Any]]) -> int:
+    for start in range(0, count, BATCH_SIZE):
+        await db[collection].insert_many([factory(i) for i in range(start, min(start + BATCH_SIZE, count))], ordered=False)
+    return count
+
+
+async def seed_database(db: AsyncIOMotorDatabase, applicants: int, users: int, jobs: int, reports: int, seed: int = 42) -> Dict[str, int]:
+    """Inserts the requested number of documents into the collections the admin API reads."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    # Ids are generated up front so jobs and reports can reference users without reading them back
+    user_ids = [ObjectId() for _ in range(users)]
+    await _insert(db, "users", users, lambda i: make_user(rng, i, now, user_ids[i]))
+    user_ids = user_ids or [ObjectId()]
+    return {
+        "applicants": await _insert(db, "applicants", applicants, lambda i: make_applicant(rng, i, now)),
+        "users": users,
+        "jobs": await _insert(db, "jobrequest", jobs, lambda i: make_job(rng, i, now, user_ids)),
+        "reports": await _insert(db, "report_validation", reports, lambda i: make_report(rng, i, now, user_ids)),
+    }
+
+
+async def main(args):
+    client = AsyncIOMotorClient(args.mongo_uri)
+    if args.reset:
+        await client.drop_database(args.database)
+    counts = await seed_database(client[args.database], args.applicants, args.users, args.jobs, args.reports, args.seed)
+    print(json.dumps({"database": args.database, "seeded": counts}, indent=2))
+
+
+def add_seed_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--mongo-uri", default=os.getenv("BENCHMARK_MONGO_URI", "mongodb://localhost:27017"))
+    parser.add_argument("--database", default="admin_benchmark", help="throwaway database to seed")
+    parser.add_argument("--applicants", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=10000)
+    parser.add_argument("--reports", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42, help="random seed for reproducible data")
+    parser.add_argument("--reset", action="store_true", help="drop the database first")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_seed_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,55 @@
+import os
+
+# The app reads its configuration at import time
+os.environ.setdefault("MAIL_USERNAME", "test")
+os.environ.setdefault("MAIL_PASSWORD", "test")
+os.environ.setdefault("MAIL_FROM", "noreply@example.com")
+os.environ.setdefault("MAIL_SERVER", "localhost")
+os.environ.setdefault("MONGO_DB_NAME", "admin_test")
+
+from datetime import datetime
+
+import pytest
+from beanie import init_beanie
+from mongomock_motor import AsyncMongoMockClient
+
+from admin_api import database
+from admin_api.models.documents import Applicant, User, ReportValidation
+
+
+@pytest.fixture
+async def db():
+    """A fresh in-memory database with every model initialised; behaves like a standalone server."""
+    client = AsyncMongoMockClient()
+    await init_beanie(database=client["admin_test"], document_models=database.DOCUMENT_MODELS)
+    database.client = client
+    database._is_replica_set = False
+    yield client["admin_test"]
+    database.client = None
+    database._is_replica_set = None
+
+
+def make_applicant(i: int, **overrides) -> Applicant:
+    fields = dict(
+        first_name=f"First{i}", last_name=f"Last{i}", gender="Female", birth_date=datetime(1990, 1, 1), age=34,
+        email=f"applicant{i}@example.com", password="hash", barangay="Poblacion", street="Rizal St.",
+        user_type="client", joined_at=datetime(2024, 1, 1), verification_status="pending",
+    )
+    fields.update(overrides)
+    return Applicant(**fields)
+
+
+def make_user(i: int, **overrides) -> User:
+    fields = dict(
+        first_name=f"User{i}", last_name=f"Last{i}", gender="Male", birth_date=datetime(1990, 1, 1), age=34,
+        email=f"user{i}@example.com", password="hash", barangay="Poblacion", street="Rizal St.",
+        user_type="client", joined_at=datetime(2024, 1, 1), verification_status="verified",
+    )
+    fields.update(overrides)
+    return User(**fields)
+
+
+def make_report(reporter: User, reported: User, **overrides) -> ReportValidation:
+    fields = dict(reported_object_id=reported.id, reporter=reporter.id, reason="Spam", date_reported=datetime(2024, 1, 1))
+    fields.update(overrides)
+    return ReportValidation(**fields)
@@ -0,0 +1,98 @@
+import asyncio
+
+from admin_api.models.documents import Applicant, User, JobSeeker, Achievement, ApplicantJobSeeker
+from admin_api.services.approval_service import approve_applicants, approve_applicant, set_applicants_status
+from tests.conftest import make_applicant, make_user
+
+
+async def test_approve_applicants_creates_users_achievements_and_job_seekers(db):
+    client = make_applicant(1)
+    seeker = make_applicant(2, user_type="job-seeker")
+    for applicant in (client, seeker):
+        await applicant.insert()
+    await ApplicantJobSeeker.get_motor_collection().insert_one({"applicantId": str(seeker.id), "hourlyRate": "150", "jobTags": ["plumbing"]})
+
+    results = await approve_applicants([client, seeker])
+
+    assert all(result["user_created"] for result in results.values())
+    assert results[seeker.id]["job_seeker_created"] and results[seeker.id]["job_seeker_details_found"]
+    assert await User.count() == 2
+    assert await Achievement.count() == 2
+    profile = await JobSeeker.find_one(JobSeeker.user_id == results[seeker.id]["user"].id)
+    assert profile.hourly_rate == "150" and profile.job_tags == ["plumbing"]
+    assert {a.verification_status for a in await Applicant.find_all().to_list()} == {"verified"}
+
+
+async def test_approve_applicants_reuses_existing_and_duplicate_email_users(db):
+    existing = make_user(1, email="shared@example.com", verification_status="pending")
+    await existing.insert()
+    first = make_applicant(1, email="shared@example.com", user_type="job-seeker")
+    second = make_applicant(2, email="new@example.com")
+    third = make_applicant(3, email="new@example.com")
+    for applicant in (first, second, third):
+        await applicant.insert()
+
+    results = await approve_applicants([first, second, third])
+
+    assert results[first.id]["user"].id == existing.id and not results[first.id]["user_created"]
+    assert results[second.id]["user_created"] and not results[third.id]["user_created"]
+    assert results[second.id]["user"].id == results[third.id]["user"].id
+    assert await User.count() == 2
+    assert (await User.get(existing.id)).verification_status == "verified"
+    assert await JobSeeker.count() == 1
+
+
+async def test_approve_applicant_does_not_duplicate_an_existing_job_seeker_profile(db):
+    user = make_user(1, email="seeker@example.com", user_type="job-seeker")
+    await user.insert()
+    await JobSeeker(user_id=user.id).insert()
+    applicant = make_applicant(1, email="seeker@example.com", user_type="job-seeker")
+    await applicant.insert()
+
+    result = await approve_applicant(applicant)
+
+    assert not result["job_seeker_created"]
+    assert await JobSeeker.count() == 1
+
+
+async def test_concurrent_approvals_create_one_user(db):
+    applicant = make_applicant(1)
+    await applicant.insert()
+    # Two admins loaded the same pending applicant and approve it at the same time
+    copy = await Applicant.get(applicant.id)
+
+    first, second = await asyncio.gather(approve_applicant(applicant), approve_applicant(copy))
+
+    assert (first is None) != (second is None)
+    assert await User.count() == 1
+    assert await Achievement.count() == 1
+
+
+async def test_approval_after_a_concurrent_one_is_skipped(db):
+    applicant = make_applicant(1)
+    await applicant.insert()
+    stale = await Applicant.get(applicant.id)
+    await approve_applicant(applicant)
+
+    assert await approve_applicants([stale]) == {}
+    assert await User.count() == 1
+
+
+async def test_concurrent_rejections_each_win_only_their_applicants(db):
+    applicants = [make_applicant(i) for i in range(3)]
+    for applicant in applicants:
+        await applicant.insert()
+    ids = [applicant.id for applicant in applicants]
+
+    (first_decision, first), (second_decision, second) = await asyncio.gather(
+        set_applicants_status(ids, "rejected"),
+        set_applicants_status(ids[1:], "rejected")
+    )
+
+    assert first | second == set(ids)
+    assert not first & second
+    for applicant_id in ids:
+        stored = await Applicant.get(applicant_id)
+        assert stored.verification_status == "rejected"
+        assert stored.decision_id == (first_decision if applicant_id in first else second_decision)
+    assert (await set_applicants_status(ids, "rejected"))[1] == set()
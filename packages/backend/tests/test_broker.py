@@ -0,0 +1,270 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+from bson import ObjectId
+
+from admin_api.services import broker as broker_module
+from admin_api.services.broker import InMemoryBroker, MongoCappedBroker, NotificationBroker, _SubscribingBroker, configured_worker_count, create_broker
+from admin_api.services import notification_service
+from admin_api.services.notification_service import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, name: str):
+        self.client = name
+        self.frames: List[bytes] = []
+
+    async def accept(self):
+        pass
+
+    async def send_bytes(self, message: bytes):
+        self.frames.append(message)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        pass
+
+
+class InProcessBus:
+    """Stands in for the Redis channel / capped collection shared by every worker."""
+
+    def __init__(self):
+        self.subscribers: List[asyncio.Queue] = []
+
+    def publish(self, message: bytes):
+        for queue in self.subscribers:
+            queue.put_nowait(message)
+
+
+class BusBroker(_SubscribingBroker):
+    def __init__(self, deliver, bus: InProcessBus):
+        super().__init__(deliver)
+        self.bus = bus
+        self.inbox: asyncio.Queue = asyncio.Queue()
+
+    async def _setup(self):
+        self.bus.subscribers.append(self.inbox)
+
+    async def publish(self, message: bytes):
+        self.bus.publish(message)
+
+    async def _subscribe(self):
+        while True:
+            await self.deliver(await self.inbox.get())
+
+
+class TailableCollection:
+    """A capped collection as a tailable cursor sees it: frames in insertion order, whatever their ObjectIds."""
+
+    def __init__(self):
+        self.docs: List[dict] = []
+        self.cursors: List["TailableCursor"] = []
+
+    def append(self, oid: str, message: bytes):
+        self.docs.append({"_id": ObjectId(oid), "message": message})
+
+    async def find_one(self, sort):
+        assert sort == [("$natural", -1)]
+        return self.docs[-1] if self.docs else None
+
+    async def count_documents(self, query, limit):
+        return sum(1 for doc in self.docs if doc["_id"] == query["_id"])
+
+    def find(self, query, cursor_type):
+        assert query == {}  # _id order says nothing about insertion order
+        cursor = TailableCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+
+class TailableCursor:
+    def __init__(self, collection: TailableCollection):
+        self.collection = collection
+        self.position = 0
+        self.alive = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.position >= len(self.collection.docs):
+            raise StopAsyncIteration
+        self.position += 1
+        return self.collection.docs[self.position - 1]
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_frames_published_on_one_worker_reach_the_sockets_of_every_worker():
+    bus = InProcessBus()
+    workers = []
+    for worker in range(3):
+        manager = ConnectionManager()
+        worker_broker = BusBroker(manager.broadcast, bus)
+        await worker_broker.start()
+        sockets = [FakeWebSocket(f"worker{worker}-admin{i}") for i in range(2)]
+        for socket in sockets:
+            await manager.connect(socket)
+        workers.append((manager, worker_broker, sockets))
+
+    try:
+        # Only the leader worker publishes; everyone else learns about the event through the bus
+        await workers[0][1].publish(b'{"type": "new_report_filed"}')
+        await workers[0][1].publish(b'{"type": "report_approved"}')
+        await _settle()
+
+        for _, _, sockets in workers:
+            for socket in sockets:
+                assert socket.frames == [b'{"type": "new_report_filed"}', b'{"type": "report_approved"}']
+    finally:
+        for manager, worker_broker, sockets in workers:
+            await worker_broker.stop()
+            for socket in sockets:
+                manager.disconnect(socket)
+
+    assert all(worker_broker._subscriber_task.cancelled() for _, worker_broker, _ in workers)
+
+
+async def test_in_memory_broker_delivers_to_its_own_process():
+    manager = ConnectionManager()
+    socket = FakeWebSocket("admin")
+    await manager.connect(socket)
+    memory_broker = create_broker(manager.broadcast, "memory", workers=1)
+
+    await memory_broker.publish(b'{"type": "verification_approved"}')
+    await _settle()
+
+    assert isinstance(memory_broker, InMemoryBroker)
+    assert socket.frames == [b'{"type": "verification_approved"}']
+    manager.disconnect(socket)
+
+
+def test_brokers_must_implement_publish_and_subscribe():
+    async def deliver(message):
+        pass
+
+    with pytest.raises(TypeError):
+        NotificationBroker(deliver)
+
+    class NoSubscriber(_SubscribingBroker):
+        async def publish(self, message: bytes):
+            pass
+
+    with pytest.raises(TypeError):
+        NoSubscriber(deliver)
+
+
+def test_memory_broker_refuses_to_start_with_several_workers(monkeypatch):
+    async def deliver(message):
+        pass
+
+    with pytest.raises(RuntimeError, match="memory"):
+        create_broker(deliver, "memory", workers=4)
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert configured_worker_count() == 3
+    with pytest.raises(RuntimeError, match="3 workers"):
+        create_broker(deliver, "memory")
+
+    monkeypatch.delenv("WEB_CONCURRENCY")
+    monkeypatch.setattr(broker_module.sys, "argv", ["uvicorn", "admin_api.main:app", "--workers", "2"])
+    assert configured_worker_count() == 2
+    monkeypatch.setattr(broker_module.sys, "argv", ["uvicorn", "admin_api.main:app", "--workers=5"])
+    assert configured_worker_count() == 5
+
+    with pytest.raises(RuntimeError, match="Unknown NOTIFICATION_BROKER"):
+        create_broker(deliver, "rabbit")
+
+
+async def test_every_socket_is_sent_the_same_encoded_frame(monkeypatch):
+    manager = ConnectionManager()
+    monkeypatch.setattr(notification_service, "broker", create_broker(manager.broadcast, "memory", workers=1))
+    sockets = [FakeWebSocket(f"admin{i}") for i in range(3)]
+    for socket in sockets:
+        await manager.connect(socket)
+
+    await notification_service.broadcast_notification("new_report_filed", "Ünïcode report", {"count": 1})
+    await _settle()
+
+    frame = sockets[0].frames[0]
+    assert isinstance(frame, bytes)
+    assert all(socket.frames[0] is frame for socket in sockets)
+    assert json.loads(frame) == {"type": "new_report_filed", "message": "Ünïcode report", "details": {"count": 1}}
+    for socket in sockets:
+        manager.disconnect(socket)
+
+
+async def test_overflowing_frames_are_coalesced_into_one_valid_batch():
+    manager = ConnectionManager(max_queue=2, overflow_policy="coalesce")
+    socket = FakeWebSocket("slow-admin")
+    await manager.connect(socket)
+    connection = manager.active_connections[socket]
+    connection.writer_task.cancel()
+
+    for i in range(3):
+        await manager.broadcast(json.dumps({"type": "new_report_filed", "n": i}).encode())
+
+    batch = json.loads(connection.queue.get_nowait())
+    assert batch["type"] == "notification_batch"
+    assert [item["n"] for item in batch["details"]["items"]] == [0, 1, 2]
+    manager.disconnect(socket)
+
+
+async def test_slow_clients_are_closed_by_a_tracked_task():
+    closed = asyncio.Event()
+
+    class SlowWebSocket(FakeWebSocket):
+        async def close(self, code: int = 1000, reason: str = ""):
+            self.close_code = code
+            closed.set()
+
+    manager = ConnectionManager(max_queue=1, overflow_policy="disconnect")
+    socket = SlowWebSocket("slow-admin")
+    await manager.connect(socket)
+    manager.active_connections[socket].writer_task.cancel()
+
+    await manager.broadcast(b'{"n": 1}')
+    await manager.broadcast(b'{"n": 2}')
+
+    assert socket not in manager.active_connections
+    assert len(manager._close_tasks) == 1
+    await asyncio.wait_for(closed.wait(), 1)
+    await _settle()
+    assert socket.close_code == notification_service.SLOW_CLIENT_CLOSE_CODE
+    assert manager._close_tasks == set()
+    assert manager.disconnected_slow_clients == 1
+
+
+async def test_capped_broker_resumes_by_insertion_order_not_object_id():
+    delivered: List[bytes] = []
+
+    async def deliver(message):
+        delivered.append(message)
+
+    collection = TailableCollection()
+    # Frames from other processes: their ObjectIds sort in any order
+    collection.append("ffffffffffffffffffffff01", b"before start")
+    mongo_broker = MongoCappedBroker(deliver)
+    mongo_broker.collection = collection
+    mongo_broker._subscriber_task = asyncio.create_task(mongo_broker._subscribe())
+    try:
+        await _settle()
+        collection.append("000000000000000000000002", b"first")
+        await asyncio.sleep(0.1)
+        assert delivered == [b"first"]
+
+        # The cursor dies; a frame with a smaller ObjectId is published before it is reopened
+        collection.cursors[-1].alive = False
+        collection.append("000000000000000000000001", b"second")
+        for _ in range(40):
+            if len(delivered) == 2:
+                break
+            await asyncio.sleep(0.05)
+        assert delivered == [b"first", b"second"]
+        assert len(collection.cursors) == 2
+    finally:
+        await mongo_broker.stop()
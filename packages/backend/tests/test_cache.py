@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+from starlette.requests import Request
+
+from admin_api.utils import cache as cache_module
+from admin_api.utils.cache import TTLCache, conditional_response
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def _request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_entries_expire_and_the_least_recently_used_is_evicted(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    clock.now += 10
+    assert cache.get("a") is None
+
+
+def test_invalidate_drops_keys_by_prefix():
+    cache = TTLCache(maxsize=10, ttl=60)
+    for key in ("users:total", "users:monthly", "stats:daily:2024-01-01", "reports:summary"):
+        cache.set(key, key)
+
+    cache.invalidate("users:", "stats:")
+
+    assert cache.get("users:total") is None and cache.get("stats:daily:2024-01-01") is None
+    assert cache.get("reports:summary") == "reports:summary"
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = TTLCache(maxsize=10, ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    values = await asyncio.gather(*(cache.get_or_set("key", loader) for _ in range(5)))
+
+    assert values == ["value"] * 5
+    assert calls == 1
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 4
+    assert cache._locks == {}
+
+
+async def test_a_failing_loader_releases_its_lock():
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    async def failing():
+        raise RuntimeError("database unavailable")
+
+    async def loader():
+        return "value"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_set("key", failing)
+
+    assert cache._locks == {}
+    assert await cache.get_or_set("key", loader) == "value"
+
+
+async def test_a_load_started_before_an_invalidation_is_not_cached():
+    cache = TTLCache(maxsize=10, ttl=60)
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return "read before the write"
+
+    load = asyncio.create_task(cache.get_or_set("users:total", slow_loader))
+    await started.wait()
+    # A write path invalidates while the load is in flight
+    cache.invalidate("users:")
+    release.set()
+
+    assert await load == "read before the write"
+    assert cache.get("users:total") is None
+
+    async def fresh_loader():
+        return "read after the write"
+
+    assert await cache.get_or_set("users:total", fresh_loader) == "read after the write"
+    assert cache.get("users:total") == "read after the write"
+
+
+def test_conditional_response_sets_an_etag_and_answers_304_when_it_matches():
+    response = conditional_response(_request(), {"total_users": 3}, max_age=30)
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    assert response.body == b'{"total_users":3}'
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "private, max-age=30"
+
+    not_modified = conditional_response(_request(f'W/"other", {etag}'), {"total_users": 3}, max_age=30)
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["etag"] == etag
+
+    changed = conditional_response(_request(etag), {"total_users": 4}, max_age=30)
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
@@ -0,0 +1,133 @@
+import asyncio
+import socket
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from admin_api.models.documents import EmailOutbox
+from admin_api.services import email_outbox
+from admin_api.services.email_outbox import enqueue_email, enqueue_emails, run_email_worker
+
+
+class RecordingHandler:
+    """aiosmtpd handler that keeps every accepted message and rejects the first `fail_first` deliveries."""
+
+    def __init__(self, fail_first: int = 0):
+        self.fail_first = fail_first
+        self.messages = []
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            return "451 Try again later"
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    servers = []
+
+    def start(handler):
+        port = _free_port()
+        controller = Controller(handler, hostname="127.0.0.1", port=port)
+        controller.start()
+        servers.append(controller)
+        for name, value in {"MAIL_SERVER": "127.0.0.1", "MAIL_PORT": port, "MAIL_STARTTLS": False,
+                            "MAIL_SSL_TLS": False, "USE_CREDENTIALS": False}.items():
+            monkeypatch.setattr(email_outbox.conf, name, value)
+        return handler
+
+    monkeypatch.setattr(email_outbox, "EMAIL_POLL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(email_outbox, "EMAIL_RETRY_BASE_SECONDS", 0)
+    monkeypatch.setattr(email_outbox, "metrics", email_outbox.OutboxMetrics())
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+async def _run_worker_until(condition, timeout: float = 5):
+    worker = asyncio.create_task(run_email_worker())
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not await condition():
+            assert asyncio.get_running_loop().time() < deadline, "email worker did not finish in time"
+            await asyncio.sleep(0.02)
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+
+async def _all_finished():
+    return await EmailOutbox.find({"status": {"$in": ["pending", "sending"]}}).count() == 0
+
+
+async def test_worker_delivers_queued_messages_over_smtp(db, smtp_server):
+    handler = smtp_server(RecordingHandler())
+    await enqueue_emails([
+        (f"Subject {i}", [f"person{i}@example.com"], f"<p>Body {i}</p>", f"test:{i}") for i in range(3)
+    ])
+
+    await _run_worker_until(_all_finished)
+
+    assert sorted(envelope.rcpt_tos[0] for envelope in handler.messages) == [f"person{i}@example.com" for i in range(3)]
+    stored = await EmailOutbox.find_all().to_list()
+    assert {message.status for message in stored} == {"sent"}
+    assert all(message.sent_at and message.expire_at and message.attempts == 1 for message in stored)
+    assert email_outbox.metrics.sent == 3
+    # One SMTP session carries the whole batch
+    assert email_outbox.metrics.smtp_connections == 1
+
+
+async def test_worker_retries_a_rejected_delivery(db, smtp_server):
+    handler = smtp_server(RecordingHandler(fail_first=1))
+    await enqueue_email("Retry me", ["person@example.com"], "<p>Body</p>", idempotency_key="test:retry")
+
+    await _run_worker_until(_all_finished)
+
+    message = await EmailOutbox.find_one(EmailOutbox.idempotency_key == "test:retry")
+    assert message.status == "sent" and message.attempts == 2
+    assert "451" in message.last_error
+    assert len(handler.messages) == 1
+    assert email_outbox.metrics.retried == 1
+
+
+async def test_worker_gives_up_after_max_attempts(db, smtp_server, monkeypatch):
+    monkeypatch.setattr(email_outbox, "EMAIL_MAX_ATTEMPTS", 3)
+    handler = smtp_server(RecordingHandler(fail_first=10))
+    await enqueue_email("Never delivered", ["person@example.com"], "<p>Body</p>", idempotency_key="test:fail")
+
+    await _run_worker_until(_all_finished)
+
+    message = await EmailOutbox.find_one(EmailOutbox.idempotency_key == "test:fail")
+    assert message.status == "failed" and message.attempts == 3
+    assert message.expire_at is not None
+    assert handler.messages == []
+    assert email_outbox.metrics.failed == 1
+
+
+async def test_enqueue_skips_messages_whose_key_is_already_queued(db):
+    assert await enqueue_email("Hello", ["a@example.com"], "<p>1</p>", idempotency_key="verification:1:rejected:d1")
+    assert not await enqueue_email("Hello", ["a@example.com"], "<p>1</p>", idempotency_key="verification:1:rejected:d1")
+    # A later decision on the same applicant has its own key and is queued
+    assert await enqueue_email("Hello", ["a@example.com"], "<p>1</p>", idempotency_key="verification:1:rejected:d2")
+
+    queued = await enqueue_emails([
+        ("Hello", ["a@example.com"], "<p>1</p>", "verification:1:rejected:d2"),
+        ("Hello", ["b@example.com"], "<p>2</p>", "verification:2:rejected:d2"),
+    ])
+
+    assert queued == 1
+    assert await EmailOutbox.count() == 3
+
+
+async def test_messages_without_a_key_are_deduplicated_by_content(db):
+    assert await enqueue_email("Same", ["a@example.com"], "<p>body</p>")
+    assert not await enqueue_email("Same", ["a@example.com"], "<p>body</p>")
+    assert await EmailOutbox.count() == 1
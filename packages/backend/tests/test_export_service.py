@@ -0,0 +1,40 @@
+import csv
+import gzip
+import io
+import json
+
+from admin_api.services.export_service import get_export_spec, select_fields, stream_export
+from tests.conftest import make_user, make_report
+
+
+async def _export(collection: str, export_format: str, fields: str, **kwargs) -> bytes:
+    spec = get_export_spec(collection)
+    chunks = [chunk async for chunk in stream_export(spec, {}, select_fields(spec, fields), export_format, **kwargs)]
+    return b"".join(chunks)
+
+
+async def test_csv_cells_that_start_a_formula_are_quoted(db):
+    reporter, reported = make_user(1), make_user(2)
+    await reporter.insert()
+    await reported.insert()
+    reasons = ['=HYPERLINK("http://evil.example","click")', "+1+2", "-2+3", "@SUM(A1)", "\tTab", "Plain reason"]
+    for reason in reasons:
+        await make_report(reporter, reported, reason=reason).insert()
+
+    rows = list(csv.reader(io.StringIO((await _export("reports", "csv", "reason")).decode())))
+
+    assert rows[0] == ["reason"]
+    assert [row[0] for row in rows[1:]] == [
+        '\'=HYPERLINK("http://evil.example","click")', "'+1+2", "'-2+3", "'@SUM(A1)", "'\tTab", "Plain reason",
+    ]
+
+
+async def test_ndjson_values_are_exported_unchanged_and_gzip_round_trips(db):
+    reporter, reported = make_user(1), make_user(2)
+    await reporter.insert()
+    await reported.insert()
+    await make_report(reporter, reported, reason="=1+1").insert()
+
+    body = gzip.decompress(await _export("reports", "ndjson", "reason,status", gzip=True, batch_size=1))
+
+    assert [json.loads(line) for line in body.splitlines()] == [{"reason": "=1+1", "status": "pending"}]
@@ -0,0 +1,40 @@
+from admin_api.services.index_service import _declared_index_keys, _hot_queries, is_index_backed
+
+
+def _equality_fields(query_filter):
+    clauses = query_filter["$and"] if "$and" in query_filter else [query_filter]
+    return [field for clause in clauses for field, value in clause.items() if not field.startswith("$") and not isinstance(value, dict)]
+
+
+def test_every_sorted_hot_query_has_an_index_serving_its_filter_and_sort():
+    for query in _hot_queries():
+        if not query["sort"]:
+            continue
+        wanted = [(field, None) for field in _equality_fields(query["filter"])] + query["sort"]
+        reversed_sort = [(field, None) for field, _ in wanted if _ is None] + [(field, -direction) for field, direction in query["sort"]]
+
+        def serves(key):
+            prefix = key[:len(wanted)]
+            if len(prefix) < len(wanted):
+                return False
+            return any(
+                all(field == want_field and (direction is None or index_direction == direction)
+                    for (field, index_direction), (want_field, direction) in zip(prefix, candidate))
+                for candidate in (wanted, reversed_sort)
+            )
+
+        assert any(serves(key) for key in _declared_index_keys(query["model"])), query["name"]
+
+
+def test_keyset_hot_queries_carry_the_id_tie_break():
+    queries = {query["name"]: query for query in _hot_queries()}
+    for name in ("poll_new_applicants", "poll_new_reports", "get_all_applicants", "get_pending_reports", "get_all_reports", "get_all_job_requests"):
+        assert queries[name]["sort"][-1][0] == "_id", name
+        assert "$or" in str(queries[name]["filter"]), name
+
+
+def test_a_blocking_sort_is_not_index_backed():
+    assert is_index_backed(["LIMIT", "FETCH", "IXSCAN"])
+    assert is_index_backed(["LIMIT", "FETCH", "SORT_MERGE", "IXSCAN", "IXSCAN"])
+    assert not is_index_backed(["SORT", "FETCH", "IXSCAN"])
+    assert not is_index_backed(["LIMIT", "COLLSCAN"])
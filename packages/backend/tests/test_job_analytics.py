@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from beanie import PydanticObjectId
+
+from admin_api.models.documents import Job
+from admin_api.services import job_analytics_service
+from admin_api.services.job_analytics_service import _duration_match, _duration_stats_sorted, get_job_counts
+
+
+def make_job(i: int, **overrides) -> Job:
+    fields = dict(
+        client_id=PydanticObjectId(), job_title=f"Job {i}", job_description="Fix the roof", category="Repair",
+        job_location="Poblacion", job_status="completed", budget="500", job_duration="1 day", date_posted=datetime.utcnow(),
+    )
+    fields.update(overrides)
+    return Job(**fields)
+
+
+async def test_job_counts_default_to_a_date_posted_window(db):
+    now = datetime.utcnow()
+    await make_job(1, date_posted=now - timedelta(days=3)).insert()
+    await make_job(2, date_posted=now - timedelta(days=30), category="Cleaning").insert()
+    await make_job(3, date_posted=now - timedelta(days=job_analytics_service.JOB_ANALYTICS_DEFAULT_DAYS + 5)).insert()
+
+    counts = await get_job_counts()
+    assert counts.total == 2
+    assert {(c.key, c.count) for c in counts.by_category} == {("Repair", 1), ("Cleaning", 1)}
+
+    counts = await get_job_counts(start=now - timedelta(days=10))
+    assert counts.total == 1
+
+
+async def test_sorted_percentiles_read_every_rank_from_one_sorted_pass(db, monkeypatch):
+    posted = datetime.utcnow() - timedelta(days=1)
+    # Acceptance after 1..100 hours, inserted out of order
+    for i, hours in enumerate(sorted(range(1, 101), key=lambda h: (h * 37) % 101)):
+        await make_job(i, date_posted=posted, accepted_at=posted + timedelta(hours=hours)).insert()
+    pipelines = []
+    aggregate = Job.aggregate
+
+    def recording_aggregate(pipeline, *args, **kwargs):
+        pipelines.append(pipeline)
+        return aggregate(pipeline, *args, **kwargs)
+
+    monkeypatch.setattr(Job, "aggregate", recording_aggregate)
+
+    stats = await _duration_stats_sorted("acceptedAt", _duration_match("acceptedAt", None, None))
+
+    assert stats.count == 100
+    assert round(stats.avg_hours, 6) == 50.5
+    assert (round(stats.p50_hours), round(stats.p90_hours), round(stats.p99_hours)) == (51, 90, 99)
+    # The summary pass and a single sorted pass
+    assert len(pipelines) == 2
+    assert sum(1 for stage in pipelines[1] if "$sort" in stage) == 1
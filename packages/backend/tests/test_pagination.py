@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pymongo
+import pytest
+from beanie import PydanticObjectId
+from fastapi import HTTPException
+
+from admin_api.models.documents import Applicant, ApplicantListView
+from admin_api.utils.pagination import (
+    NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, keyset_filter, page_response, paginate, parse_sort,
+)
+from tests.conftest import make_applicant
+
+APPLICANT_SORTS = {"_id": "id", "joinedAt": "joined_at", "lastName": "last_name"}
+
+
+@pytest.mark.parametrize("value", [datetime(2024, 5, 1, 12, 30, 15, 123000), PydanticObjectId(), "Dela Cruz", 42, None])
+def test_cursor_round_trips_each_value_type(value):
+    doc_id = PydanticObjectId()
+    assert decode_cursor(encode_cursor(value, doc_id)) == (value, doc_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "e30=", "eyJ2IjogMSwgInQiOiAicmF3IiwgImlkIjogIngifQ=="])
+def test_invalid_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+def test_parse_sort_reads_direction_and_rejects_unknown_fields():
+    assert parse_sort("-joinedAt", APPLICANT_SORTS) == ("joinedAt", pymongo.DESCENDING)
+    assert parse_sort("lastName", APPLICANT_SORTS) == ("lastName", pymongo.ASCENDING)
+    with pytest.raises(HTTPException) as error:
+        parse_sort("-password", APPLICANT_SORTS)
+    assert error.value.status_code == 400
+
+
+def test_keyset_filter_breaks_ties_on_id():
+    last_id = PydanticObjectId()
+    joined = datetime(2024, 1, 1)
+    cursor = encode_cursor(joined, last_id)
+
+    assert keyset_filter("joinedAt", pymongo.DESCENDING, None) == {}
+    assert keyset_filter("joinedAt", pymongo.DESCENDING, cursor) == {
+        "$or": [{"joinedAt": {"$lt": joined}}, {"joinedAt": joined, "_id": {"$lt": last_id}}]
+    }
+    assert keyset_filter("joinedAt", pymongo.ASCENDING, cursor)["$or"][0] == {"joinedAt": {"$gt": joined}}
+    assert keyset_filter("_id", pymongo.ASCENDING, cursor) == {"_id": {"$gt": last_id}}
+
+
+@pytest.mark.parametrize("sort", ["-joinedAt", "joinedAt", "_id", "-lastName"])
+async def test_paginate_visits_every_document_once_across_ties(db, sort):
+    # Ten applicants share each joinedAt, so pages end in the middle of a tie
+    for i in range(25):
+        await make_applicant(i, joined_at=datetime(2024, 1, 1 + i // 10), last_name=f"Last{i % 3}").insert()
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        items, cursor = await paginate(Applicant, {}, APPLICANT_SORTS, sort, cursor, 7, ApplicantListView)
+        seen += items
+        pages += 1
+        if cursor is None:
+            break
+
+    assert pages == 4
+    assert len({item.id for item in seen}) == 25
+    assert all(isinstance(item, ApplicantListView) for item in seen)
+    field = APPLICANT_SORTS[sort.lstrip("-")]
+    keys = [(getattr(item, field), item.id) for item in seen]
+    assert keys == sorted(keys, reverse=sort.startswith("-"))
+
+
+async def test_paginate_applies_filters_and_ends_without_a_cursor(db):
+    for i in range(3):
+        await make_applicant(i, verification_status="verified" if i else "pending").insert()
+
+    items, cursor = await paginate(Applicant, {"verificationStatus": "verified"}, APPLICANT_SORTS, "_id", None, 5)
+
+    assert len(items) == 2 and cursor is None
+
+
+def test_page_response_sets_the_cursor_header_only_when_there_is_a_next_page():
+    assert page_response([], None).headers.get(NEXT_CURSOR_HEADER) is None
+    response = page_response([{"a": 1}], "abc")
+    assert response.headers[NEXT_CURSOR_HEADER] == "abc"
+    assert response.body == b'[{"a":1}]'
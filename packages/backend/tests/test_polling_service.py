@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from admin_api.utils import polling_service
+from admin_api.utils.polling_service import poll_new_applicants, poll_new_reports
+from tests.conftest import make_applicant, make_report, make_user
+
+JOINED_AT = datetime(2024, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def high_water_marks(monkeypatch):
+    monkeypatch.setattr(polling_service, "schedule_refresh_today", lambda *metric_names: None)
+    start = (JOINED_AT - timedelta(minutes=1)).replace(tzinfo=timezone.utc)
+    monkeypatch.setattr(polling_service, "last_applicant_timestamp", start)
+    monkeypatch.setattr(polling_service, "last_applicant_id", None)
+    monkeypatch.setattr(polling_service, "last_report_timestamp", start)
+    monkeypatch.setattr(polling_service, "last_report_id", None)
+
+
+async def test_applicants_sharing_the_cut_off_timestamp_are_each_notified_once(db):
+    applicants = [make_applicant(i, joined_at=JOINED_AT) for i in range(5)]
+    for applicant in applicants:
+        await applicant.insert()
+
+    notified = []
+    for _ in range(4):
+        notified += [n["details"]["applicantId"] for n in await poll_new_applicants(max_docs=2)]
+
+    assert sorted(notified) == sorted(str(applicant.id) for applicant in applicants)
+    assert polling_service.last_applicant_id == max(applicant.id for applicant in applicants)
+
+    # A later applicant with the same timestamp but a newer id is still picked up
+    late = make_applicant(9, joined_at=JOINED_AT)
+    await late.insert()
+    assert [n["details"]["applicantId"] for n in await poll_new_applicants(max_docs=2)] == [str(late.id)]
+
+
+async def test_reports_sharing_the_cut_off_timestamp_are_each_notified_once(db):
+    reporter, reported = make_user(1), make_user(2)
+    await reporter.insert()
+    await reported.insert()
+    reports = [make_report(reporter, reported, date_reported=JOINED_AT) for _ in range(3)]
+    for report in reports:
+        await report.insert()
+
+    notified = []
+    for _ in range(3):
+        notified += [n["details"]["reportId"] for n in await poll_new_reports(max_docs=2)]
+
+    assert sorted(notified) == sorted(str(report.id) for report in reports)
+    assert await poll_new_reports(max_docs=2) == []
@@ -0,0 +1,88 @@
+import pytest
+from fastapi import HTTPException
+
+from admin_api.utils import rate_limit
+from admin_api.utils.rate_limit import SlidingWindowLimiter, check_login_allowed, record_login_failure, record_login_success
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def login_limiters(monkeypatch):
+    monkeypatch.setattr(rate_limit, "login_ip_limiter", SlidingWindowLimiter(4, 60))
+    monkeypatch.setattr(rate_limit, "login_email_limiter", SlidingWindowLimiter(2, 60))
+
+
+def test_events_slide_out_of_the_window_one_at_a_time(clock):
+    limiter = SlidingWindowLimiter(max_events=3, window_seconds=60)
+    for offset in (0, 10, 20):
+        clock.now = 1000 + offset
+        assert limiter.retry_after("key") == 0
+        limiter.hit("key")
+
+    clock.now = 1030
+    assert limiter.retry_after("key") == pytest.approx(30)
+    # The first event leaves the window at 1060 and frees exactly one slot
+    clock.now = 1060
+    assert limiter.retry_after("key") == 0
+    limiter.hit("key")
+    assert limiter.retry_after("key") == pytest.approx(10)
+
+
+def test_keys_are_counted_separately_and_reset(clock):
+    limiter = SlidingWindowLimiter(max_events=1, window_seconds=60)
+    limiter.hit("a")
+
+    assert limiter.retry_after("a") > 0
+    assert limiter.retry_after("b") == 0
+    limiter.reset("a")
+    assert limiter.retry_after("a") == 0
+
+
+def test_the_least_recently_used_key_is_forgotten_beyond_max_keys(clock):
+    limiter = SlidingWindowLimiter(max_events=1, window_seconds=60, max_keys=2)
+    limiter.hit("a")
+    limiter.hit("b")
+    limiter.retry_after("a")  # touching "a" makes "b" the oldest
+    limiter.hit("c")
+
+    assert set(limiter._events) == {"a", "c"}
+    assert limiter.retry_after("a") > 0
+    assert limiter.retry_after("b") == 0
+
+
+def test_login_is_refused_per_address_with_retry_after(clock, login_limiters):
+    for i in range(4):
+        check_login_allowed(f"admin{i}@example.com", "10.0.0.1")
+
+    with pytest.raises(HTTPException) as refused:
+        check_login_allowed("admin9@example.com", "10.0.0.1")
+
+    assert refused.value.status_code == 429
+    assert refused.value.headers["Retry-After"] == "61"
+    check_login_allowed("admin9@example.com", "10.0.0.2")
+
+
+def test_only_failed_logins_count_against_an_email(clock, login_limiters):
+    for _ in range(2):
+        check_login_allowed("Admin@Example.com", "10.0.0.1")
+        record_login_failure("Admin@Example.com")
+
+    with pytest.raises(HTTPException):
+        check_login_allowed("admin@example.com", "10.0.0.2")
+
+    record_login_success("ADMIN@example.com")
+    check_login_allowed("admin@example.com", "10.0.0.2")
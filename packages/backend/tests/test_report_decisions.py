@@ -0,0 +1,77 @@
+import asyncio
+
+from beanie import PydanticObjectId
+
+from admin_api.models.documents import ReportValidation, FinalReport
+from admin_api.services import report_service
+from admin_api.services.report_service import decide_reports
+from tests.conftest import make_user, make_report
+
+
+async def _seed_reports(count):
+    reporter, reported = make_user(1), make_user(2)
+    await reporter.insert()
+    await reported.insert()
+    reports = [make_report(reporter, reported) for _ in range(count)]
+    for report in reports:
+        await report.insert()
+    return reports
+
+
+async def test_decide_reports_approves_pending_and_copies_final_reports(db):
+    reports = await _seed_reports(3)
+    decided, failures = await decide_reports([report.id for report in reports], "approved")
+
+    assert [report.id for report in decided] == [report.id for report in reports]
+    assert failures == {}
+    assert await FinalReport.count() == 3
+    stored = await ReportValidation.find_all().to_list()
+    assert {report.status for report in stored} == {"approved"}
+    assert all(report.date_approved is not None for report in stored)
+
+
+async def test_decide_reports_reports_missing_and_already_processed(db):
+    reports = await _seed_reports(2)
+    await ReportValidation.get_motor_collection().update_one({"_id": reports[1].id}, {"$set": {"status": "rejected"}})
+    missing_id = PydanticObjectId()
+
+    decided, failures = await decide_reports([reports[0].id, reports[1].id, missing_id], "approved")
+
+    assert [report.id for report in decided] == [reports[0].id]
+    assert "already processed" in failures[reports[1].id]
+    assert "not found" in failures[missing_id]
+
+
+async def test_decide_reports_skips_a_report_decided_after_it_was_read(db, monkeypatch):
+    reports = await _seed_reports(3)
+    raced = reports[1]
+    original_find = ReportValidation.find
+
+    class RacingQuery:
+        def __init__(self, query):
+            self.query = query
+
+        async def to_list(self):
+            found = await self.query.to_list()
+            # Another admin rejects one report between the read and the guarded update
+            await ReportValidation.get_motor_collection().update_one({"_id": raced.id}, {"$set": {"status": "rejected"}})
+            return found
+
+    monkeypatch.setattr(report_service.ReportValidation, "find", lambda *args, **kwargs: RacingQuery(original_find(*args, **kwargs)))
+
+    decided, failures = await decide_reports([report.id for report in reports], "approved")
+
+    assert [report.id for report in decided] == [reports[0].id, reports[2].id]
+    assert failures == {raced.id: f"Report {raced.id} already processed"}
+    assert await FinalReport.count() == 2
+    assert (await ReportValidation.get(raced.id)).status == "rejected"
+
+
+async def test_concurrent_decisions_process_each_report_once(db):
+    reports = await _seed_reports(5)
+    ids = [report.id for report in reports]
+
+    (first, _), (second, _) = await asyncio.gather(decide_reports(ids, "approved"), decide_reports(ids, "rejected"))
+
+    assert sorted(report.id for report in first + second) == sorted(ids)
+    assert await FinalReport.count() == len(first)
@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from admin_api.models.documents import StatsDaily
+from admin_api.services import rollup_service
+from admin_api.services.rollup_service import backfill, day_start, get_monthly_rollup, schedule_refresh_today
+from admin_api.services.stats_service import monthly_window
+from admin_api.utils.cache import dashboard_cache
+from tests.conftest import make_applicant, make_report, make_user
+
+
+@pytest.fixture(autouse=True)
+def immediate_refresh(monkeypatch):
+    monkeypatch.setattr(rollup_service, "STATS_REFRESH_DELAY_SECONDS", 0)
+    dashboard_cache.invalidate()
+    yield
+    dashboard_cache.invalidate()
+
+
+async def _wait_for_scheduled_refresh():
+    if rollup_service._refresh_task is not None:
+        await rollup_service._refresh_task
+
+
+async def _day(day: datetime):
+    return await StatsDaily.get_motor_collection().find_one({"day": day_start(day)})
+
+
+async def test_backfill_upserts_days_in_place(db):
+    today = datetime.utcnow()
+    await make_applicant(1, joined_at=today - timedelta(days=2)).insert()
+    await make_applicant(2, joined_at=today).insert()
+
+    assert await backfill() == 3
+    first_ids = {doc["day"]: doc["_id"] async for doc in StatsDaily.get_motor_collection().find()}
+    await make_applicant(3, joined_at=today).insert()
+    assert await backfill() == 3
+
+    days = {doc["day"]: doc async for doc in StatsDaily.get_motor_collection().find()}
+    # The same documents were rewritten rather than deleted and inserted again
+    assert {day: doc["_id"] for day, doc in days.items()} == first_ids
+    assert days[day_start(today)]["applicantsJoined"]["total"] == 2
+    assert days[day_start(today - timedelta(days=1))]["applicantsJoined"]["total"] == 0
+
+
+async def test_scheduled_refreshes_are_coalesced_and_run_off_the_caller(db, monkeypatch):
+    today = datetime.utcnow()
+    await make_applicant(1, joined_at=today - timedelta(days=1)).insert()
+    await backfill()
+    calls = []
+    refresh_days = rollup_service.refresh_days
+
+    async def counting_refresh_days(days, metric_names=None):
+        calls.append(sorted(metric_names))
+        return await refresh_days(days, metric_names)
+
+    monkeypatch.setattr(rollup_service, "refresh_days", counting_refresh_days)
+    reporter, reported = make_user(1), make_user(2)
+    await reporter.insert()
+    await reported.insert()
+    await make_report(reporter, reported, date_reported=today).insert()
+    await make_applicant(2, joined_at=today).insert()
+    dashboard_cache.set("stats:daily:cached", ["stale"])
+
+    schedule_refresh_today("reportsFiled")
+    schedule_refresh_today("applicantsJoined")
+    # Nothing has run yet: the caller returns before the aggregation
+    assert calls == []
+    await _wait_for_scheduled_refresh()
+
+    assert calls == [["applicantsJoined", "reportsFiled"]]
+    doc = await _day(today)
+    assert doc["reportsFiled"]["total"] == 1
+    assert doc["applicantsJoined"]["total"] == 1
+    assert dashboard_cache.get("stats:daily:cached") is None
+
+
+async def test_scheduled_refresh_waits_for_the_first_backfill(db):
+    await make_applicant(1, joined_at=datetime.utcnow()).insert()
+
+    schedule_refresh_today("applicantsJoined")
+    await _wait_for_scheduled_refresh()
+
+    assert await StatsDaily.count() == 0
+
+
+async def test_monthly_rollup_and_window_use_utc_months(db):
+    now = datetime.utcnow()
+    start, end = monthly_window()
+    assert start <= now < end and end.day == 1 and start.day == 1
+    await make_applicant(1, joined_at=now).insert()
+    await backfill()
+
+    monthly = await get_monthly_rollup("applicantsJoined", start, end)
+
+    assert monthly[now.month - 1] == 1 and sum(monthly) == 1
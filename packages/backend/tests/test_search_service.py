@@ -0,0 +1,57 @@
+from admin_api.models.documents import Applicant
+from admin_api.services.search_service import SEARCH_SPECS, backfill_search_tokens, search
+from tests.conftest import make_applicant
+
+
+async def test_tokens_follow_every_whole_document_write(db):
+    applicant = make_applicant(1, first_name="José", last_name="Rizal", email="jose.rizal@example.com")
+    await applicant.insert()
+    assert {"jose", "rizal", "jose.rizal@example.com", "example.com"} <= set(applicant.search_tokens)
+
+    applicant.last_name = "Mabini"
+    await applicant.save()
+
+    stored = await Applicant.get_motor_collection().find_one({"_id": applicant.id})
+    assert "mabini" in stored["searchTokens"] and "rizal" not in stored["searchTokens"]
+
+
+async def test_reconcile_rewrites_tokens_of_documents_edited_outside_the_api(db):
+    edited, untouched = make_applicant(1, last_name="Rizal"), make_applicant(2, last_name="Bonifacio")
+    await edited.insert()
+    await untouched.insert()
+    collection = Applicant.get_motor_collection()
+    # The app renames the applicant and leaves searchTokens as they were
+    await collection.update_one({"_id": edited.id}, {"$set": {"lastName": "Mabini"}})
+
+    assert await backfill_search_tokens(SEARCH_SPECS["applicants"]) == 0
+    assert await backfill_search_tokens(SEARCH_SPECS["applicants"], only_missing=False) == 1
+
+    items, _ = await search("applicants", "mabi", "prefix", limit=10, offset=0)
+    assert [str(item["_id"]) for item in items] == [str(edited.id)]
+    assert (await search("applicants", "rizal", "prefix", limit=10, offset=0))[0] == []
+
+
+async def test_backfill_fills_documents_inserted_without_tokens(db):
+    applicant = make_applicant(1, first_name="Andres")
+    # As the app writes it: no searchTokens field at all
+    await Applicant.get_motor_collection().insert_one(applicant.dict(by_alias=True, exclude={"id", "search_tokens"}))
+
+    assert await backfill_search_tokens(SEARCH_SPECS["applicants"]) == 1
+
+    items, _ = await search("applicants", "andr", "prefix", limit=10, offset=0)
+    assert len(items) == 1
+
+
+async def test_prefix_pages_cover_every_match_once(db):
+    applicants = [make_applicant(i, last_name=f"Santos{i}") for i in range(7)]
+    for applicant in reversed(applicants):
+        await applicant.insert()
+
+    seen, offset = [], 0
+    while offset is not None:
+        items, offset = await search("applicants", "santos", "prefix", limit=3, offset=offset)
+        seen += [str(item["_id"]) for item in items]
+
+    assert len(seen) == 7
+    assert sorted(seen) == sorted(str(applicant.id) for applicant in applicants)
+    assert seen == sorted(seen)
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+import pytest
+
+from admin_api.services import stats_service
+from admin_api.services.stats_service import get_dashboard_summary, monthly_window
+from admin_api.utils.cache import dashboard_cache
+from tests.conftest import make_applicant, make_report, make_user
+
+
+@pytest.fixture(autouse=True)
+def empty_dashboard_cache():
+    dashboard_cache.invalidate()
+    yield
+    dashboard_cache.invalidate()
+
+
+async def test_dashboard_summary_counts_totals_and_the_monthly_window(db, monkeypatch):
+    now = datetime(2024, 6, 15)
+    monkeypatch.setattr(stats_service, "monthly_window", lambda: monthly_window(now))
+    # Two applicants inside the window (June and January), one a year before it
+    for i, (joined_at, status) in enumerate([(datetime(2024, 6, 1), "pending"), (datetime(2024, 1, 10), "verified"),
+                                             (datetime(2023, 5, 31), "pending")]):
+        await make_applicant(i, joined_at=joined_at, verification_status=status).insert()
+    users = [make_user(i, verified_at=verified_at) for i, verified_at in enumerate([datetime(2024, 2, 3), datetime(2024, 2, 20)])]
+    for user in users:
+        await user.insert()
+    await make_report(users[0], users[1]).insert()
+    await make_report(users[1], users[0], status="approved").insert()
+
+    summary = await get_dashboard_summary()
+
+    assert summary["total_applicants"] == 3
+    assert summary["pending_applicants"] == 2
+    assert summary["monthly_applications"] == [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0]
+    assert summary["total_users"] == 2
+    assert summary["monthly_users"] == [0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    assert summary["pending_reports"] == 1
+    assert summary["total_jobs"] == 0
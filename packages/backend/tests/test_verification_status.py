@@ -0,0 +1,31 @@
+import asyncio
+
+from admin_api.models.documents import Applicant, EmailOutbox
+from admin_api.routers.crud import update_verification_status
+from tests.conftest import make_applicant
+
+
+async def test_concurrent_rejections_send_one_email(db):
+    applicant = make_applicant(1)
+    await applicant.insert()
+
+    responses = await asyncio.gather(
+        update_verification_status(str(applicant.id), "rejected"),
+        update_verification_status(str(applicant.id), "rejected")
+    )
+
+    assert [response["message"] for response in responses].count("Applicant verification rejected") == 1
+    assert await EmailOutbox.count() == 1
+    stored = await Applicant.get(applicant.id)
+    assert stored.verification_status == "rejected"
+    assert stored.decision_id is not None
+
+
+async def test_rejecting_again_sends_no_email(db):
+    applicant = make_applicant(1, verification_status="rejected")
+    await applicant.insert()
+
+    response = await update_verification_status(str(applicant.id), "rejected")
+
+    assert "No notification sent" in response["message"]
+    assert await EmailOutbox.count() == 0
@@ -0,0 +1,40 @@
+import { Loader2 } from "lucide-react";
+import { Button } from "./ui/button";
+
+interface LoadMoreFooterProps {
+  sentinelRef: (node: Element | null) => void;
+  hasMore: boolean;
+  isLoadingMore: boolean;
+  loadMoreError: unknown;
+  onRetry: () => void;
+}
+
+/**
+ * Sits under a paginated grid: loads the next page when scrolled into view and
+ * offers a retry when that fails.
+ */
+export const LoadMoreFooter = ({
+  sentinelRef,
+  hasMore,
+  isLoadingMore,
+  loadMoreError,
+  onRetry,
+}: LoadMoreFooterProps) => {
+  if (!hasMore) return null;
+  return (
+    <div ref={sentinelRef} className="flex justify-center py-4 text-sm text-gray-500">
+      {loadMoreError ? (
+        <div className="flex items-center gap-3">
+          <span className="text-red-500">Failed to load more rows.</span>
+          <Button variant="outline" size="sm" onClick={onRetry}>
+            Retry
+          </Button>
+        </div>
+      ) : isLoadingMore ? (
+        <span className="flex items-center gap-2">
+          <Loader2 className="h-4 w-4 animate-spin" /> Loading more...
+        </span>
+      ) : null}
+    </div>
+  );
+};
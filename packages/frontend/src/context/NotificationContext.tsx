@@ -48,6 +48,8 @@ const NOTIFICATIONS_STORAGE_KEY = 'trabahanap_admin_notifications';
 // Consider a limit for stored notifications to avoid localStorage quota issues
 const MAX_STORED_NOTIFICATIONS = 100; 
 
+const frameDecoder = new TextDecoder();
+
 const getWebSocketURL = () => {
   const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
   const host = import.meta.env.MODE === 'development' 
@@ -102,6 +104,8 @@ export const NotificationProvider: React.FC<NotificationProviderProps> = ({ chil
     : null;
 
   const { lastMessage, readyState } = useWebSocket(socketUrlWithToken, {
+    // Notifications arrive as binary frames of UTF-8 JSON; read them as ArrayBuffers rather than Blobs
+    onOpen: (event) => { (event.target as WebSocket).binaryType = 'arraybuffer'; },
     shouldReconnect: (closeEvent) => true, 
     reconnectAttempts: 10,
     reconnectInterval: (attemptNumber) => Math.min(Math.pow(2, attemptNumber) * 1000, 30000),
@@ -110,7 +114,8 @@ export const NotificationProvider: React.FC<NotificationProviderProps> = ({ chil
   useEffect(() => {
     if (lastMessage !== null && isAuthenticated) { // Only process if authenticated
       try {
-        const rawNotification = JSON.parse(lastMessage.data as string) as RawNotificationMessage;
+        const frame = typeof lastMessage.data === 'string' ? lastMessage.data : frameDecoder.decode(lastMessage.data as ArrayBuffer);
+        const rawNotification = JSON.parse(frame) as RawNotificationMessage;
         
         if (import.meta.env.MODE === 'development') {
             console.log('Received raw notification:', rawNotification);
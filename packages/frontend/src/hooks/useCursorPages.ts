@@ -0,0 +1,83 @@
+import { useCallback, useEffect, useRef, useState } from "react";
+import { Page } from "../services/pagination";
+
+/**
+ * Loads a cursor-paginated list one page at a time: the first page on mount, the next one
+ * whenever the element given to `sentinelRef` scrolls into view (or `loadMore` is called).
+ */
+export const useCursorPages = <T>(
+  loadPage: (cursor?: string) => Promise<Page<T>>
+) => {
+  const [items, setItems] = useState<T[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | undefined>();
+  const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [error, setError] = useState<unknown>(null);
+  const [loadMoreError, setLoadMoreError] = useState<unknown>(null);
+  const [sentinel, setSentinel] = useState<Element | null>(null);
+  // Callers usually pass an inline function; the latest one is used without refetching
+  const loadPageRef = useRef(loadPage);
+  loadPageRef.current = loadPage;
+
+  useEffect(() => {
+    let cancelled = false;
+    const loadFirstPage = async () => {
+      setIsLoading(true);
+      try {
+        const page = await loadPageRef.current();
+        if (cancelled) return;
+        setItems(page.items);
+        setNextCursor(page.nextCursor);
+        setError(null);
+      } catch (err) {
+        if (!cancelled) setError(err);
+      } finally {
+        if (!cancelled) setIsLoading(false);
+      }
+    };
+    loadFirstPage();
+    return () => {
+      cancelled = true;
+    };
+  }, []);
+
+  const loadMore = useCallback(async () => {
+    if (!nextCursor || isLoadingMore) return;
+    setIsLoadingMore(true);
+    setLoadMoreError(null);
+    try {
+      const page = await loadPageRef.current(nextCursor);
+      setItems((prev) => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error("Error loading the next page:", err);
+      setLoadMoreError(err);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  }, [nextCursor, isLoadingMore]);
+
+  useEffect(() => {
+    // After a failed page, wait for an explicit retry instead of looping on the same error
+    if (!sentinel || !nextCursor || isLoadingMore || loadMoreError) return;
+    // A new observer reports whether the sentinel is already visible, so a list that a
+    // client-side filter leaves shorter than the screen keeps loading pages
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) loadMore();
+    });
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [sentinel, nextCursor, isLoadingMore, loadMoreError, loadMore]);
+
+  return {
+    items,
+    setItems,
+    isLoading,
+    isLoadingMore,
+    hasMore: nextCursor !== undefined,
+    error,
+    loadMoreError,
+    loadMore,
+    sentinelRef: setSentinel,
+  };
+};
@@ -1,4 +1,3 @@
-import { useState, useEffect } from 'react';
 import { MainLayout } from '../../components/layout/MainLayout';
 import { motion } from 'framer-motion';
 import {
@@ -11,7 +10,9 @@ import {
 } from '../../components/ui/table';
 import { Eye } from 'lucide-react';
 import { useNavigate } from 'react-router-dom';
-import { Job, JobStatusEnum, getAllJobRequests } from '../../services/job_transaction';
+import { JobStatusEnum, getAllJobRequests } from '../../services/job_transaction';
+import { useCursorPages } from '../../hooks/useCursorPages';
+import { LoadMoreFooter } from '../../components/LoadMoreFooter';
 
 // Helper function to format category strings
 const formatCategory = (category: string) => {
@@ -22,27 +23,18 @@ const formatCategory = (category: string) => {
 
 const JobRequestPage = () => {
   const navigate = useNavigate();
-  const [jobRequests, setJobRequests] = useState<Job[]>([]);
-  const [isLoading, setIsLoading] = useState<boolean>(true);
-  const [error, setError] = useState<string | null>(null);
-
-  useEffect(() => {
-    const fetchJobRequests = async () => {
-      try {
-        setIsLoading(true);
-        const data = await getAllJobRequests();
-        setJobRequests(data);
-        setError(null);
-      } catch (err) {
-        setError('Failed to fetch job requests. Please try again later.');
-        console.error(err);
-      } finally {
-        setIsLoading(false);
-      }
-    };
-
-    fetchJobRequests();
-  }, []);
+  // Job requests are loaded a page at a time, newest first, as the admin scrolls
+  const {
+    items: jobRequests,
+    isLoading,
+    isLoadingMore,
+    hasMore,
+    error: fetchError,
+    loadMoreError,
+    loadMore,
+    sentinelRef,
+  } = useCursorPages(getAllJobRequests);
+  const error = fetchError ? 'Failed to fetch job requests. Please try again later.' : null;
 
   const handleViewDetails = (id: string) => {
     navigate(`/job-request/${id}`);
@@ -134,6 +126,13 @@ const JobRequestPage = () => {
               )}
             </TableBody>
           </Table>
+          <LoadMoreFooter
+            sentinelRef={sentinelRef}
+            hasMore={hasMore}
+            isLoadingMore={isLoadingMore}
+            loadMoreError={loadMoreError}
+            onRetry={loadMore}
+          />
         </motion.div>
       </div>
     </MainLayout>
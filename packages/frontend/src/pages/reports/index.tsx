@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState } from "react";
 import {
   Search,
   CheckCircle,
@@ -39,11 +39,24 @@ import {
   rejectReport,
   Report,
 } from "../../services/reportsApi";
+import { useCursorPages } from "../../hooks/useCursorPages";
+import { LoadMoreFooter } from "../../components/LoadMoreFooter";
 
 const ReportsPage: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState("");
   const [statusFilter, setStatusFilter] = useState("all"); // Default to all
-  const [reports, setReports] = useState<Report[]>([]);
+  // Reports are loaded a page at a time, newest first, as the admin scrolls
+  const {
+    items: reports,
+    setItems: setReports,
+    isLoading: isFetching,
+    isLoadingMore,
+    hasMore,
+    error: fetchError,
+    loadMoreError,
+    loadMore,
+    sentinelRef,
+  } = useCursorPages(getAllReports);
   const [selectedReport, setSelectedReport] = useState<Report | null>(null);
   const [showViewModal, setShowViewModal] = useState(false);
   const [showAcceptModal, setShowAcceptModal] = useState(false);
@@ -51,24 +64,11 @@ const ReportsPage: React.FC = () => {
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
-  useEffect(() => {
-    const fetchReports = async () => {
-      setIsLoading(true);
-      setError(null);
-      try {
-        const allReports = await getAllReports(); // Fetch all reports
-        setReports(allReports);
-      } catch (err) {
-        setError(
-          "Failed to fetch reports. Please ensure the backend is running and reachable."
-        );
-        console.error(err);
-        setReports([]); // Clear reports on error
-      }
-      setIsLoading(false);
-    };
-    fetchReports();
-  }, []); // Empty dependency array: fetch only on mount
+  const displayError =
+    error ??
+    (fetchError
+      ? "Failed to fetch reports. Please ensure the backend is running and reachable."
+      : null);
 
   const getStatusColor = (status: string) => {
     switch (status.toLowerCase()) {
@@ -175,12 +175,12 @@ const ReportsPage: React.FC = () => {
       <div className="container mx-auto px-4 py-8">
         <h1 className="text-3xl font-bold mb-6">User Reports Management</h1>
 
-        {error && (
+        {displayError && (
           <div
             className="mb-4 p-4 text-sm text-red-700 bg-red-100 rounded-lg"
             role="alert"
           >
-            {error}
+            {displayError}
           </div>
         )}
 
@@ -253,7 +253,7 @@ const ReportsPage: React.FC = () => {
         </div>
 
         {/* Loading State */}
-        {isLoading && (
+        {(isLoading || isFetching) && (
           <div className="flex justify-center items-center py-12">
             <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-gray-900"></div>
             <p className="ml-4 text-gray-700">Loading reports...</p>
@@ -261,7 +261,7 @@ const ReportsPage: React.FC = () => {
         )}
 
         {/* No Reports Message (handles empty after load, or error) */}
-        {!isLoading && !error && filteredReports.length === 0 && (
+        {!isLoading && !isFetching && !displayError && filteredReports.length === 0 && (
           <div className="text-center py-12">
             <AlertCircle className="mx-auto h-12 w-12 text-gray-400" />
             <h3 className="mt-2 text-sm font-medium text-gray-900">
@@ -276,7 +276,7 @@ const ReportsPage: React.FC = () => {
         )}
 
         {/* Reports Table - Render only if not loading, no error, and reports exist */}
-        {!isLoading && !error && filteredReports.length > 0 && (
+        {!isLoading && !isFetching && !displayError && filteredReports.length > 0 && (
           <div className="overflow-x-auto shadow-md rounded-lg">
             <Table className="min-w-full divide-y divide-gray-200">
               <TableHeader className="bg-gray-50">
@@ -385,6 +385,16 @@ const ReportsPage: React.FC = () => {
           </div>
         )}
 
+        {!isLoading && !isFetching && !displayError && (
+          <LoadMoreFooter
+            sentinelRef={sentinelRef}
+            hasMore={hasMore}
+            isLoadingMore={isLoadingMore}
+            loadMoreError={loadMoreError}
+            onRetry={loadMore}
+          />
+        )}
+
         {/* Modals */}
         <Dialog open={showViewModal} onOpenChange={setShowViewModal}>
           <DialogContent className="bg-white border-none shadow-xl">
@@ -39,6 +39,8 @@ import {
   getAllApplicants,
   updateVerificationStatus,
 } from "../../services/verification_api";
+import { useCursorPages } from "../../hooks/useCursorPages";
+import { LoadMoreFooter } from "../../components/LoadMoreFooter";
 
 interface User {
   id: string;
@@ -59,6 +61,34 @@ interface User {
 type FilterStatus = "All" | "Pending" | "Verified" | "Rejected";
 type UserTypeFilter = "All" | "Job-seeker" | "Employer";
 
+// Fetches one page of applicants and maps them to the User shape the grid renders
+const loadApplicantsPage = async (cursor?: string) => {
+  const page = await getAllApplicants(cursor);
+  return {
+    ...page,
+    items: page.items.map(
+      (applicant): User => ({
+        id: applicant._id, // Map MongoDB _id to id for component use
+        firstName: applicant.firstName,
+        middleName: applicant.middleName,
+        lastName: applicant.lastName,
+        suffixName: applicant.suffixName,
+        age: applicant.age,
+        gender: applicant.gender,
+        barangay: applicant.barangay,
+        street: applicant.street,
+        houseNumber: applicant.houseNumber,
+        emailAddress: applicant.emailAddress,
+        userType: applicant.userType,
+        verificationStatus: applicant.verificationStatus as
+          | "pending"
+          | "verified"
+          | "rejected",
+      })
+    ),
+  };
+};
+
 const VerificationPage = () => {
   const [activeFilter, setActiveFilter] = useState<FilterStatus>("All");
   const [userTypeFilter, setUserTypeFilter] = useState<UserTypeFilter>("All");
@@ -72,54 +102,28 @@ const VerificationPage = () => {
   const [selectedUsers, setSelectedUsers] = useState<string[]>([]);
   const [confirmBan, setConfirmBan] = useState(false);
   const [isBanMode, setIsBanMode] = useState(false);
-  const [users, setUsers] = useState<User[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
-  const [error, setError] = useState<string | null>(null);
+  // Applicants are loaded a page at a time as the admin scrolls
+  const {
+    items: users,
+    setItems: setUsers,
+    isLoading,
+    isLoadingMore,
+    hasMore,
+    error: loadError,
+    loadMoreError,
+    loadMore,
+    sentinelRef,
+  } = useCursorPages(loadApplicantsPage);
+  const error = loadError
+    ? "Failed to load applicants. Please try again later."
+    : null;
   const navigate = useNavigate();
 
-  // Fetch users from the database
   useEffect(() => {
     const token = localStorage.getItem("authToken");
     if (!token) {
       navigate("/login");
-      return;
     }
-
-    const fetchApplicants = async () => {
-      setIsLoading(true);
-      try {
-        const data = await getAllApplicants();
-        // Transform the data to match our User interface
-        const transformedData = data.map((applicant) => ({
-          id: applicant._id, // Map MongoDB _id to id for component use
-          firstName: applicant.firstName,
-          middleName: applicant.middleName,
-          lastName: applicant.lastName,
-          suffixName: applicant.suffixName,
-          age: applicant.age,
-          gender: applicant.gender,
-          barangay: applicant.barangay,
-          street: applicant.street,
-          houseNumber: applicant.houseNumber,
-          emailAddress: applicant.emailAddress,
-          userType: applicant.userType,
-          verificationStatus: applicant.verificationStatus as
-            | "pending"
-            | "verified"
-            | "rejected",
-        }));
-
-        console.log(transformedData);
-        setUsers(transformedData);
-      } catch (err) {
-        console.error("Error fetching applicants:", err);
-        setError("Failed to load applicants. Please try again later.");
-      } finally {
-        setIsLoading(false);
-      }
-    };
-
-    fetchApplicants();
   }, [navigate]);
 
   const handleAccept = (user: User) => {
@@ -694,6 +698,15 @@ const VerificationPage = () => {
               </p>
             </div>
           )}
+          {!isLoading && !error && (
+            <LoadMoreFooter
+              sentinelRef={sentinelRef}
+              hasMore={hasMore}
+              isLoadingMore={isLoadingMore}
+              loadMoreError={loadMoreError}
+              onRetry={loadMore}
+            />
+          )}
         </div>
       </div>
 
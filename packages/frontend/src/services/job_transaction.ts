@@ -1,4 +1,5 @@
 import axios from "axios";
+import { fetchPage, Page } from "./pagination";
 
 // Define the base URL for your API
 // Vite exposes env variables on import.meta.env
@@ -55,10 +56,9 @@ export interface Job {
   offer?: string;
 }
 
-export const getAllJobRequests = async (): Promise<Job[]> => {
+export const getAllJobRequests = async (cursor?: string): Promise<Page<Job>> => {
   try {
-    const response = await apiClient.get<Job[]>("/api/job_requests/");
-    return response.data;
+    return await fetchPage<Job>(apiClient, "/api/job_requests/", cursor);
   } catch (error) {
     console.error("Error fetching all job requests:", error);
     // Consider more robust error handling or re-throwing for the component to handle
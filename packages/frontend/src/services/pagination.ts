@@ -0,0 +1,30 @@
+import { AxiosInstance } from "axios";
+
+// The list endpoints return one page per request and put the cursor for the next page in this header
+const NEXT_CURSOR_HEADER = "x-next-cursor";
+// Rows per request; the grids load the next page as the admin scrolls
+export const PAGE_LIMIT = 50;
+
+export interface Page<T> {
+  items: T[];
+  nextCursor?: string; // undefined on the last page
+}
+
+/**
+ * Fetches one page of a cursor-paginated list endpoint; pass the previous page's
+ * `nextCursor` to get the page after it.
+ */
+export const fetchPage = async <T>(
+  client: AxiosInstance,
+  url: string,
+  cursor?: string,
+  params: Record<string, string | number> = {}
+): Promise<Page<T>> => {
+  const response = await client.get<T[]>(url, {
+    params: { ...params, limit: PAGE_LIMIT, ...(cursor ? { cursor } : {}) },
+  });
+  return {
+    items: response.data,
+    nextCursor: response.headers[NEXT_CURSOR_HEADER] || undefined,
+  };
+};
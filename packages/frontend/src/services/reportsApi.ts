@@ -1,4 +1,5 @@
 import axiosInstance from "./axiosInstance";
+import { fetchPage, Page } from "./pagination";
 
 // This interface should match the ReportValidation model from the backend
 export interface Report {
@@ -14,13 +15,12 @@ export interface Report {
 }
 
 /**
- * Fetches all pending reports.
+ * Fetches one page of pending reports; pass the previous page's nextCursor for the next one.
  */
-export const getPendingReports = async (): Promise<Report[]> => {
+export const getPendingReports = async (cursor?: string): Promise<Page<Report>> => {
   try {
     // Paths are now relative to the baseURL in axiosInstance (e.g., /api/reports/pending)
-    const response = await axiosInstance.get<Report[]>(`/api/reports/pending`);
-    return response.data;
+    return await fetchPage<Report>(axiosInstance, `/api/reports/pending`, cursor);
   } catch (error) {
     console.error("Error fetching pending reports:", error);
     throw error;
@@ -28,12 +28,11 @@ export const getPendingReports = async (): Promise<Report[]> => {
 };
 
 /**
- * Fetches all reports (pending, approved, rejected).
+ * Fetches one page of all reports (pending, approved, rejected), newest first.
  */
-export const getAllReports = async (): Promise<Report[]> => {
+export const getAllReports = async (cursor?: string): Promise<Page<Report>> => {
   try {
-    const response = await axiosInstance.get<Report[]>(`/api/reports/all`);
-    return response.data;
+    return await fetchPage<Report>(axiosInstance, `/api/reports/all`, cursor);
   } catch (error) {
     console.error("Error fetching all reports:", error);
     throw error;
@@ -1,4 +1,5 @@
 import axios from "axios";
+import { fetchPage, Page } from "./pagination";
 
 interface ApplicantData {
   _id: string;
@@ -28,10 +29,9 @@ interface ApplicantData {
 
 const baseUrl = "http://localhost:8000/admin";
 
-export const getAllApplicants = async (): Promise<ApplicantData[]> => {
+export const getAllApplicants = async (cursor?: string): Promise<Page<ApplicantData>> => {
   try {
-    const response = await axios.get(`${baseUrl}/get_all_applicants`);
-    return response.data;
+    return await fetchPage<ApplicantData>(axios, `${baseUrl}/get_all_applicants`, cursor);
   } catch (error) {
     console.error("Error fetching applicants:", error);
     throw error;